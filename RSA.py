@@ -1,5 +1,9 @@
 import math
-import random
+import os
+
+import arithmetique_modulaire
+import primalite
+from cle_rsa import ClePriveeRSA, ClePubliqueRSA, genere_cle
 
 
 # ========================================
@@ -10,6 +14,9 @@ def est_premier(p):
     """
     est_premier(p)
     Vérifie si p est un nombre premier.
+    On délègue au module primalite (petits premiers,
+    Miller-Rabin puis BPSW) : la division par essai
+    jusqu'à √p devient inutilisable au-delà de ~40 bits.
 
     Paramètres:
     p (int) : le nombre à vérifier
@@ -17,18 +24,16 @@ def est_premier(p):
     Return:
     (bool) : True si premier, False sinon
     """
-    if p < 2:
-        return False
-    for i in range(2, int(math.sqrt(p)) + 1):
-        if p % i == 0:
-            return False
-    return True
+    return primalite.est_premier(p)
 
 
 def trouve_premier(size):
     """
     trouve_premier(size)
     Trouve un nombre premier aléatoire de taille spécifiée.
+    On part d'un point aléatoire et on crible une fenêtre
+    de candidats impairs : seuls les survivants du crible
+    passent le test de primalité complet.
 
     Paramètres:
     size (int) : nombre de bits pour le nombre premier
@@ -36,13 +41,7 @@ def trouve_premier(size):
     Return:
     (int) : un nombre premier
     """
-    while True:
-        # Génère un nombre aléatoire de 'size' bits
-        p = random.getrandbits(size)
-        # S'assure que le nombre est impair
-        p |= 1
-        if est_premier(p):
-            return p
+    return primalite.trouve_premier(size)
 
 
 def lcm(a, b):
@@ -57,8 +56,8 @@ def lcm(a, b):
     Return
     (int)
     """
-    # On veut un entier, donc on utilise la division d'entier
-    return a * b // math.gcd(a, b)
+    # lcm(a, b) = |ab|/gcd(a, b), calculé par le noyau modulaire
+    return arithmetique_modulaire.ppcm(a, b)
 
 
 def trouve_e(lambda_n):
@@ -94,18 +93,25 @@ def trouve_d(e, lambda_n):
     (int)
     (logical) False : si ne trouve pas
     """
-    # Nous allons par essai.
-    # Comme notre échantillon sera petit, ça fonctionne.
-    for d in range(2, lambda_n):
-        if d * e % lambda_n == 1:
-            return d
-    return False
+    # On utilise l'algorithme d'Euclide étendu :
+    # d⋅e + k⋅λ(n) = 1, donc d est l'inverse de e modulo λ(n).
+    # Le coût est logarithmique, quelle que soit la taille de la clé.
+    try:
+        return arithmetique_modulaire.inverse_modulaire(e, lambda_n)
+    except ValueError:
+        return False
 
 
 def facteurs(n):
     """
     facteurs(n)
     Trouve les facteurs de n.
+    Les stratégies (division par essai, Fermat, Pollard p-1,
+    Pollard rho-Brent, ECM, crible quadratique) font la course dans
+    des processus (module course_factorisation) au lieu de parcourir
+    range(2, n) : un n de 64 à 80 bits tombe en quelques secondes.
+    Si tous les budgets sont épuisés, on revient au portefeuille
+    séquentiel de factorisation.
 
     Paramètres:
     n (int) : le nombre que l'on veut trouver les facteurs.
@@ -114,218 +120,338 @@ def facteurs(n):
     p (int) : premier facteur
     q (int) : deuxième facteur
     """
-    for p in range(2, n):
-        if n % p == 0:
-            return p, n // p
+    # Importés ici : les processus de la course et le crible (numpy)
+    # ne coûtent rien à qui n'importe RSA que pour les clés
+    import course_factorisation
+    import factorisation
+
+    resultat = course_factorisation.course(n)
+    if resultat is None:
+        return factorisation.facteurs(n)
+    p, q, _ = resultat
+    return p, q
+
+
+# Magasin des clés d'Alice, à côté de ce script
+MAGASIN_ALICE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cles_alice.bin")
 
 
 # ========================================
 # PARTIE 1 : ALGORITHME RSA
 # ========================================
 
-print("=" * 50)
-print("PARTIE 1 : IMPLÉMENTATION DE L'ALGORITHME RSA")
-print("=" * 50)
-
-# Génération de clé par Alice (secret)
-# NOTE: On utilise une taille de 10 bits pour la démonstration
-# Dans le texte original, il est suggéré 300 bits, mais c'est trop pour une démo
-# Pour un vrai système, on utiliserait au moins 1024 ou 2048 bits
-size = 10  # Changé de 300 à 10 pour la démonstration
+def partie1(size=32):
+    """
+    partie1(size=32)
+    Partie 1 : Alice génère ses clés, Bob lui envoie un message.
 
-print(f"\nGénération de nombres premiers de {size} bits...")
+    Paramètres:
+    size (int) : taille de p et q en bits
 
-# Étape 1 : générer 2 nombres premiers distincts
-p = trouve_premier(size)
-q = trouve_premier(size)
-# S'assurer que p et q sont distincts
-while p == q:
+    Return:
+    (tuple) : (cle_alice, cle_privee_alice, p, q, m, c)
+    """
+    import magasin_cles
+
+    print("=" * 50)
+    print("PARTIE 1 : IMPLÉMENTATION DE L'ALGORITHME RSA")
+    print("=" * 50)
+
+    # Génération de clé par Alice (secret)
+    # NOTE: On utilise une taille de 32 bits pour la démonstration
+    # Dans le texte original, il est suggéré 300 bits : la génération des clés
+    # serait rapide, mais l'attaque de la partie 2 ne finirait jamais.
+    # Avec n de 64 bits, Eve factorise n en quelques secondes.
+    # Pour un vrai système, on utiliserait au moins 1024 ou 2048 bits
+    print(f"\nGénération de nombres premiers de {size} bits...")
+
+    # Étape 1 : générer 2 nombres premiers distincts
+    p = trouve_premier(size)
     q = trouve_premier(size)
-print("Nombres premiers p, q:", p, q)
-
-print("\nAvez-vous deux nombres premiers distincts ?")
-if p != q and est_premier(p) and est_premier(q):
-    print("Réponse : Oui, nous avons deux nombres premiers distincts.")
-else:
-    print("Réponse : Non, il y a un problème.")
-
-# Étape 2 : calculer n = p*q
-n = p * q
-print("\nLe modulo n :", n)
-
-print("\nAvez-vous une valeur pour n ?")
-if n > 0:
-    print(f"Réponse : Oui, n = {n}")
-else:
-    print("Réponse : Non")
-
-# Étape 3 : calculer lambda(n) (lcm(n) = λ(n) = lcm(λ(p), λ(q)),
-# λ(p) = p − 1, λ(q) = q − 1,
-# lcm(a, b) = |ab|/gcd(a, b))
-lambda_n = lcm(p - 1, q - 1)
-print("\nLambda_n :", lambda_n)
-
-# Étape 4 : choisir un entier e tel que 1 < e < λ(n)
-# et gcd(e, λ(n)) = 1.
-e = trouve_e(lambda_n)
-print("\nClé publique (exposant) e :", e)
-
-# Étape 5 : pour trouver d, résoudre pour d l'équation d⋅e ≡ 1 (mod λ(n)).
-d = trouve_d(e, lambda_n)
-print("Clé secrète (exposant) d :", d)
-
-# Afficher les clés
-print("\n--- RÉSUMÉ DES CLÉS ---")
-print(f"Clés publiques d'Alice : (e, n) = ({e}, {n})")
-print(f"Clé secrète d'Alice : d = {d}")
+    # S'assurer que p et q sont distincts
+    while p == q:
+        q = trouve_premier(size)
+    print("Nombres premiers p, q:", p, q)
+
+    print("\nAvez-vous deux nombres premiers distincts ?")
+    if p != q and est_premier(p) and est_premier(q):
+        print("Réponse : Oui, nous avons deux nombres premiers distincts.")
+    else:
+        print("Réponse : Non, il y a un problème.")
+
+    # Étape 2 : calculer n = p*q
+    n = p * q
+    print("\nLe modulo n :", n)
+
+    print("\nAvez-vous une valeur pour n ?")
+    if n > 0:
+        print(f"Réponse : Oui, n = {n}")
+    else:
+        print("Réponse : Non")
+
+    # Étape 3 : calculer lambda(n) (lcm(n) = λ(n) = lcm(λ(p), λ(q)),
+    # λ(p) = p − 1, λ(q) = q − 1,
+    # lcm(a, b) = |ab|/gcd(a, b))
+    lambda_n = lcm(p - 1, q - 1)
+    print("\nLambda_n :", lambda_n)
+
+    # Étape 4 : choisir un entier e tel que 1 < e < λ(n)
+    # et gcd(e, λ(n)) = 1.
+    e = trouve_e(lambda_n)
+    print("\nClé publique (exposant) e :", e)
+
+    # Étape 5 : pour trouver d, résoudre pour d l'équation d⋅e ≡ 1 (mod λ(n)).
+    d = trouve_d(e, lambda_n)
+    print("Clé secrète (exposant) d :", d)
+
+    # Afficher les clés
+    print("\n--- RÉSUMÉ DES CLÉS ---")
+    print(f"Clés publiques d'Alice : (e, n) = ({e}, {n})")
+    print(f"Clé secrète d'Alice : d = {d}")
+
+    cle_alice = ClePubliqueRSA(e, n)
+
+    # Alice connaît p et q : sa clé privée déchiffre par les
+    # restes chinois (dp, dq, qinv), environ 3 à 4 fois plus vite.
+    cle_privee_alice = ClePriveeRSA(d, n, p, q)
+
+    # Alice range ses clés dans son magasin (lu par exo10/SignatureNumerique.py)
+    magasin_cles.ecrit_magasin(MAGASIN_ALICE, [(cle_alice, cle_privee_alice)])
+    print(f"Clés d'Alice enregistrées dans {MAGASIN_ALICE}")
+
+    # Étape 2 : mise en œuvre de l'algorithme RSA
+
+    print("\n" + "=" * 50)
+    print("ÉTAPE 2 : CHIFFREMENT ET DÉCHIFFREMENT")
+    print("=" * 50)
+
+    # Bob veut envoyer un message à Alice.
+    # Le message est simple
+    m = 117
+
+    print(f"\nMessage original de Bob : {m}")
+
+    # Il chiffre le message
+    # On n'élève jamais à la puissance complète avant de réduire :
+    # m ** e % n coûte un temps exponentiel en la taille de la clé.
+    c = cle_alice.chiffre(m)
+    print("Le message chiffré de Bob:", c)
+
+    # Alice déchiffre le message
+    m_dechiffre = cle_privee_alice.dechiffre(c)
+    print("Le message pour Alice :", m_dechiffre)
+
+    print("\nAvons-nous réussi à implémenter RSA ?")
+    if m == m_dechiffre:
+        print("Réponse : Oui, le message déchiffré correspond au message original!")
+    else:
+        print("Réponse : Non, il y a une erreur dans l'implémentation.")
+    return cle_alice, cle_privee_alice, p, q, m, c
+
 
 # ========================================
-# ÉTAPE 2 : MISE EN ŒUVRE DE L'ALGORITHME RSA
+# VARIANTE : RSA MULTI-PREMIERS
 # ========================================
 
-print("\n" + "=" * 50)
-print("ÉTAPE 2 : CHIFFREMENT ET DÉCHIFFREMENT")
-print("=" * 50)
-
-# Bob veut envoyer un message à Alice.
-# Le message est simple
-m = 117
+def variante_multi_premiers(m):
+    """
+    variante_multi_premiers(m)
+    Variante : le même message avec des clés de 2048 bits à 2, 3 et 4 premiers.
 
-print(f"\nMessage original de Bob : {m}")
+    Paramètres:
+    m (int) : le message
 
-# Il chiffre le message
-c = m ** e % n
-print("Le message chiffré de Bob:", c)
+    Return:
+    Aucun
+    """
+    print("\n" + "=" * 50)
+    print("VARIANTE : RSA À PLUSIEURS NOMBRES PREMIERS")
+    print("=" * 50)
 
-# Alice déchiffre le message
-m_dechiffre = c ** d % n
-print("Le message pour Alice :", m_dechiffre)
+    # Le module peut être le produit de k premiers distincts :
+    # λ(n) = lcm(r1 - 1, ..., rk - 1). À taille de n égale, chaque
+    # exponentiation du déchiffrement CRT porte sur un nombre k fois
+    # plus petit, ce qui rend les opérations privées moins coûteuses.
+    for k in (2, 3, 4):
+        publique, privee = genere_cle(2048, k)
+        c_multi = publique.chiffre(m)
+        print(f"n de {publique.n.bit_length()} bits avec {k} premiers de "
+              f"{privee.premiers[0].bit_length()} bits : déchiffré = {privee.dechiffre(c_multi)}")
 
-print("\nAvons-nous réussi à implémenter RSA ?")
-if m == m_dechiffre:
-    print("Réponse : Oui, le message déchiffré correspond au message original!")
-else:
-    print("Réponse : Non, il y a une erreur dans l'implémentation.")
 
 # ========================================
 # PARTIE 2 : ESSAYER DE CASSER L'ALGORITHME RSA
 # ========================================
 
-print("\n" + "=" * 50)
-print("PARTIE 2 : TENTATIVE DE CASSER RSA")
-print("=" * 50)
+def partie2_factorisation(cle_alice, c, m, p, q):
+    """
+    partie2_factorisation(cle_alice, c, m, p, q)
+    Partie 2, étape 1 : Eve factorise n et déchiffre c.
 
-# ========================================
-# ÉTAPE 1 : CASSER LA FACTORISATION DES ENTIERS
-# ========================================
+    Paramètres:
+    cle_alice (ClePubliqueRSA) : la clé publique d'Alice
+    c (int) : le message chiffré de Bob
+    m (int) : le message de Bob, pour vérifier
+    p (int), q (int) : les facteurs d'Alice, pour vérifier
+
+    Return:
+    Aucun
+    """
+    e, n = cle_alice.e, cle_alice.n
 
-print("\n--- Étape 1 : Attaque par factorisation ---")
+    print("\n" + "=" * 50)
+    print("PARTIE 2 : TENTATIVE DE CASSER RSA")
+    print("=" * 50)
 
-# Du côté d'Eve
-print("\nEve peut voir :")
-print(" La clé publique (e, n) :", e, n)
-print(" Le message chiffré de Bob :", c)
+    # Étape 1 : casser la factorisation des entiers
 
-print("\nEve, voit-elle la clé publique et le message chiffré de Bob ?")
-print("Réponse : Oui, ces informations sont publiques.")
+    print("\n--- Étape 1 : Attaque par factorisation ---")
 
-print("\nEve essaie de factoriser n pour trouver p et q...")
+    # Du côté d'Eve
+    print("\nEve peut voir :")
+    print(" La clé publique (e, n) :", e, n)
+    print(" Le message chiffré de Bob :", c)
 
-# Nous allons factoriser n
-p_eve, q_eve = facteurs(n)
-print("Facteurs d'Eve (p, q) :", p_eve, q_eve)
+    print("\nEve, voit-elle la clé publique et le message chiffré de Bob ?")
+    print("Réponse : Oui, ces informations sont publiques.")
 
-print("\nAvons-nous trouvé p et q ?")
-if (p_eve == p and q_eve == q) or (p_eve == q and q_eve == p):
-    print("Réponse : Oui, Eve a trouvé les facteurs secrets!")
-else:
-    print("Réponse : Non")
+    print("\nEve essaie de factoriser n pour trouver p et q...")
 
-# Eve calcul lambda
-lambda_n_eve = lcm(p_eve - 1, q_eve - 1)
-print("\nLambda_n de Eve :", lambda_n_eve)
+    # Nous allons factoriser n
+    p_eve, q_eve = facteurs(n)
+    print("Facteurs d'Eve (p, q) :", p_eve, q_eve)
 
-# Eve calcul d
-d_eve = trouve_d(e, lambda_n_eve)
-print("Clé secrète (exposant) d'Eve d :", d_eve)
+    print("\nAvons-nous trouvé p et q ?")
+    if (p_eve == p and q_eve == q) or (p_eve == q and q_eve == p):
+        print("Réponse : Oui, Eve a trouvé les facteurs secrets!")
+    else:
+        print("Réponse : Non")
 
-# Eve déchiffre le message (même code qu'Alice)
-m_eve = c ** d_eve % n
-print("Le message déchiffré par Eve :", m_eve)
+    # Eve calcul lambda
+    lambda_n_eve = lcm(p_eve - 1, q_eve - 1)
+    print("\nLambda_n de Eve :", lambda_n_eve)
+
+    # Eve calcul d
+    d_eve = trouve_d(e, lambda_n_eve)
+    print("Clé secrète (exposant) d'Eve d :", d_eve)
+
+    # Eve déchiffre le message (même code qu'Alice)
+    cle_eve = ClePriveeRSA(d_eve, n, p_eve, q_eve)
+    m_eve = cle_eve.dechiffre(c)
+    print("Le message déchiffré par Eve :", m_eve)
+
+    print("\nAvez-vous réussi à déchiffrer le message ?")
+    if m_eve == m:
+        print("Réponse : Oui, Eve a réussi à déchiffrer le message!")
+        print("Cela montre que si on peut factoriser n, on peut casser RSA.")
+    else:
+        print("Réponse : Non")
 
-print("\nAvez-vous réussi à déchiffrer le message ?")
-if m_eve == m:
-    print("Réponse : Oui, Eve a réussi à déchiffrer le message!")
-    print("Cela montre que si on peut factoriser n, on peut casser RSA.")
-else:
-    print("Réponse : Non")
 
 # ========================================
 # ÉTAPE 2 : ANALYSE DE FRÉQUENCE
 # ========================================
 
-print("\n--- Étape 2 : Attaque par analyse de fréquence ---")
-
-# Bob envoie un vrai message à Alice
-# Mais, Bob n'est pas prudent.
-print("\n+++++++++++++++++")
-print("Bob l'imprudent!")
-message = "Alice est plus forte que Bob."
-
-print(f"Message original : '{message}'")
-print("\nMessage chiffré (caractère par caractère) :")
-
-# On divise le message en bloc et
-# chiffre chacun des blocs.
-chiffres = []
-for m_c in message:
-    c = ord(m_c) ** e % n
-    chiffres.append((m_c, c))
-    # On affiche le message envoyé
-    print(c, " ", end='')
-
-print("\n+++++++++++++++++")
-
-# Analyse détaillée des répétitions
-print("\n\nAnalyse des caractères répétés :")
-print("-" * 40)
-
-# Créer un dictionnaire pour analyser les occurrences
-analyse = {}
-for i, (char, chiffre) in enumerate(chiffres):
-    if char not in analyse:
-        analyse[char] = []
-    analyse[char].append((i, chiffre))
-
-# Afficher l'analyse pour les caractères qui apparaissent plus d'une fois
-for char, occurrences in sorted(analyse.items()):
-    if len(occurrences) > 1:
-        positions = [str(pos) for pos, _ in occurrences]
-        chiffres_uniques = set([chiffre for _, chiffre in occurrences])
-        if len(chiffres_uniques) == 1:
-            print(f"Caractère '{char}' (apparaît {len(occurrences)} fois) :")
-            print(f"  - Positions : {', '.join(positions)}")
-            print(f"  - Toujours chiffré en : {chiffres_uniques.pop()}")
-            print(f"  ⚠️  VULNÉRABILITÉ : même chiffrement à chaque fois!")
-
-print("\nQue remarquez-vous (vérifier les caractères 'e' du message) ?")
-print("Réponse : Les caractères identiques (comme 'e', 'l', 'o', ' ', etc.) ")
-print("sont TOUJOURS chiffrés avec les mêmes codes.")
-print("Cela rend le chiffrement vulnérable à l'analyse de fréquence!")
+def partie2_frequence(cle_alice, cle_privee_alice):
+    """
+    partie2_frequence(cle_alice, cle_privee_alice)
+    Partie 2, étape 2 : chiffrement caractère par caractère et
+    analyse de fréquence, puis les blocs et l'enveloppe hybride.
+
+    Paramètres:
+    cle_alice (ClePubliqueRSA) : la clé publique d'Alice
+    cle_privee_alice (ClePriveeRSA) : sa clé privée
+
+    Return:
+    Aucun
+    """
+    import attaque_dictionnaire
+    import blocs_rsa
+    import hybride_rsa
+
+    e, n = cle_alice.e, cle_alice.n
+
+    print("\n--- Étape 2 : Attaque par analyse de fréquence ---")
+
+    # Bob envoie un vrai message à Alice
+    # Mais, Bob n'est pas prudent.
+    print("\n+++++++++++++++++")
+    print("Bob l'imprudent!")
+    message = "Alice est plus forte que Bob."
+
+    print(f"Message original : '{message}'")
+    print("\nMessage chiffré (caractère par caractère) :")
+
+    # On divise le message en bloc et
+    # chiffre chacun des blocs.
+    chiffres = []
+    for m_c in message:
+        c = cle_alice.chiffre(ord(m_c))
+        chiffres.append((m_c, c))
+        # On affiche le message envoyé
+        print(c, " ", end='')
+
+    print("\n+++++++++++++++++")
+
+    # Au lieu d'une exponentiation par caractère, on peut regrouper
+    # autant d'octets que possible sous n dans chaque bloc.
+    print("\nChiffrement par blocs d'octets :")
+    print(blocs_rsa.chiffre(message.encode(), cle_alice))
+    resultats = blocs_rsa.compare(message.encode(), cle_alice, cle_privee_alice)
+    print(f"{blocs_rsa.taille_bloc(n)} octet(s) par bloc pour n de {n.bit_length()} bits")
+    for methode, (debit, expansion) in resultats.items():
+        print(f"  {methode:9s} : {debit:10.0f} octets/s, expansion du chiffré {expansion:5.2f}")
+
+    # Mieux encore : RSA n'encapsule qu'une clé de session, une seule
+    # exponentiation par message, et le contenu passe par DES en mode CBC.
+    enveloppe = hybride_rsa.scelle(message.encode(), cle_alice)
+    print(f"\nEnveloppe hybride ({len(enveloppe)} octets) :", enveloppe.hex())
+    print("Ouverte par Alice :", hybride_rsa.ouvre(enveloppe, cle_privee_alice).decode())
+
+    # Analyse détaillée des répétitions
+    print("\n\nAnalyse des caractères répétés :")
+    print("-" * 40)
+
+    # Créer un dictionnaire pour analyser les occurrences
+    analyse = {}
+    for i, (char, chiffre) in enumerate(chiffres):
+        if char not in analyse:
+            analyse[char] = []
+        analyse[char].append((i, chiffre))
+
+    # Afficher l'analyse pour les caractères qui apparaissent plus d'une fois
+    for char, occurrences in sorted(analyse.items()):
+        if len(occurrences) > 1:
+            positions = [str(pos) for pos, _ in occurrences]
+            chiffres_uniques = set([chiffre for _, chiffre in occurrences])
+            if len(chiffres_uniques) == 1:
+                print(f"Caractère '{char}' (apparaît {len(occurrences)} fois) :")
+                print(f"  - Positions : {', '.join(positions)}")
+                print(f"  - Toujours chiffré en : {chiffres_uniques.pop()}")
+                print(f"  ⚠️  VULNÉRABILITÉ : même chiffrement à chaque fois!")
+
+    print("\nQue remarquez-vous (vérifier les caractères 'e' du message) ?")
+    print("Réponse : Les caractères identiques (comme 'e', 'l', 'o', ' ', etc.) ")
+    print("sont TOUJOURS chiffrés avec les mêmes codes.")
+    print("Cela rend le chiffrement vulnérable à l'analyse de fréquence!")
+
+    # Eve n'a même pas besoin des statistiques du langage : avec la clé
+    # publique, elle chiffre une fois chaque caractère possible et
+    # inverse le flux capturé par simple consultation de table.
+    print("\nEve construit le dictionnaire des 256 octets chiffrés avec (e, n)...")
+    livre = attaque_dictionnaire.livre_codes(cle_alice)
+    print("Message retrouvé par Eve :", attaque_dictionnaire.dechiffre([c for _, c in chiffres], livre))
+
 
 # ========================================
 # CONCLUSIONS
 # ========================================
 
-print("\n" + "=" * 50)
-print("CONCLUSIONS ET RECOMMANDATIONS")
-print("=" * 50)
-
-print("""
+CONCLUSIONS = """
 RÉSUMÉ DES VULNÉRABILITÉS IDENTIFIÉES :
 
 1. FACTORISATION FACILE
-   - Avec des petits nombres premiers (10 bits), Eve peut factoriser n
+   - Avec des petits nombres premiers (32 bits), Eve peut factoriser n
    - Une fois n factorisé, elle retrouve la clé privée d
 
 2. ANALYSE DE FRÉQUENCE
@@ -350,7 +476,21 @@ NOTE HISTORIQUE :
 - RSA-100 (100 chiffres décimaux) a été cassé
 - RSA-250 a été cassé en 2020
 - La norme actuelle est RSA-2048 minimum
-""")
+"""
+
+
+def conclusions():
+    print("\n" + "=" * 50)
+    print("CONCLUSIONS ET RECOMMANDATIONS")
+    print("=" * 50)
+    print(CONCLUSIONS)
+    print("\nFIN DE LA DÉMONSTRATION RSA")
+    print("=" * 50)
+
 
-print("\nFIN DE LA DÉMONSTRATION RSA")
-print("=" * 50)
\ No newline at end of file
+if __name__ == "__main__":
+    cle_alice, cle_privee_alice, p, q, m, c = partie1()
+    variante_multi_premiers(m)
+    partie2_factorisation(cle_alice, c, m, p, q)
+    partie2_frequence(cle_alice, cle_privee_alice)
+    conclusions()
@@ -1,6 +1,109 @@
 import random
 
 
+# Paramètres du LCG : x ← (MULTIPLICATEUR⋅x + INCREMENT) mod MODULE
+MULTIPLICATEUR = 1103515245
+INCREMENT = 12345
+MODULE = 2 ** 31
+MASQUE = MODULE - 1
+
+# Longueur des tables de saut de KeyStream.bytes
+BLOC = 1 << 16
+# En dessous, le calcul octet par octet est plus rapide que NumPy
+SEUIL_VECTORIEL = 32
+
+# NumPy n'est importé qu'au premier flux long (l'import coûte ~0,1 s) :
+# None tant qu'on n'a pas essayé, False s'il n'est pas installé
+_np = None
+_SAUTS = None
+
+
+def _numpy():
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np
+
+
+def _sauts():
+    """
+    _sauts()
+    Tables de saut du LCG : comme il est affine, j pas depuis l'état x
+    donnent x_j = (Aj⋅x + Cj) mod 2^31. On calcule Aj et Cj pour
+    j = 1 .. BLOC par doublements : x_(j+k) = Aj⋅(Ak⋅x + Ck) + Cj.
+    Les produits sont faits en uint32 : le débordement réduit modulo
+    2^32, donc le résultat masqué est exact modulo 2^31.
+
+    Return:
+    (tuple) : (A, C), tableaux uint32 où l'indice j - 1 donne le saut de j pas
+    """
+    global _SAUTS
+    if _SAUTS is None:
+        np = _numpy()
+        a = np.array([MULTIPLICATEUR], dtype=np.uint32)
+        c = np.array([INCREMENT], dtype=np.uint32)
+        while len(a) < BLOC:
+            a_k, c_k = a[-1:], c[-1:]
+            a, c = (np.concatenate((a, (a * a_k) & MASQUE)),
+                    np.concatenate((c, (a * c_k + c) & MASQUE)))
+        _SAUTS = a[:BLOC], c[:BLOC]
+    return _SAUTS
+
+
+def saut(pas):
+    """
+    saut(pas)
+    Composition du LCG avec lui-même pas fois, par élévation au carré :
+    (A, C) ∘ (A, C) = (A², A⋅C + C). Coût O(log pas).
+
+    Paramètres:
+    pas (int) : nombre de pas, pas ≥ 0
+
+    Return:
+    (tuple) : (a, c) tels que x_pas = (a⋅x + c) mod 2^31
+    """
+    a, c = 1, 0
+    a_carre, c_carre = MULTIPLICATEUR, INCREMENT
+    while pas:
+        if pas & 1:
+            a, c = a * a_carre & MASQUE, (a_carre * c + c_carre) & MASQUE
+        a_carre, c_carre = a_carre * a_carre & MASQUE, (a_carre * c_carre + c_carre) & MASQUE
+        pas >>= 1
+    return a, c
+
+
+def distance(depart, arrivee):
+    """
+    distance(depart, arrivee)
+    Nombre de pas du LCG pour aller de l'état depart à l'état arrivee.
+    La période est pleine (2^31), donc modulo 2^(j+1) la suite a pour
+    période 2^(j+1) : f^(2^j) ne change pas l'état modulo 2^j et change
+    toujours son bit j. On fixe ainsi le nombre de pas bit par bit,
+    en 31 étapes.
+
+    Paramètres:
+    depart (int) : état de départ, dans [0, 2^31[
+    arrivee (int) : état d'arrivée, dans [0, 2^31[
+
+    Return:
+    (int) : k dans [0, 2^31[ tel que saut(k) mène de depart à arrivee
+    """
+    # (a, c) : le saut de 2^j pas
+    a, c = MULTIPLICATEUR, INCREMENT
+    pas = 0
+    etat = depart
+    for j in range(31):
+        if (etat ^ arrivee) >> j & 1:
+            etat = (a * etat + c) & MASQUE
+            pas |= 1 << j
+        a, c = a * a & MASQUE, (a * c + c) & MASQUE
+    return pas
+
+
 class KeyStream:
     """
     Classe KeyStream
@@ -23,6 +126,11 @@ class KeyStream:
 
         # Initialise l'objet à la clé
         self.next = key
+        # La graine, et un repère pour tell() : la position _base
+        # correspond à l'état _etat_base (rand() n'a rien à compter)
+        self.key = key
+        self._base = 0
+        self._etat_base = key & MASQUE
 
     def rand(self):
         """
@@ -59,6 +167,101 @@ class KeyStream:
         # Version corrigée (partie 2, étape 4)
         return (self.rand() // 2 ** 23) % 256
 
+    def bytes(self, n):
+        """
+        bytes(self, n)
+        Les n prochains octets du flux, identiques à n appels de
+        get_key_byte. Avec NumPy, les états sont calculés par blocs de
+        BLOC positions à partir des tables de saut (une multiplication
+        et une addition uint32 par octet), sans boucle Python par octet.
+
+        Paramètres:
+        self : notre objet flux de clé
+        n (int) : nombre d'octets
+
+        Return:
+        (bytes) : les octets du flux
+        """
+        np = _numpy()
+        if not np or n < SEUIL_VECTORIEL:
+            return bytes([self.get_key_byte() for _ in range(n)])
+        return self._octets(n).tobytes()
+
+    def _octets(self, n):
+        """
+        _octets(self, n)
+        Version NumPy de bytes : tableau uint8 des n prochains octets.
+        """
+        np = _numpy()
+        a, c = _sauts()
+        position = self.tell()
+        # Saut d'un bloc entier, pour les états de départ des blocs
+        a_bloc, c_bloc = int(a[-1]), int(c[-1])
+        sortie = np.empty(n, dtype=np.uint8)
+        # Par groupes de 64 blocs (4 Mo d'états uint32 à la fois)
+        groupe = 64 * BLOC
+        for debut in range(0, n, groupe):
+            taille = min(groupe, n - debut)
+            departs = []
+            # La graine peut être négative ou dépasser 2^32 : on la réduit
+            # avant NumPy (le premier pas ne dépend que de x mod 2^31)
+            x = self.next & MASQUE
+            for _ in range(-(-taille // BLOC)):
+                departs.append(x)
+                x = (a_bloc * x + c_bloc) & MASQUE
+            if taille <= BLOC:
+                etats = (a[:taille] * np.uint32(departs[0]) + c[:taille]) & MASQUE
+            else:
+                etats = (a * np.array(departs, dtype=np.uint32)[:, None] + c) & MASQUE
+                etats = etats.reshape(-1)[:taille]
+            sortie[debut:debut + taille] = etats >> 23
+            self.next = int(etats[-1])
+        self._base = position + n
+        self._etat_base = self.next
+        return sortie
+
+    def seek(self, offset, whence=0):
+        """
+        seek(self, offset, whence=0)
+        Place le flux à l'octet offset : le prochain get_key_byte rend
+        l'octet numéro offset du flux de la graine. L'état est calculé
+        depuis la graine par saut(offset), en O(log offset), quelle que
+        soit la position de départ.
+
+        Paramètres:
+        self : notre objet flux de clé
+        offset (int) : la position
+        whence (int) : 0 depuis le début du flux, 1 depuis la position courante
+
+        Return:
+        (int) : la nouvelle position
+        """
+        if whence == 1:
+            offset += self.tell()
+        elif whence != 0:
+            raise ValueError(f"whence doit valoir 0 ou 1, pas {whence}")
+        if offset < 0:
+            raise ValueError("position négative")
+        a, c = saut(offset)
+        self.next = (a * self.key + c) & MASQUE
+        self._base = offset
+        self._etat_base = self.next
+        return offset
+
+    def tell(self):
+        """
+        tell(self)
+        Position courante : le nombre d'octets déjà produits.
+        Les octets produits un par un depuis le dernier repère (création,
+        seek ou bytes) ne sont pas comptés : on les retrouve à partir de
+        l'état, par distance() (exact tant qu'il y en a moins de 2^31).
+        """
+        return self._base + distance(self._etat_base, self.next & MASQUE)
+
+    @property
+    def position(self):
+        return self.tell()
+
 
 def encryptDecrypt(key, message):
     """
@@ -75,7 +278,34 @@ def encryptDecrypt(key, message):
 
     # On fait un XOR avec chacun des caractères du message
     # Une nouvelle clé est générée à chaque caractère
-    return bytes([message[i] ^ key.get_key_byte() for i in range(len(message))])
+    np = _numpy()
+    if not np or len(message) < SEUIL_VECTORIEL:
+        return bytes([message[i] ^ key.get_key_byte() for i in range(len(message))])
+
+    # Avec NumPy, tout le tampon d'un coup avec le flux de key.bytes
+    donnees = np.frombuffer(bytes(message), dtype=np.uint8)
+    return (donnees ^ key._octets(len(donnees))).tobytes()
+
+
+def decrypt_range(seed, ciphertext, start, length):
+    """
+    decrypt_range(seed, ciphertext, start, length)
+    Déchiffre les octets start .. start + length - 1 d'un message
+    chiffré par encryptDecrypt(KeyStream(seed), ...), sans rejouer le
+    flux depuis le début : le coût ne dépend pas de start.
+
+    Paramètres
+    seed (int) : la clé partagée
+    ciphertext (bytes) : le message chiffré complet (bytes, mmap, ...)
+    start (int) : le premier octet voulu
+    length (int) : nombre d'octets
+
+    Return:
+    (bytes) : le texte en clair de la tranche
+    """
+    key = KeyStream(seed)
+    key.seek(start)
+    return encryptDecrypt(key, ciphertext[start:start + length])
 
 
 def transmit(secret, tauxErreurs):
@@ -220,6 +450,139 @@ def brute_force(plain, secret):
     return False
 
 
+def brute_force_batch(plain, secret, bloc=1 << 22, statistiques=None):
+    """
+    brute_force_batch(plain, cipher, bloc=1 << 22, statistiques=None)
+    Même recherche que brute_force, mais par blocs de graines testées
+    ensemble avec NumPy.
+    Pour les graines start + i du bloc, le premier état vaut
+    A⋅i + (A⋅start + C) mod 2^31 : A⋅i est calculé une fois pour toutes,
+    et le premier octet se teste par une addition et une comparaison
+    (sur 2⋅état modulo 2^32, pour laisser le débordement uint32 faire
+    la réduction). Les survivants, environ 1 sur 256, avancent ensemble
+    et l'ensemble rétrécit à chaque octet connu suivant.
+
+    Paramètres :
+    plain (bytes) : Une partie de texte en clair connu.
+    secret (bytes) : le texte chiffré.
+    bloc (int) : nombre de graines par bloc
+    statistiques (dict) : si fourni, reçoit "graines" (essayées),
+    "duree" (s) et "debit" (graines/s), avec ou sans NumPy
+
+    Return
+    (int) : la clé secrète commune (la plus petite qui convient)
+    False : si aucune clé ne convient
+    """
+    import time
+
+    t0 = time.perf_counter()
+    np = _numpy()
+    flux = [plain[i] ^ secret[i] for i in range(len(plain))]
+    if not np or not flux:
+        # Sans NumPy (ou sans octet connu) : la boucle de brute_force,
+        # qui essaie les graines dans l'ordre
+        trouve = brute_force(plain, secret)
+        _statistiques(statistiques, MODULE if trouve is False else trouve + 1, t0)
+        return trouve
+
+    # 2⋅A⋅i mod 2^32 pour i dans le bloc
+    pentes = np.arange(bloc, dtype=np.uint32) * np.uint32(2 * MULTIPLICATEUR & 0xFFFFFFFF)
+    somme = np.empty(bloc, dtype=np.uint32)
+    garde = np.empty(bloc, dtype=bool)
+    trouve = False
+    essayees = 0
+
+    for debut in range(0, MODULE, bloc):
+        taille = min(bloc, MODULE - debut)
+        # 2⋅(premier état - octet⋅2^23) mod 2^32 < 2^24 : le premier octet convient
+        decalage = 2 * (MULTIPLICATEUR * debut + INCREMENT - (flux[0] << 23)) & 0xFFFFFFFF
+        np.add(pentes[:taille], np.uint32(decalage), out=somme[:taille])
+        np.less(somme[:taille], 1 << 24, out=garde[:taille])
+        graines = np.flatnonzero(garde[:taille]).astype(np.uint32) + np.uint32(debut)
+        essayees += taille
+
+        etats = (graines * np.uint32(MULTIPLICATEUR) + np.uint32(INCREMENT)) & np.uint32(MASQUE)
+        for octet in flux[1:]:
+            etats = (etats * np.uint32(MULTIPLICATEUR) + np.uint32(INCREMENT)) & np.uint32(MASQUE)
+            correspond = (etats >> 23) == octet
+            graines, etats = graines[correspond], etats[correspond]
+            if not len(graines):
+                break
+        if len(graines):
+            trouve = int(graines.min())
+            break
+
+    _statistiques(statistiques, essayees, t0)
+    return trouve
+
+
+def _statistiques(statistiques, essayees, t0):
+    if statistiques is not None:
+        import time
+        duree = time.perf_counter() - t0
+        statistiques.update(graines=essayees, duree=duree, debit=essayees / duree if duree else 0.0)
+
+
+def recover_seed(plain, secret):
+    """
+    recover_seed(plain, cipher)
+    Retrouve la clé secrète par récupération d'état, au lieu
+    d'essayer les 2^31 graines.
+    get_key_byte rend les bits 23 à 30 de l'état : le premier octet
+    du flux (plain[0] ^ secret[0]) fixe les 8 bits de poids fort du
+    premier état, seuls ses 23 bits de poids faible sont inconnus.
+    Les 2^23 candidats avancent ensemble (tableaux NumPy) et chaque
+    octet connu suivant élimine ceux qui ne donnent pas le bon octet,
+    environ 255 sur 256. Le LCG est ensuite remonté d'un pas :
+    le multiplicateur est impair, donc inversible modulo 2^31.
+
+    Paramètres :
+    plain (bytes) : Une partie de texte en clair connu (le début du message).
+    secret (bytes) : le texte chiffré, au moins aussi long que plain.
+
+    Return
+    (int) : la plus petite clé secrète compatible (0 si plain est vide,
+    comme brute_force)
+    False : si aucun état ne convient
+
+    Exception :
+    IndexError : si secret est plus court que plain (comme brute_force)
+    """
+    flux = [plain[i] ^ secret[i] for i in range(len(plain))]
+    if not flux:
+        return 0
+
+    np = _numpy()
+    if np:
+        # premiers : les candidats pour le premier état, etats : leur état courant
+        premiers = np.arange(1 << 23, dtype=np.uint32) | np.uint32(flux[0] << 23)
+        etats = premiers
+        for octet in flux[1:]:
+            etats = (etats * np.uint32(MULTIPLICATEUR) + np.uint32(INCREMENT)) & np.uint32(MASQUE)
+            garde = (etats >> 23) == octet
+            premiers, etats = premiers[garde], etats[garde]
+            if not len(premiers):
+                return False
+        premiers = [int(x) for x in premiers]
+    else:
+        premiers = []
+        for bas in range(1 << 23):
+            x = flux[0] << 23 | bas
+            etat = x
+            for octet in flux[1:]:
+                etat = (MULTIPLICATEUR * etat + INCREMENT) & MASQUE
+                if etat >> 23 != octet:
+                    break
+            else:
+                premiers.append(x)
+        if not premiers:
+            return False
+
+    # Un pas en arrière : graine = A^-1 (x1 - C) mod 2^31
+    inverse = pow(MULTIPLICATEUR, -1, MODULE)
+    return min((x - INCREMENT) * inverse & MASQUE for x in premiers)
+
+
 def test_partie1_etape1():
     """Test de la partie 1, étape 1"""
     print("=== PARTIE 1 - ÉTAPE 1 : Test du LCG ===")
@@ -403,6 +766,133 @@ def test_partie2_etape4():
         print("Eve : ", message)
     else:
         print("Eve n'a pas réussi à trouver la clé")
+
+    # L'en-tête connu donne aussi directement les bits de poids fort
+    # de l'état : la clé tombe même si elle est tirée sur 31 bits.
+    cle_secret = random.randrange(0, 2 ** 31)
+    secret = encryptDecrypt(KeyStream(cle_secret), header.encode() + "Un message secret vers Bob".encode())
+    print("Eve, récupération d'état sur une clé de 31 bits : ", recover_seed(header.encode(), secret),
+          "(clé : ", cle_secret, ")")
+    print()
+
+
+def benchmark_flux(tailles=(10 ** 3, 10 ** 5, 10 ** 7)):
+    """
+    benchmark_flux(tailles)
+    Débit de encryptDecrypt, octet par octet (get_key_byte) et par
+    tampon entier (KeyStream.bytes), pour quelques tailles de message.
+
+    Paramètres:
+    tailles (tuple) : tailles de message en octets
+
+    Return:
+    Aucun
+    """
+    import time
+
+    print("=== Débit du chiffrement par flux ===")
+    # Import de NumPy et tables de saut hors mesure
+    encryptDecrypt(KeyStream(), bytes(BLOC))
+    for taille in tailles:
+        message = random.randbytes(taille)
+        # Le chemin scalaire est mesuré sur au plus 1 Mo
+        echantillon = message[:10 ** 6]
+        key = KeyStream(23)
+        t0 = time.perf_counter()
+        attendu = bytes([echantillon[i] ^ key.get_key_byte() for i in range(len(echantillon))])
+        scalaire = len(echantillon) / (time.perf_counter() - t0)
+
+        key = KeyStream(23)
+        t0 = time.perf_counter()
+        secret = encryptDecrypt(key, message)
+        vectoriel = taille / (time.perf_counter() - t0)
+        if secret[:len(echantillon)] != attendu:
+            raise ValueError("encryptDecrypt ne rend pas le chiffrement octet par octet")
+
+        print(f"{taille:9d} octets : octet par octet {scalaire / 1e6:6.2f} Mo/s, "
+              f"par tampon {vectoriel / 1e6:7.1f} Mo/s")
+    print()
+
+
+def benchmark_acces(taille=10 ** 8, longueur=4096, repetitions=200):
+    """
+    benchmark_acces(taille, longueur, repetitions)
+    Coût de decrypt_range selon la position de la tranche dans un
+    grand message chiffré, comparé au rejeu du flux depuis la graine.
+
+    Paramètres:
+    taille (int) : taille du message chiffré
+    longueur (int) : taille des tranches
+    repetitions (int) : tranches déchiffrées par position
+
+    Return:
+    Aucun
+    """
+    import time
+
+    print("=== Accès direct dans un message chiffré ===")
+    message = random.randbytes(taille)
+    secret = encryptDecrypt(KeyStream(23), message)
+    for debut in (0, 10 ** 3, 10 ** 6, taille - longueur):
+        t0 = time.perf_counter()
+        for _ in range(repetitions):
+            tranche = decrypt_range(23, secret, debut, longueur)
+        duree = (time.perf_counter() - t0) / repetitions
+        if tranche != message[debut:debut + longueur]:
+            raise ValueError(f"decrypt_range faux à l'octet {debut}")
+
+        # Rejeu : debut appels à rand() avant la tranche (mesuré sur 10^5)
+        key = KeyStream(23)
+        t0 = time.perf_counter()
+        for _ in range(min(debut, 10 ** 5)):
+            key.rand()
+        rejeu = (time.perf_counter() - t0) * debut / max(min(debut, 10 ** 5), 1)
+        print(f"tranche de {longueur} octets à l'octet {debut:10d} : {1e6 * duree:7.1f} µs "
+              f"(rejeu du flux : {1e6 * rejeu:12.0f} µs)")
+    print()
+
+
+def benchmark_attaques(header=b"MESSAGE: ", echantillon=2 ** 18):
+    """
+    benchmark_attaques(header, echantillon)
+    Compare recover_seed et brute_force_batch avec brute_force sur
+    une clé de 31 bits.
+    Le débit de brute_force est mesuré sur les echantillon premières
+    graines et extrapolé à tout l'espace.
+
+    Paramètres:
+    header (bytes) : l'en-tête connu
+    echantillon (int) : graines essayées par brute_force
+
+    Return:
+    Aucun
+    """
+    import time
+
+    print("=== Attaques sur la clé du flux ===")
+    message = header + b"Un message secret vers Bob"
+    cle_secret = random.randrange(0, 2 ** 31)
+    secret = encryptDecrypt(KeyStream(cle_secret), message)
+    t0 = time.perf_counter()
+    if recover_seed(header, secret) != cle_secret:
+        raise ValueError("recover_seed ne retrouve pas la clé")
+    recuperation = time.perf_counter() - t0
+
+    secret_bf = encryptDecrypt(KeyStream(echantillon - 1), message)
+    t0 = time.perf_counter()
+    if brute_force(header, secret_bf) != echantillon - 1:
+        raise ValueError("brute_force ne retrouve pas la clé")
+    debit = echantillon / (time.perf_counter() - t0)
+    print(f"brute_force : {debit:9.0f} graines/s, soit {2 ** 31 / debit:7.0f} s pour les 2^31 graines")
+    print(f"recover_seed : {recuperation:7.3f} s pour une clé de 31 bits "
+          f"({2 ** 31 / debit / recuperation:.0f} fois plus rapide)")
+
+    statistiques = {}
+    if brute_force_batch(header, secret, statistiques=statistiques) != cle_secret:
+        raise ValueError("brute_force_batch ne retrouve pas la clé")
+    print(f"brute_force_batch : {statistiques['debit']:9.0f} graines/s, clé trouvée après "
+          f"{statistiques['graines']} graines en {statistiques['duree']:.2f} s "
+          f"(tout l'espace : {2 ** 31 / statistiques['debit']:.1f} s)")
     print()
 
 
@@ -413,4 +903,7 @@ if __name__ == "__main__":
     test_partie2_etape1()
     test_partie2_etape2()
     test_partie2_etape3()
-    test_partie2_etape4()
\ No newline at end of file
+    test_partie2_etape4()
+    benchmark_flux()
+    benchmark_acces()
+    benchmark_attaques()
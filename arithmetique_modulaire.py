@@ -0,0 +1,202 @@
+# arithmetique_modulaire.py
+# Noyau d'arithmétique modulaire : inverse par Euclide étendu,
+# recombinaison par le théorème des restes chinois (Garner),
+# inversion par lot (astuce de Montgomery) et racine k-ième entière.
+
+
+def euclide_etendu(a, b):
+    """
+    euclide_etendu(a, b)
+    Algorithme d'Euclide étendu : trouve g = gcd(a, b) et
+    les coefficients de Bézout x, y tels que a⋅x + b⋅y = g.
+
+    Paramètres:
+    a (int)
+    b (int)
+
+    Return:
+    (tuple) : (g, x, y)
+    """
+    # On garde l'invariant a0⋅x + b0⋅y = a à chaque étape
+    x0, x1 = 1, 0
+    y0, y1 = 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    if a < 0:
+        return -a, -x0, -y0
+    return a, x0, y0
+
+
+def pgcd(a, b):
+    """
+    pgcd(a, b)
+    Trouve le plus grand commun diviseur de a et b.
+
+    Paramètres:
+    a (int)
+    b (int)
+
+    Return:
+    (int)
+    """
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def ppcm(a, b):
+    """
+    ppcm(a, b)
+    Trouve le plus petit multiple commun entre a et b.
+
+    Paramètres:
+    a (int)
+    b (int)
+
+    Return:
+    (int)
+    """
+    if a == 0 or b == 0:
+        return 0
+    return abs(a * b) // pgcd(a, b)
+
+
+def inverse_modulaire(a, n):
+    """
+    inverse_modulaire(a, n)
+    Trouve l'inverse de a modulo n, c'est-à-dire l'entier
+    d dans [0, n[ tel que a⋅d ≡ 1 (mod n).
+
+    Paramètres:
+    a (int) : le nombre à inverser
+    n (int) : le module
+
+    Return:
+    (int) : l'inverse de a modulo n
+
+    Exception:
+    ValueError : si gcd(a, n) ≠ 1 (pas d'inverse)
+    """
+    g, x, _ = euclide_etendu(a % n, n)
+    if g != 1:
+        raise ValueError(f"{a} n'est pas inversible modulo {n}")
+    return x % n
+
+
+def restes_chinois(residus, modules):
+    """
+    restes_chinois(residus, modules)
+    Trouve x tel que x ≡ residus[i] (mod modules[i]) pour tout i,
+    avec des modules premiers entre eux deux à deux.
+    On utilise l'algorithme de Garner : x est construit chiffre
+    par chiffre dans la base mixte (m1, m1⋅m2, ...), ce qui évite
+    les grands produits M / mi de la formule classique.
+
+    Paramètres:
+    residus (list) : les restes
+    modules (list) : les modules, premiers entre eux deux à deux
+
+    Return:
+    (int) : l'unique solution x dans [0, m1⋅m2⋅...⋅mk[
+    """
+    x = 0
+    produit = 1
+    for r, m in zip(residus, modules):
+        # On corrige x pour satisfaire la nouvelle congruence
+        # sans perturber les précédentes (on ajoute un multiple de produit).
+        t = (r - x) * inverse_modulaire(produit, m) % m
+        x += produit * t
+        produit *= m
+    return x
+
+
+def inversion_par_lot(valeurs, n):
+    """
+    inversion_par_lot(valeurs, n)
+    Inverse toutes les valeurs modulo n avec une seule inversion
+    (astuce de Montgomery) : on calcule les produits cumulés,
+    on inverse le produit total, puis on redescend la liste.
+    Coût : 3(k - 1) multiplications et 1 inversion pour k valeurs.
+
+    Paramètres:
+    valeurs (list) : les nombres à inverser
+    n (int) : le module
+
+    Return:
+    (list) : les inverses, dans le même ordre
+
+    Exception:
+    ValueError : si l'une des valeurs n'est pas inversible
+    """
+    if not valeurs:
+        return []
+
+    # Produits cumulés : cumul[i] = v0⋅v1⋅...⋅vi mod n
+    cumul = []
+    produit = 1
+    for v in valeurs:
+        produit = produit * v % n
+        cumul.append(produit)
+
+    inverse = inverse_modulaire(produit, n)
+
+    # À chaque étape, inverse = (v0⋅...⋅vi)^-1
+    inverses = [0] * len(valeurs)
+    for i in range(len(valeurs) - 1, 0, -1):
+        inverses[i] = inverse * cumul[i - 1] % n
+        inverse = inverse * valeurs[i] % n
+    inverses[0] = inverse
+    return inverses
+
+
+def racine_entiere(x, k):
+    """
+    racine_entiere(x, k)
+    Racine k-ième entière ⌊x^(1/k)⌋ par la méthode de Newton sur les
+    entiers : y → ((k - 1)⋅y + x // y^(k-1)) // k, qui décroît vers
+    la racine en partant d'une valeur trop grande.
+    Le point de départ est la racine (calculée de la même façon) des
+    bits de poids fort de x : la moitié des bits de la racine est
+    déjà juste, et deux ou trois itérations à pleine précision suffisent.
+
+    Paramètres:
+    x (int) : un entier positif ou nul
+    k (int) : l'indice de la racine, k ≥ 1
+
+    Return:
+    (int) : ⌊x^(1/k)⌋
+    """
+    if x < 0:
+        raise ValueError("racine d'un nombre négatif")
+    if k == 1 or x < 2:
+        return x
+
+    # Nombre de bits de la racine
+    bits = (x.bit_length() + k - 1) // k
+    if bits <= 32:
+        y = 1 << bits
+    else:
+        # ⌊x'^(1/k)⌋ + 1 avec x' = x >> (k⋅s) donne une valeur trop
+        # grande juste sur la moitié des bits
+        s = bits // 2
+        y = (racine_entiere(x >> (k * s), k) + 1) << s
+    return _newton(x, k, y)
+
+
+def _newton(x, k, y):
+    """
+    _newton(x, k, y)
+    Itérations de Newton depuis y ≥ ⌊x^(1/k)⌋, jusqu'à ce que
+    la suite cesse de décroître.
+
+    Return:
+    (int) : ⌊x^(1/k)⌋
+    """
+    while True:
+        z = ((k - 1) * y + x // y ** (k - 1)) // k
+        if z >= y:
+            return y
+        y = z
@@ -0,0 +1,188 @@
+# attaque_dictionnaire.py
+# Attaque par dictionnaire contre le chiffrement RSA caractère par
+# caractère de RSA.py : sans bourrage aléatoire, ord(c)^e mod n est
+# toujours le même. Eve chiffre une fois chaque caractère possible avec
+# la clé publique (e, n) et inverse ensuite tout le flux intercepté par
+# simple consultation d'une table. La table est gardée sur disque,
+# indexée par (e, n).
+import hashlib
+import os
+import tempfile
+
+
+# Tailles d'alphabet : octets, ou tous les points de code Unicode
+OCTETS = 256
+UNICODE = 0x110000
+
+# Répertoire par défaut des tables
+REPERTOIRE = os.path.join(tempfile.gettempdir(), "dictionnaires_rsa")
+
+
+def construit(cle, alphabet=OCTETS):
+    """
+    construit(cle, alphabet=OCTETS)
+    Chiffre les entiers 0 .. alphabet - 1. RSA sans bourrage est
+    multiplicatif : (ab)^e = a^e ⋅ b^e mod n. Seuls les premiers
+    demandent une exponentiation; un composé x = a⋅b coûte une
+    multiplication modulaire.
+
+    Paramètres:
+    cle (ClePubliqueRSA) : la clé publique
+    alphabet (int) : nombre de points de code (au plus n)
+
+    Return:
+    (list) : chiffres[x] = x^e mod n
+    """
+    n = cle.n
+    alphabet = min(alphabet, n)
+
+    # facteur[x] : un facteur premier de x, 0 si x est premier
+    facteur = [0] * alphabet
+    p = 2
+    while p * p < alphabet:
+        if not facteur[p]:
+            facteur[p * p::p] = [p] * len(range(p * p, alphabet, p))
+        p += 1
+
+    chiffres = [0] * alphabet
+    if alphabet > 1:
+        chiffres[1] = 1
+    for x in range(2, alphabet):
+        f = facteur[x]
+        if f:
+            chiffres[x] = chiffres[f] * chiffres[x // f] % n
+        else:
+            chiffres[x] = pow(x, cle.e, n)
+    return chiffres
+
+
+def _chemin(cle, alphabet, repertoire):
+    nom = hashlib.sha256(f"{cle.e}:{cle.n}".encode()).hexdigest()[:32]
+    return os.path.join(repertoire, f"{nom}_{alphabet}.bin")
+
+
+def livre_codes(cle, alphabet=OCTETS, repertoire=REPERTOIRE):
+    """
+    livre_codes(cle, alphabet=OCTETS, repertoire=REPERTOIRE)
+    Table de déchiffrement {chiffré: caractère} pour la clé publique.
+    La table est lue sur disque si elle existe déjà pour (e, n),
+    sinon construite puis enregistrée (chiffrés de largeur fixe,
+    petit-boutistes, dans l'ordre des points de code).
+
+    Paramètres:
+    cle (ClePubliqueRSA) : la clé publique
+    alphabet (int) : OCTETS, UNICODE ou une autre taille
+    repertoire (str) : répertoire des tables (None : pas de cache)
+
+    Return:
+    (dict) : {chiffré (int): caractère (str)}
+    """
+    alphabet = min(alphabet, cle.n)
+    largeur = (cle.n.bit_length() + 7) // 8
+    chiffres = None
+
+    if repertoire is not None:
+        chemin = _chemin(cle, alphabet, repertoire)
+        if os.path.exists(chemin) and os.path.getsize(chemin) == largeur * alphabet:
+            with open(chemin, "rb") as fichier:
+                donnees = fichier.read()
+            chiffres = [int.from_bytes(donnees[i:i + largeur], "little")
+                        for i in range(0, len(donnees), largeur)]
+
+    if chiffres is None:
+        chiffres = construit(cle, alphabet)
+        if repertoire is not None:
+            os.makedirs(repertoire, exist_ok=True)
+            temporaire = chemin + ".tmp"
+            with open(temporaire, "wb") as fichier:
+                fichier.write(b"".join(c.to_bytes(largeur, "little") for c in chiffres))
+            os.replace(temporaire, chemin)
+
+    return dict(zip(chiffres, map(chr, range(alphabet))))
+
+
+def dechiffre(chiffres, livre):
+    """
+    dechiffre(chiffres, livre)
+    Inverse une suite de chiffrés par consultation de la table.
+    Un chiffré absent (hors de l'alphabet) devient U+FFFD.
+
+    Paramètres:
+    chiffres (itérable) : les chiffrés (int)
+    livre (dict) : la table de livre_codes
+
+    Return:
+    (str) : le message
+    """
+    return "".join([livre.get(c, "�") for c in chiffres])
+
+
+def dechiffre_texte(morceaux, livre):
+    """
+    dechiffre_texte(morceaux, livre)
+    Générateur qui déchiffre un flux intercepté écrit en décimal
+    (chiffrés séparés par des blancs, comme l'affiche RSA.py), lu en
+    morceaux de texte quelconques, en une seule passe. La table est
+    réindexée par l'écriture décimale : pas de conversion en entier.
+
+    Paramètres:
+    morceaux (itérable de str) : le flux, par exemple un fichier ouvert
+    livre (dict) : la table de livre_codes
+
+    Return:
+    (generator) : les morceaux du message déchiffré
+    """
+    par_texte = {str(c): caractere for c, caractere in livre.items()}
+    reste = ""
+    for morceau in morceaux:
+        morceau = reste + morceau
+        # Le dernier nombre peut être coupé : on le garde pour la suite
+        coupure = len(morceau.rstrip("0123456789"))
+        morceau, reste = morceau[:coupure], morceau[coupure:]
+        yield "".join([par_texte.get(jeton, "�") for jeton in morceau.split()])
+    if reste:
+        yield par_texte.get(reste, "�")
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import io
+    import random
+    import time
+
+    from cle_rsa import genere_cle
+
+    texte = ("Alice est plus forte que Bob. Ève écoute tout : « ça » ✓ ")
+    for bits in (64, 2048):
+        publique, _ = genere_cle(bits)
+        print(f"=== Clé de {bits} bits ===")
+
+        for alphabet in (OCTETS, UNICODE) if bits == 64 else (OCTETS, 1 << 14):
+            t0 = time.perf_counter()
+            [publique.chiffre(x) for x in range(min(alphabet, 4096))]
+            directe = (time.perf_counter() - t0) * alphabet / min(alphabet, 4096)
+
+            with tempfile.TemporaryDirectory() as repertoire:
+                t0 = time.perf_counter()
+                livre = livre_codes(publique, alphabet, repertoire)
+                construction = time.perf_counter() - t0
+                t0 = time.perf_counter()
+                assert livre_codes(publique, alphabet, repertoire) == livre
+                lecture = time.perf_counter() - t0
+            print(f"  {alphabet:7d} points de code : construction {construction:7.2f} s "
+                  f"(une exponentiation par point : {directe:7.2f} s), relecture {lecture:5.2f} s")
+
+        # Un flux capturé de plusieurs mégaoctets
+        message = "".join(random.choices(texte, k=10 ** 5 if bits == 2048 else 10 ** 6))
+        livre = livre_codes(publique, UNICODE if bits == 64 else 1 << 14, None)
+        inverse = {caractere: c for c, caractere in livre.items()}
+        capture = "  ".join(str(inverse[caractere]) for caractere in message)
+        t0 = time.perf_counter()
+        clair = "".join(dechiffre_texte(iter(lambda f=io.StringIO(capture): f.read(1 << 16), ""), livre))
+        duree = time.perf_counter() - t0
+        assert clair == message
+        print(f"  flux de {len(capture) / 2 ** 20:.1f} Mo déchiffré en {duree:.2f} s "
+              f"({len(capture) / 2 ** 20 / duree:.0f} Mo/s)")
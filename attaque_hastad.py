@@ -0,0 +1,121 @@
+# attaque_hastad.py
+# Attaque de Håstad (diffusion) : le même message m, sans bourrage,
+# est envoyé à e destinataires qui ont tous l'exposant public e.
+# Par les restes chinois, on obtient x = m^e mod n1⋅n2⋅...⋅ne; comme
+# m < ni, m^e est plus petit que le produit des modules, donc x = m^e
+# exactement et m est la racine e-ième entière de x.
+import arithmetique_modulaire
+
+
+def hastad(chiffres, modules, e):
+    """
+    hastad(chiffres, modules, e)
+    Retrouve le message à partir des chiffrés du même message sous
+    des modules premiers entre eux et le même exposant e. Il faut en
+    général e chiffrés; moins suffisent si le message est court
+    (m^e inférieur au produit des modules utilisés).
+
+    Paramètres:
+    chiffres (list) : les chiffrés ci = m^e mod ni
+    modules (list) : les modules ni
+    e (int) : l'exposant public commun
+
+    Return:
+    (int) : le message m
+    None : si m^e dépasse le produit des modules
+    """
+    x = arithmetique_modulaire.restes_chinois(chiffres, modules)
+    m = arithmetique_modulaire.racine_entiere(x, e)
+    if m ** e == x:
+        return m
+    return None
+
+
+def diffusion(interceptes):
+    """
+    diffusion(interceptes)
+    Attaque une capture de diffusion : les chiffrés sont regroupés par
+    exposant public; dans chaque groupe, on prend au plus e modules
+    distincts et on essaie hastad.
+
+    Paramètres:
+    interceptes (list) : des couples (ClePubliqueRSA, chiffré)
+
+    Return:
+    (int) : le message m
+    None : si aucun groupe ne suffit
+    """
+    groupes = {}
+    for cle, c in interceptes:
+        groupe = groupes.setdefault(cle.e, {})
+        groupe.setdefault(cle.n, c)
+
+    # Les plus petits exposants demandent le moins de chiffrés
+    for e in sorted(groupes):
+        modules = list(groupes[e])[:e]
+        chiffres = [groupes[e][n] for n in modules]
+        try:
+            m = hastad(chiffres, modules, e)
+        except ValueError:
+            # Deux modules partagent un facteur : voir batch_gcd
+            continue
+        if m is not None:
+            return m
+    return None
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_racine(cas, repetitions=3):
+    """
+    benchmark_racine(cas, repetitions=3)
+    Compare Newton à pleine précision depuis 2^⌈bits/k⌉ avec la
+    version qui part de la racine des bits de poids fort.
+
+    Paramètres:
+    cas (list) : des couples (k, bits de x)
+    repetitions (int) : nombre de mesures par cas
+
+    Return:
+    Aucun
+    """
+    import random
+    import time
+
+    for k, bits in cas:
+        m = random.getrandbits(bits // k) | 1 << (bits // k - 1)
+        x = m ** k
+        t0 = time.perf_counter()
+        for _ in range(repetitions):
+            assert arithmetique_modulaire._newton(x, k, 1 << ((x.bit_length() + k - 1) // k)) == m
+        direct = (time.perf_counter() - t0) / repetitions
+        t0 = time.perf_counter()
+        for _ in range(repetitions):
+            assert arithmetique_modulaire.racine_entiere(x, k) == m
+        doublement = (time.perf_counter() - t0) / repetitions
+        print(f"k = {k:4d}, x de {x.bit_length():7d} bits : Newton direct {1000 * direct:9.2f} ms, "
+              f"précision doublée {1000 * doublement:8.2f} ms")
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from cle_rsa import genere_cle
+
+    print("=== Racines k-ièmes ===")
+    benchmark_racine([(3, 3 * 4096), (17, 17 * 2048), (65, 65 * 4096), (257, 257 * 2048), (257, 257 * 4096)])
+
+    print("=== Diffusion ===")
+    for e, bits, destinataires in ((3, 4096, 3), (17, 2048, 17), (257, 1024, 300)):
+        t0 = time.perf_counter()
+        cles = [genere_cle(bits, e=e)[0] for _ in range(destinataires)]
+        generation = time.perf_counter() - t0
+        m = random.getrandbits(bits - 8)
+        interceptes = [(cle, cle.chiffre(m)) for cle in cles]
+        t0 = time.perf_counter()
+        assert diffusion(interceptes) == m
+        print(f"e = {e:3d}, {destinataires} destinataires de {bits} bits : message retrouvé en "
+              f"{1000 * (time.perf_counter() - t0):8.1f} ms (clés générées en {generation:.1f} s)")
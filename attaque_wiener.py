@@ -0,0 +1,187 @@
+# attaque_wiener.py
+# Attaque de Wiener : si l'exposant privé d est petit
+# (d < n^(1/4) / 3 environ), d se lit dans les réduites du
+# développement en fraction continue de e/n. Temps polynomial, à
+# partir de la clé publique seule; la même réduite donne φ(n), donc
+# p et q. Un mode par lots audite tout un magasin de clés.
+import math
+
+import arithmetique_modulaire
+
+
+def fraction_continue(a, b):
+    """
+    fraction_continue(a, b)
+    Générateur des quotients partiels de a / b.
+
+    Paramètres:
+    a (int), b (int) : la fraction, b > 0
+
+    Return:
+    (generator) : les quotients partiels
+    """
+    while b:
+        q, r = divmod(a, b)
+        yield q
+        a, b = b, r
+
+
+def reduites(a, b):
+    """
+    reduites(a, b)
+    Générateur des réduites h / k de a / b.
+
+    Paramètres:
+    a (int), b (int) : la fraction, b > 0
+
+    Return:
+    (generator) : les couples (h, k)
+    """
+    h, h_prec = 1, 0
+    k, k_prec = 0, 1
+    for q in fraction_continue(a, b):
+        h, h_prec = q * h + h_prec, h
+        k, k_prec = q * k + k_prec, k
+        yield h, k
+
+
+def wiener(cle, cofacteurs=2 ** 16):
+    """
+    wiener(cle, cofacteurs=2 ** 16)
+    Cherche d parmi les réduites K / D de e/n.
+    Les clés de ce dépôt prennent d modulo λ(n) = φ(n) / g avec
+    g = pgcd(p - 1, q - 1), donc e⋅g⋅d - g = k⋅φ(n) et la réduite
+    vaut k / (g⋅d) au pgcd h près : e⋅D - K⋅φ(n) = s avec s = g / h
+    petit. s se lit dans e⋅D mod K; on en déduit φ(n), puis p et q
+    comme racines de x² - (n - φ(n) + 1)x + n. Aucune exponentiation :
+    une multiplication et un reste par réduite. Comme chez Wiener, p
+    et q sont supposés de même taille.
+
+    Paramètres:
+    cle (ClePubliqueRSA) : la clé publique
+    cofacteurs (int) : plus grande valeur de s (donc de g) essayée
+
+    Return:
+    (tuple) : (d, p, q) avec p ≤ q et d = e^-1 mod λ(n)
+    None : si d n'est pas assez petit pour l'attaque
+    """
+    e, n = cle.e, cle.n
+    # Au-delà de n^(1/4) (plus la marge de g), l'attaque ne peut plus réussir
+    limite = n.bit_length() // 4 + cofacteurs.bit_length() + 2
+    # p et q de même taille : 2√n ≤ p + q ≤ 3√n, ce qui borne s
+    racine_n = math.isqrt(n)
+    for k, denominateur in reduites(e, n):
+        if denominateur.bit_length() > limite:
+            break
+        if k == 0:
+            continue
+        produit = e * denominateur
+        s_min = max(1, produit - k * (n + 1 - 2 * racine_n))
+        s_max = min(cofacteurs, produit - k * (n + 1 - 3 * racine_n - 3))
+        s = s_min + (produit - s_min) % k
+        while s <= s_max:
+            phi = (produit - s) // k
+            somme = n - phi + 1
+            discriminant = somme * somme - 4 * n
+            racine = math.isqrt(discriminant)
+            if racine * racine == discriminant and (somme + racine) % 2 == 0:
+                p, q = (somme - racine) // 2, (somme + racine) // 2
+                if p > 1 and p * q == n:
+                    lambda_n = arithmetique_modulaire.ppcm(p - 1, q - 1)
+                    return arithmetique_modulaire.inverse_modulaire(e, lambda_n), p, q
+            s += k
+    return None
+
+
+def audit_magasin(chemin, executeur=None, lot=1024):
+    """
+    audit_magasin(chemin, executeur=None, lot=1024)
+    Applique l'attaque de Wiener à toutes les clés d'un magasin
+    (voir magasin_cles). Avec un executeur, les clés sont réparties
+    par lots de numéros entre les processus, qui ouvrent chacun le
+    magasin par mmap.
+
+    Paramètres:
+    chemin (str) : le fichier du magasin
+    executeur (concurrent.futures.Executor) : pool optionnel
+    lot (int) : nombre de clés par tâche
+
+    Return:
+    (list) : des tuples (numero, d, p, q) pour les clés cassées
+    """
+    import magasin_cles
+
+    with magasin_cles.MagasinCles(chemin) as magasin:
+        nombre = len(magasin)
+    tranches = [(chemin, debut, min(debut + lot, nombre)) for debut in range(0, nombre, lot)]
+    if executeur is None:
+        resultats = map(_audit_tranche, *zip(*tranches)) if tranches else []
+    else:
+        resultats = executeur.map(_audit_tranche, *zip(*tranches)) if tranches else []
+    return [cassee for tranche in resultats for cassee in tranche]
+
+
+def _audit_tranche(chemin, debut, fin):
+    """
+    _audit_tranche(chemin, debut, fin)
+    Attaque les clés debut .. fin - 1 du magasin.
+
+    Return:
+    (list) : des tuples (numero, d, p, q)
+    """
+    import magasin_cles
+
+    cassees = []
+    with magasin_cles.MagasinCles(chemin) as magasin:
+        for numero in range(debut, fin):
+            resultat = wiener(magasin.publique(numero))
+            if resultat is not None:
+                cassees.append((numero, *resultat))
+    return cassees
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    import magasin_cles
+    import primalite
+    from cle_rsa import ClePubliqueRSA
+
+    def cle_faible(bits):
+        # d tiré sous n^(1/4) / 3, e = d^-1 mod λ(n)
+        p = primalite.premier_aleatoire(3 << (bits // 2 - 2), 1 << (bits // 2))
+        q = primalite.premier_aleatoire(3 << (bits // 2 - 2), 1 << (bits // 2))
+        n = p * q
+        lambda_n = arithmetique_modulaire.ppcm(p - 1, q - 1)
+        while True:
+            d = random.randrange(3, (math.isqrt(math.isqrt(n)) // 3) >> 4, 2)
+            if math.gcd(d, lambda_n) == 1:
+                return ClePubliqueRSA(arithmetique_modulaire.inverse_modulaire(d, lambda_n), n), d, p, q
+
+    for bits in (512, 1024, 2048):
+        publique, d, p, q = cle_faible(bits)
+        t0 = time.perf_counter()
+        assert wiener(publique) == (d, min(p, q), max(p, q))
+        print(f"clé de {bits} bits, d de {d.bit_length()} bits : cassée en {1000 * (time.perf_counter() - t0):.2f} ms")
+
+    # Un magasin de 10 000 clés de 1024 bits dont 20 faibles
+    nombre, faibles = 10 ** 4, 20
+    cles = [cle_faible(1024)[0] for _ in range(faibles)]
+    cles += [ClePubliqueRSA(random.getrandbits(1023) | 1, random.getrandbits(1024) | 1 << 1023)
+             for _ in range(nombre - faibles)]
+    random.shuffle(cles)
+    with tempfile.TemporaryDirectory() as repertoire:
+        chemin = os.path.join(repertoire, "cles.bin")
+        magasin_cles.ecrit_magasin(chemin, cles)
+        t0 = time.perf_counter()
+        cassees = audit_magasin(chemin)
+        duree = time.perf_counter() - t0
+    assert len(cassees) == faibles
+    print(f"audit de {nombre} clés : {len(cassees)} cassées en {duree:.2f} s ({nombre / duree:.0f} clés/s)")
@@ -0,0 +1,339 @@
+# batch_gcd.py
+# PGCD par lots de Bernstein : on cherche, parmi un ensemble de modules
+# RSA, tous ceux qui partagent un facteur premier avec un autre.
+# Arbre des produits puis arbre des restes : quasi linéaire au lieu des
+# n²/2 calculs de pgcd deux à deux.
+# Chaque niveau d'arbre est parcouru dans l'ordre : quand l'arbre ne
+# tient pas dans la mémoire permise, les niveaux sont écrits sur disque
+# et relus en flux.
+import math
+import os
+import tempfile
+
+
+# Mémoire permise pour garder l'arbre en RAM (octets)
+MEMOIRE = 2 ** 28
+
+# Taille (bits) à partir de laquelle on réduit par Barrett : la division
+# de CPython est quadratique, la multiplication (Karatsuba) ne l'est pas.
+SEUIL_BARRETT = 2 ** 19
+
+
+def lit_modules(chemin):
+    """
+    lit_modules(chemin)
+    Lit un fichier de modules : un entier par ligne, en décimal ou en
+    hexadécimal (préfixe 0x). Les lignes vides et celles commençant par
+    # sont ignorées.
+
+    Paramètres:
+    chemin (str) : le fichier
+
+    Return:
+    (list) : les modules
+    """
+    modules = []
+    with open(chemin) as fichier:
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if ligne and not ligne.startswith("#"):
+                modules.append(int(ligne, 0))
+    return modules
+
+
+def ecrit_modules(chemin, modules):
+    """
+    ecrit_modules(chemin, modules)
+    Écrit les modules dans un fichier lisible par lit_modules.
+
+    Paramètres:
+    chemin (str) : le fichier
+    modules (itérable) : les modules
+
+    Return:
+    Aucun
+    """
+    with open(chemin, "w") as fichier:
+        for n in modules:
+            fichier.write(f"{n}\n")
+
+
+# ========================================
+# RÉDUCTION SOUS-QUADRATIQUE
+# ========================================
+
+def _reciproque(m):
+    """
+    _reciproque(m)
+    Calcule ⌊4^b / m⌋ (b le nombre de bits de m) par la méthode de
+    Newton : on part de l'inverse des h ≈ b/2 bits de poids fort,
+    une itération double la précision, puis on corrige l'arrondi.
+
+    Paramètres:
+    m (int) : un entier positif
+
+    Return:
+    (int) : ⌊4^b / m⌋
+    """
+    b = m.bit_length()
+    if b <= SEUIL_BARRETT:
+        return (1 << (2 * b)) // m
+    h = b // 2 + 32
+    x = _reciproque(m >> (b - h)) << (b - h)
+    x += (x * ((1 << (2 * b)) - m * x)) >> (2 * b)
+    # Il reste une erreur de quelques unités : quotient court
+    return x + ((1 << (2 * b)) - m * x) // m
+
+
+def _reste(a, m):
+    """
+    _reste(a, m)
+    a mod m par réduction de Barrett pour les grands m, avec
+    a < 4^b où b est le nombre de bits de m; si a est plus grand,
+    on réduit d'abord modulo un multiple m⋅2^s assez large.
+
+    Paramètres:
+    a (int) : un entier positif
+    m (int) : le module
+
+    Return:
+    (int) : a mod m
+    """
+    b = m.bit_length()
+    if b <= SEUIL_BARRETT:
+        return a % m
+    s = max(0, (a.bit_length() + 1) // 2 - b)
+    grand = m << s
+    b += s
+    q = ((a >> (b - 1)) * _reciproque(grand)) >> (b + 1)
+    r = a - q * grand
+    while r >= grand:
+        r -= grand
+    return r % m if s else r
+
+
+# ========================================
+# NIVEAUX D'ARBRE
+# ========================================
+
+class _Niveau:
+    """
+    Classe _Niveau
+    Un niveau d'arbre, en mémoire (liste) ou dans un fichier
+    d'entiers préfixés par leur longueur. On ne le lit que dans l'ordre.
+    """
+
+    def __init__(self, entiers, repertoire=None, nom=None):
+        """
+        init (self, entiers, repertoire=None, nom=None)
+        Range les entiers du niveau.
+
+        Paramètres:
+        self : notre niveau
+        entiers (itérable) : les valeurs, dans l'ordre
+        repertoire (str) : si fourni, le niveau est écrit dans ce répertoire
+        nom (str) : nom du fichier du niveau
+
+        Return
+        Notre objet _Niveau
+        """
+        self.longueur = 0
+        if repertoire is None:
+            self.chemin = None
+            self.entiers = list(entiers)
+            self.longueur = len(self.entiers)
+            return
+
+        self.entiers = None
+        self.chemin = os.path.join(repertoire, nom)
+        with open(self.chemin, "wb") as fichier:
+            for x in entiers:
+                octets = x.to_bytes((x.bit_length() + 7) // 8, "little")
+                fichier.write(len(octets).to_bytes(8, "little"))
+                fichier.write(octets)
+                self.longueur += 1
+
+    def __len__(self):
+        return self.longueur
+
+    def __iter__(self):
+        if self.chemin is None:
+            yield from self.entiers
+            return
+        with open(self.chemin, "rb") as fichier:
+            while True:
+                entete = fichier.read(8)
+                if not entete:
+                    return
+                yield int.from_bytes(fichier.read(int.from_bytes(entete, "little")), "little")
+
+
+def _par_paires(entiers):
+    """
+    _par_paires(entiers)
+    Produits des éléments pris deux à deux (le dernier seul s'il
+    est impair).
+
+    Paramètres:
+    entiers (itérable)
+
+    Return:
+    (generator) : les produits
+    """
+    iterateur = iter(entiers)
+    for a in iterateur:
+        b = next(iterateur, None)
+        yield a if b is None else a * b
+
+
+def arbre_produits(modules, repertoire=None):
+    """
+    arbre_produits(modules, repertoire=None)
+    Arbre des produits : le niveau 0 contient les modules, chaque
+    niveau suivant les produits deux à deux du précédent, jusqu'au
+    produit de tous les modules.
+
+    Paramètres:
+    modules (list) : les modules
+    repertoire (str) : si fourni, les niveaux sont écrits sur disque
+
+    Return:
+    (list) : les niveaux (_Niveau), du bas vers la racine
+    """
+    niveaux = [_Niveau(modules, repertoire, "produits_0")]
+    while len(niveaux[-1]) > 1:
+        niveaux.append(_Niveau(_par_paires(niveaux[-1]), repertoire, f"produits_{len(niveaux)}"))
+    return niveaux
+
+
+def batch_gcd(modules, memoire=MEMOIRE, repertoire=None):
+    """
+    batch_gcd(modules, memoire=MEMOIRE, repertoire=None)
+    Pour chaque module N_i, calcule pgcd(N_i, P / N_i) où P est le
+    produit de tous les modules. On descend l'arbre des restes
+    R_i = R_parent mod N_i², puis pgcd(R_i / N_i, N_i) en bas.
+
+    Paramètres:
+    modules (list) : les modules
+    memoire (int) : au-delà de cette taille estimée (octets), l'arbre
+    est écrit sur disque
+    repertoire (str) : répertoire des niveaux sur disque (temporaire par défaut)
+
+    Return:
+    (list) : les pgcd, un par module (1 si le module ne partage rien)
+    """
+    if len(modules) < 2:
+        return [1] * len(modules)
+
+    # Chaque niveau a à peu près la taille de l'entrée
+    taille = sum((n.bit_length() + 7) // 8 for n in modules)
+    profondeur = (len(modules) - 1).bit_length() + 1
+    if repertoire is None and taille * profondeur * 3 <= memoire:
+        return _batch_gcd(modules, None)
+    if repertoire is not None:
+        return _batch_gcd(modules, repertoire)
+    with tempfile.TemporaryDirectory(prefix="batch_gcd_") as temporaire:
+        return _batch_gcd(modules, temporaire)
+
+
+def _batch_gcd(modules, repertoire):
+    """
+    _batch_gcd(modules, repertoire)
+    Corps de batch_gcd, niveaux en mémoire (repertoire None) ou sur disque.
+    """
+    niveaux = arbre_produits(modules, repertoire)
+    restes = niveaux.pop()
+    while niveaux:
+        niveau = niveaux.pop()
+
+        def descend(restes=restes, niveau=niveau):
+            # Chaque reste parent sert à ses deux enfants
+            parents = iter(restes)
+            for i, x in enumerate(niveau):
+                if i % 2 == 0:
+                    parent = next(parents)
+                yield _reste(parent, x * x)
+
+        restes = _Niveau(descend(), repertoire, f"restes_{len(niveaux)}")
+    return [math.gcd(r // n, n) for r, n in zip(restes, modules)]
+
+
+# ========================================
+# MODULES FAIBLES
+# ========================================
+
+def modules_faibles(modules, memoire=MEMOIRE, repertoire=None):
+    """
+    modules_faibles(modules, memoire=MEMOIRE, repertoire=None)
+    Trouve tous les modules qui partagent un facteur avec un autre
+    et retrouve leurs facteurs p et q.
+    Si le pgcd vaut N_i (les deux facteurs sont partagés, ou le module
+    est en double), on compare N_i aux seuls modules faibles deux à deux.
+
+    Paramètres:
+    modules (list) : les modules
+    memoire (int) : voir batch_gcd
+    repertoire (str) : voir batch_gcd
+
+    Return:
+    (list) : des tuples (indice, n, p, q) avec p ≤ q;
+    p et q valent None pour un module en double
+    """
+    pgcds = batch_gcd(modules, memoire, repertoire)
+    faibles = [i for i, g in enumerate(pgcds) if g != 1]
+
+    resultats = []
+    for i in faibles:
+        n, g = modules[i], pgcds[i]
+        if g == n:
+            g = next((h for h in (math.gcd(n, modules[j]) for j in faibles if j != i)
+                      if 1 < h < n), n)
+        if g == n:
+            resultats.append((i, n, None, None))
+        else:
+            p, q = g, n // g
+            resultats.append((i, n, min(p, q), max(p, q)))
+    return resultats
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    import primalite
+
+    if len(sys.argv) > 1:
+        for i, n, p, q in modules_faibles(lit_modules(sys.argv[1])):
+            print(f"module {i} : p = {p}, q = {q}")
+        sys.exit()
+
+    # Générateur faible : quelques clés réutilisent un premier déjà tiré.
+    bits = 512
+    for nombre in (500, 2000, 8000):
+        premiers = [primalite.trouve_premier(bits // 2) for _ in range(2 * nombre)]
+        for i in random.sample(range(nombre), nombre // 100):
+            premiers[2 * i] = premiers[2 * random.randrange(nombre)]
+        modules = [premiers[2 * i] * premiers[2 * i + 1] for i in range(nombre)]
+
+        t0 = time.perf_counter()
+        faibles = modules_faibles(modules)
+        duree_lot = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with tempfile.TemporaryDirectory() as repertoire:
+            assert modules_faibles(modules, 0, repertoire) == faibles
+        duree_disque = time.perf_counter() - t0
+
+        # Deux à deux : n²/2 pgcd, mesuré sur un échantillon au-delà de 2000 modules
+        echantillon = modules[:2000]
+        t0 = time.perf_counter()
+        partages = sum(math.gcd(a, b) != 1 for i, a in enumerate(echantillon) for b in echantillon[:i])
+        duree_paires = (time.perf_counter() - t0) * (nombre / len(echantillon)) ** 2
+
+        print(f"{nombre:5d} modules de {bits} bits, {len(faibles):3d} faibles : "
+              f"lot {duree_lot:6.2f} s, disque {duree_disque:6.2f} s, deux à deux {duree_paires:7.2f} s")
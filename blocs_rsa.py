@@ -0,0 +1,235 @@
+# blocs_rsa.py
+# Encodage des messages RSA par blocs d'octets : on regroupe autant
+# d'octets que possible sous n dans chaque entier, au lieu d'une
+# exponentiation par caractère.
+
+
+def taille_bloc(n):
+    """
+    taille_bloc(n)
+    Nombre d'octets de message par bloc : le plus grand k
+    tel que tout entier de k octets soit inférieur à n.
+
+    Paramètres:
+    n (int) : le module
+
+    Return:
+    (int) : la taille d'un bloc en octets
+    """
+    k = (n.bit_length() - 1) // 8
+    if k < 1:
+        raise ValueError("le module est trop petit pour contenir un octet")
+    return k
+
+
+def taille_chiffre(n):
+    """
+    taille_chiffre(n)
+    Nombre d'octets pour écrire un bloc chiffré (un entier < n).
+
+    Paramètres:
+    n (int) : le module
+
+    Return:
+    (int) : la taille d'un bloc chiffré en octets
+    """
+    return (n.bit_length() + 7) // 8
+
+
+def _morceaux(donnees):
+    """
+    _morceaux(donnees)
+    Accepte des octets ou un itérable de morceaux d'octets.
+
+    Paramètres:
+    donnees (bytes ou itérable de bytes)
+
+    Return:
+    (itérable) : les morceaux d'octets
+    """
+    if isinstance(donnees, (bytes, bytearray, memoryview)):
+        return (donnees,)
+    return donnees
+
+
+def encode(donnees, n):
+    """
+    encode(donnees, n)
+    Générateur qui découpe le message en blocs de taille_bloc(n)
+    octets et les convertit en entiers (grand-boutiste).
+    Le dernier bloc reçoit un bourrage 0x80 suivi de zéros
+    (ISO/IEC 7816-4) : il est toujours présent, ce qui permet
+    de retrouver la longueur exacte au décodage.
+
+    Paramètres:
+    donnees (bytes ou itérable de bytes) : le message, éventuellement
+    en plusieurs morceaux (lecture en continu)
+    n (int) : le module
+
+    Return:
+    (generator) : les blocs, des entiers inférieurs à n
+    """
+    k = taille_bloc(n)
+    tampon = bytearray()
+    for morceau in _morceaux(donnees):
+        tampon += morceau
+        nb_complets = len(tampon) // k
+        for i in range(nb_complets):
+            yield int.from_bytes(tampon[i * k:(i + 1) * k], "big")
+        del tampon[:nb_complets * k]
+
+    # Bourrage du dernier bloc
+    tampon.append(0x80)
+    tampon.extend(bytes(k - len(tampon)))
+    yield int.from_bytes(tampon, "big")
+
+
+def decode(blocs, n):
+    """
+    decode(blocs, n)
+    Générateur inverse de encode : reconvertit les blocs en octets
+    et retire le bourrage du dernier bloc.
+
+    Paramètres:
+    blocs (itérable) : les blocs (entiers)
+    n (int) : le module
+
+    Return:
+    (generator) : les morceaux d'octets du message
+    """
+    k = taille_bloc(n)
+    precedent = None
+    # On garde un bloc en réserve : seul le dernier porte le bourrage
+    for bloc in blocs:
+        if precedent is not None:
+            yield precedent.to_bytes(k, "big")
+        precedent = bloc
+    if precedent is None:
+        raise ValueError("aucun bloc à décoder")
+
+    dernier = precedent.to_bytes(k, "big").rstrip(b"\x00")
+    if not dernier.endswith(b"\x80"):
+        raise ValueError("bourrage invalide")
+    if len(dernier) > 1:
+        yield dernier[:-1]
+
+
+def chiffre_flux(donnees, cle):
+    """
+    chiffre_flux(donnees, cle)
+    Générateur qui chiffre le message bloc par bloc.
+
+    Paramètres:
+    donnees (bytes ou itérable de bytes) : le message
+    cle (ClePubliqueRSA) : la clé publique
+
+    Return:
+    (generator) : les blocs chiffrés (entiers)
+    """
+    for bloc in encode(donnees, cle.n):
+        yield cle.chiffre(bloc)
+
+
+def dechiffre_flux(chiffres, cle):
+    """
+    dechiffre_flux(chiffres, cle)
+    Générateur qui déchiffre les blocs et rend les octets du message.
+
+    Paramètres:
+    chiffres (itérable) : les blocs chiffrés (entiers)
+    cle (ClePriveeRSA) : la clé privée
+
+    Return:
+    (generator) : les morceaux d'octets du message
+    """
+    return decode((cle.dechiffre(c) for c in chiffres), cle.n)
+
+
+def chiffre(message, cle):
+    """
+    chiffre(message, cle)
+    Chiffre tout le message et rend la liste des blocs chiffrés.
+
+    Paramètres:
+    message (bytes) : le message
+    cle (ClePubliqueRSA) : la clé publique
+
+    Return:
+    (list) : les blocs chiffrés
+    """
+    return list(chiffre_flux(message, cle))
+
+
+def dechiffre(chiffres, cle):
+    """
+    dechiffre(chiffres, cle)
+    Déchiffre la liste des blocs et rend le message.
+
+    Paramètres:
+    chiffres (list) : les blocs chiffrés
+    cle (ClePriveeRSA) : la clé privée
+
+    Return:
+    (bytes) : le message
+    """
+    return b"".join(dechiffre_flux(chiffres, cle))
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def compare(message, publique, privee):
+    """
+    compare(message, publique, privee)
+    Compare le chiffrement caractère par caractère avec le
+    chiffrement par blocs : débit (octets/s) et expansion
+    (taille du chiffré / taille du message).
+
+    Paramètres:
+    message (bytes) : le message
+    publique (ClePubliqueRSA) : la clé publique
+    privee (ClePriveeRSA) : la clé privée
+
+    Return:
+    (dict) : {"caractere": (debit, expansion), "blocs": (debit, expansion)}
+
+    Exception:
+    ValueError : si le message est vide, ou si un aller-retour ne rend
+    pas le message
+    """
+    import time
+
+    if not message:
+        raise ValueError("message vide : ni débit ni expansion à mesurer")
+    largeur = taille_chiffre(publique.n)
+
+    # Un entier chiffré par octet du message
+    t0 = time.perf_counter()
+    chiffres = [publique.chiffre(octet) for octet in message]
+    if bytes(privee.dechiffre(c) for c in chiffres) != message:
+        raise ValueError("le déchiffrement caractère par caractère ne rend pas le message")
+    duree_caractere = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    blocs = chiffre(message, publique)
+    if dechiffre(blocs, privee) != message:
+        raise ValueError("le déchiffrement par blocs ne rend pas le message")
+    duree_blocs = time.perf_counter() - t0
+
+    return {
+        "caractere": (len(message) / duree_caractere, len(chiffres) * largeur / len(message)),
+        "blocs": (len(message) / duree_blocs, len(blocs) * largeur / len(message)),
+    }
+
+
+if __name__ == "__main__":
+    from cle_rsa import genere_cle
+
+    message = b"Alice est plus forte que Bob. " * 100
+    for taille in (512, 1024, 2048):
+        publique, privee = genere_cle(taille)
+        resultats = compare(message, publique, privee)
+        print(f"=== Module de {taille} bits, message de {len(message)} octets ===")
+        for nom, (debit, expansion) in resultats.items():
+            print(f"  {nom:9s} : {debit:10.0f} octets/s, expansion {expansion:6.2f}")
@@ -70,35 +70,55 @@ def encrypt(key, message):
     return secret
 
 
-# Vérifions que notre clé est bien générée
-key = generate_key(3)
-print(key)
-
-# Vérifions que le chiffrement fonctionne
-message = "AINSI VA LA VIE"
-secret = encrypt(key, message)
-print(secret)
-
-# Test du déchiffrement avec la clé inversée
-print("--- Test de déchiffrement ---")
-
-# Méthode 1: Utiliser 26-3 comme clf
-dkey_method1 = generate_key(26-3)
-decrypted1 = encrypt(dkey_method1, secret)
-print(f"Déchiffrement méthode 1 (26-3): {decrypted1}")
-
-# Méthode 2: Utiliser la clé inversée
-dkey_method2 = generate_dkey(key)
-decrypted2 = encrypt(dkey_method2, secret)
-print(f"Déchiffrement méthode 2 (clé inversée): {decrypted2}")
-print()
-
-
-# Attaque sur le chiffrement de César
-print("####################################")
-print("Attaque sur le chiffrement de César")
-for i in range(26):
-	dkey = generate_key(i)
-	message = encrypt(dkey, secret)
-	print(message)
-print("####################################")
+def demo_chiffrement():
+    """
+    demo_chiffrement()
+    Démonstration du chiffrement et des deux déchiffrements.
+
+    Return:
+    string : le message chiffré
+    """
+    # Vérifions que notre clé est bien générée
+    key = generate_key(3)
+    print(key)
+
+    # Vérifions que le chiffrement fonctionne
+    message = "AINSI VA LA VIE"
+    secret = encrypt(key, message)
+    print(secret)
+
+    # Test du déchiffrement avec la clé inversée
+    print("--- Test de déchiffrement ---")
+
+    # Méthode 1: Utiliser 26-3 comme clf
+    dkey_method1 = generate_key(26-3)
+    decrypted1 = encrypt(dkey_method1, secret)
+    print(f"Déchiffrement méthode 1 (26-3): {decrypted1}")
+
+    # Méthode 2: Utiliser la clé inversée
+    dkey_method2 = generate_dkey(key)
+    decrypted2 = encrypt(dkey_method2, secret)
+    print(f"Déchiffrement méthode 2 (clé inversée): {decrypted2}")
+    print()
+    return secret
+
+
+def demo_attaque(secret):
+    """
+    demo_attaque(secret)
+    Attaque sur le chiffrement de César : on essaie les 26 clés.
+
+    Paramètres:
+    secret (string): le message chiffré
+    """
+    print("####################################")
+    print("Attaque sur le chiffrement de César")
+    for i in range(26):
+        dkey = generate_key(i)
+        message = encrypt(dkey, secret)
+        print(message)
+    print("####################################")
+
+
+if __name__ == "__main__":
+    demo_attaque(demo_chiffrement())
@@ -0,0 +1,287 @@
+# cle_rsa.py
+# Objets clés RSA. Les exponentiations passent par pow(b, e, n) intégré
+# à Python; exponentiation.modexp reste l'alternative mesurée par son
+# banc d'essai, et garde alors ses constantes de Montgomery sur la clé.
+import arithmetique_modulaire
+
+
+class ClePubliqueRSA:
+    """
+    Classe ClePubliqueRSA
+    Clé publique RSA (e, n)
+    """
+
+    def __init__(self, e, n):
+        """
+        init (self, e, n)
+        Initialise la clé publique
+
+        Paramètres:
+        self : notre objet clé
+        e (int) : l'exposant public
+        n (int) : le module
+
+        Return
+        Notre objet ClePubliqueRSA
+        """
+        self.e = e
+        self.n = n
+        # Contexte de Montgomery, rempli par exponentiation.contexte
+        # si la clé est passée à modexp
+        self._montgomery = None
+
+    def __repr__(self):
+        return f"ClePubliqueRSA(e={self.e}, n={self.n})"
+
+    def chiffre(self, m):
+        """
+        chiffre(self, m)
+        Chiffre le message m : c = m^e mod n
+
+        Paramètres:
+        self : notre objet clé
+        m (int) : le message, 0 ≤ m < n
+
+        Return:
+        (int) : le message chiffré
+        """
+        return pow(m, self.e, self.n)
+
+    def verifie(self, signature):
+        """
+        verifie(self, signature)
+        Retrouve la valeur signée : h = signature^e mod n.
+        La signature est valide si h est le hachage du message.
+
+        Paramètres:
+        self : notre objet clé
+        signature (int)
+
+        Return:
+        (int) : la valeur de hachage signée
+        """
+        return pow(signature, self.e, self.n)
+
+
+def _exp_facteur(c, exposant, premier):
+    """
+    _exp_facteur(c, exposant, premier)
+    Exponentiation modulo un facteur premier, exécutée dans
+    un processus de travail.
+
+    Paramètres:
+    c (int) : le message chiffré
+    exposant (int) : d mod (premier - 1)
+    premier (int) : le facteur premier
+
+    Return:
+    (int) : c^exposant mod premier
+    """
+    return pow(c, exposant, premier)
+
+
+class ClePriveeRSA:
+    """
+    Classe ClePriveeRSA
+    Clé privée RSA. Si les facteurs premiers de n sont connus (deux ou
+    plus), on garde les exposants réduits d mod (r - 1) et les
+    coefficients de Garner, et les opérations privées passent par le
+    théorème des restes chinois : une exponentiation courte par facteur.
+    Avec deux premiers p et q, on retrouve dp, dq et qinv = q^-1 mod p.
+    Avec seulement (d, n), on fait l'exponentiation directe.
+    """
+
+    def __init__(self, d, n, *premiers):
+        """
+        init (self, d, n, *premiers)
+        Initialise la clé privée
+
+        Paramètres:
+        self : notre objet clé
+        d (int) : l'exposant privé
+        n (int) : le module
+        premiers (int) : les facteurs premiers distincts de n (optionnels),
+        p et q en premier
+
+        Return
+        Notre objet ClePriveeRSA
+        """
+        self.d = d
+        self.n = n
+        self.premiers = premiers
+        self._montgomery = None
+
+        self.p = self.q = self.dp = self.dq = self.qinv = None
+        self.exposants = []
+        self.coefficients = []
+        if not premiers:
+            return
+
+        produit = 1
+        for r in premiers:
+            produit *= r
+        if len(premiers) < 2 or produit != n:
+            raise ValueError("le produit des premiers doit être égal à n")
+
+        self.exposants = [d % (r - 1) for r in premiers]
+
+        # Ordre de recombinaison : q, p, puis r3, r4, ...
+        # Le coefficient de chaque facteur est l'inverse du produit
+        # des facteurs précédents (qinv = q^-1 mod p pour le deuxième).
+        ordre = [1, 0] + list(range(2, len(premiers)))
+        produit = premiers[1]
+        for i in ordre[1:]:
+            self.coefficients.append(arithmetique_modulaire.inverse_modulaire(produit, premiers[i]))
+            produit *= premiers[i]
+
+        self.p, self.q = premiers[0], premiers[1]
+        self.dp, self.dq = self.exposants[0], self.exposants[1]
+        self.qinv = self.coefficients[0]
+
+    def __repr__(self):
+        return f"ClePriveeRSA(n={self.n}, premiers={len(self.premiers)})"
+
+    def dechiffre(self, c, executeur=None):
+        """
+        dechiffre(self, c, executeur=None)
+        Déchiffre le message c : m = c^d mod n
+
+        Paramètres:
+        self : notre objet clé
+        c (int) : le message chiffré
+        executeur (concurrent.futures.Executor) : si fourni, les
+        exponentiations par facteur tournent en parallèle dans ce pool
+
+        Return:
+        (int) : le message en clair
+        """
+        if not self.premiers:
+            return pow(c, self.d, self.n)
+
+        # Une exponentiation modulo chacun des facteurs
+        if executeur is None:
+            restes = [pow(c, dr, r) for dr, r in zip(self.exposants, self.premiers)]
+        else:
+            taches = [executeur.submit(_exp_facteur, c, dr, r)
+                      for dr, r in zip(self.exposants, self.premiers)]
+            restes = [tache.result() for tache in taches]
+
+        # Recombinaison de Garner, en commençant par q :
+        # m = m_q + q⋅(qinv⋅(m_p - m_q) mod p), puis un facteur à la fois
+        m = restes[1]
+        produit = self.q
+        ordre = [0] + list(range(2, len(self.premiers)))
+        for i, coefficient in zip(ordre, self.coefficients):
+            r = self.premiers[i]
+            h = coefficient * (restes[i] - m) % r
+            m += produit * h
+            produit *= r
+        return m
+
+    def signe(self, h, executeur=None):
+        """
+        signe(self, h, executeur=None)
+        Signe la valeur de hachage h : s = h^d mod n
+
+        Paramètres:
+        self : notre objet clé
+        h (int) : la valeur de hachage, 0 ≤ h < n
+        executeur (concurrent.futures.Executor) : pool optionnel
+
+        Return:
+        (int) : la signature
+        """
+        return self.dechiffre(h, executeur)
+
+
+def genere_cle(bits, nb_premiers=2, e=65537):
+    """
+    genere_cle(bits, nb_premiers=2, e=65537)
+    Génère une paire de clés RSA dont le module de bits bits est le
+    produit de nb_premiers premiers distincts de taille égale.
+    λ(n) est le ppcm de tous les (r - 1).
+
+    Paramètres:
+    bits (int) : taille du module en bits
+    nb_premiers (int) : nombre de facteurs premiers (2 à 4 en pratique)
+    e (int) : l'exposant public
+
+    Return:
+    (tuple) : (ClePubliqueRSA, ClePriveeRSA)
+    """
+    import primalite
+
+    while True:
+        premiers = []
+        reste = bits
+        for i in range(nb_premiers):
+            taille = reste // (nb_premiers - i)
+            reste -= taille
+            # Les deux bits de poids fort à 1 garantissent la taille du produit
+            while True:
+                r = primalite.premier_aleatoire(3 << (taille - 2), 1 << taille)
+                if r not in premiers and arithmetique_modulaire.pgcd(e, r - 1) == 1:
+                    break
+            premiers.append(r)
+
+        n = 1
+        lambda_n = 1
+        for r in premiers:
+            n *= r
+            lambda_n = arithmetique_modulaire.ppcm(lambda_n, r - 1)
+        if n.bit_length() == bits:
+            break
+
+    d = arithmetique_modulaire.inverse_modulaire(e, lambda_n)
+    return ClePubliqueRSA(e, n), ClePriveeRSA(d, n, *premiers)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_crt(bits, repetitions):
+    """
+    benchmark_crt(bits, repetitions)
+    Compare le déchiffrement par exponentiation directe avec le
+    chemin CRT à 2, 3 et 4 premiers pour un module de bits bits,
+    puis le chemin CRT avec un petit pool de processus.
+
+    Paramètres:
+    bits (int) : taille du module en bits
+    repetitions (int) : nombre de déchiffrements par méthode
+
+    Return:
+    Aucun
+    """
+    import os
+    import random
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    def mesure(cle, chiffres, messages, executeur=None):
+        t0 = time.perf_counter()
+        if [cle.dechiffre(c, executeur) for c in chiffres] != messages:
+            raise ValueError("le déchiffrement ne rend pas les messages")
+        return 1000 * (time.perf_counter() - t0) / len(chiffres)
+
+    for k in (2, 3, 4):
+        publique, privee = genere_cle(bits, k)
+        messages = [random.randrange(publique.n) for _ in range(repetitions)]
+        chiffres = [publique.chiffre(m) for m in messages]
+
+        if k == 2:
+            directe = ClePriveeRSA(privee.d, privee.n)
+            print(f"{bits:5d} bits, directe      : {mesure(directe, chiffres, messages):8.2f} ms")
+        print(f"{bits:5d} bits, CRT {k} premiers : {mesure(privee, chiffres, messages):8.2f} ms")
+
+        with ProcessPoolExecutor(max_workers=min(k, os.cpu_count() or 1)) as pool:
+            # Un premier appel démarre les processus du pool
+            privee.dechiffre(chiffres[0], pool)
+            duree = mesure(privee, chiffres, messages, pool)
+        print(f"{bits:5d} bits, CRT {k} premiers, pool : {duree:8.2f} ms")
+
+
+if __name__ == "__main__":
+    for taille in (1024, 2048):
+        benchmark_crt(taille, 10)
@@ -0,0 +1,280 @@
+# course_factorisation.py
+# Course entre méthodes de factorisation : on ne sait pas à l'avance
+# laquelle cassera n (petits facteurs, p et q proches, p - 1 friable,
+# facteur déséquilibré...). Plusieurs stratégies tournent en même temps
+# dans des processus, chacune avec son budget de temps; la première qui
+# trouve un facteur gagne et les autres sont arrêtées. Un historique des
+# gagnants par taille de n décide de l'ordre de départ des courses suivantes.
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+import factorisation
+import primalite
+
+
+# ========================================
+# STRATÉGIES
+# ========================================
+
+def _division(n):
+    return factorisation.division_essai(n, 10 ** 6)
+
+
+def _fermat(n):
+    return factorisation.fermat(n, 10 ** 6)
+
+
+def _p_moins_1(n):
+    return factorisation.pollard_p_moins_1(n, 10 ** 4, 10 ** 6)
+
+
+def _rho(n):
+    c = 1
+    p = False
+    while not p:
+        p = factorisation.pollard_rho_brent(n, c)
+        c += 1
+    return p
+
+
+def _ecm(n):
+    import ecm
+    resultat = ecm.facteurs(n, 30)
+    return resultat[0] if resultat else False
+
+
+def _siqs(n):
+    import crible_quadratique
+    # Le crible ne sépare pas les puissances d'un premier
+    return (factorisation.puissance_parfaite(n)
+            or crible_quadratique.siqs_essais(n, factorisation.ESSAIS_CRIBLE))
+
+
+# Stratégies dans l'ordre par défaut : (nom, fonction, budget en secondes,
+# taille minimale de n en bits)
+STRATEGIES = (
+    ("division", _division, 2.0, 0),
+    ("fermat", _fermat, 2.0, 0),
+    ("p-1", _p_moins_1, 10.0, 0),
+    ("rho", _rho, 60.0, 0),
+    ("ecm", _ecm, 120.0, 0),
+    ("siqs", _siqs, 600.0, 64),
+)
+
+
+# ========================================
+# HISTORIQUE DES GAGNANTS
+# ========================================
+
+class Historique:
+    """
+    Classe Historique
+    Nombre de victoires de chaque stratégie par tranche de 8 bits
+    de n. Enregistré en JSON si un chemin est donné.
+    """
+
+    def __init__(self, chemin=None):
+        """
+        init (self, chemin=None)
+        Charge l'historique depuis chemin s'il existe.
+
+        Paramètres:
+        self : notre historique
+        chemin (str) : fichier JSON de l'historique (optionnel)
+
+        Return
+        Notre objet Historique
+        """
+        self.chemin = chemin
+        self.victoires = {}
+        if chemin is not None and os.path.exists(chemin):
+            with open(chemin) as fichier:
+                self.victoires = {int(tranche): compte for tranche, compte in json.load(fichier).items()}
+
+    @staticmethod
+    def tranche(bits):
+        return bits // 8 * 8
+
+    def enregistre(self, bits, nom):
+        """
+        enregistre(self, bits, nom)
+        Compte une victoire de nom pour un n de bits bits.
+
+        Paramètres:
+        self : notre historique
+        bits (int) : taille de n
+        nom (str) : la stratégie gagnante
+
+        Return:
+        Aucun
+        """
+        compte = self.victoires.setdefault(self.tranche(bits), {})
+        compte[nom] = compte.get(nom, 0) + 1
+        if self.chemin is not None:
+            with open(self.chemin, "w") as fichier:
+                json.dump(self.victoires, fichier, indent=1)
+
+    def ordre(self, bits, noms):
+        """
+        ordre(self, bits, noms)
+        Trie les stratégies par nombre de victoires dans la tranche
+        de n, ou dans la tranche connue la plus proche. À égalité,
+        l'ordre de noms est conservé.
+
+        Paramètres:
+        self : notre historique
+        bits (int) : taille de n
+        noms (list) : les stratégies, dans l'ordre par défaut
+
+        Return:
+        (list) : les stratégies dans l'ordre de départ
+        """
+        if not self.victoires:
+            return list(noms)
+        tranche = min(self.victoires, key=lambda t: (abs(t - self.tranche(bits)), t))
+        compte = self.victoires[tranche]
+        return sorted(noms, key=lambda nom: -compte.get(nom, 0))
+
+
+# Historique partagé par les courses d'une même session
+HISTORIQUE = Historique()
+
+
+# ========================================
+# COURSE
+# ========================================
+
+def _coureur(fonction, n, connexion):
+    """
+    _coureur(fonction, n, connexion)
+    Point d'entrée d'un processus : envoie le facteur trouvé
+    (ou False) par la connexion.
+    """
+    connexion.send(fonction(n))
+    connexion.close()
+
+
+def course(n, travailleurs=None, budgets=None, noms=None, historique=None):
+    """
+    course(n, travailleurs=None, budgets=None, noms=None, historique=None)
+    Lance les stratégies dans l'ordre donné par l'historique, au plus
+    travailleurs à la fois. Une stratégie qui dépasse son budget est
+    arrêtée et la suivante démarre; dès qu'un facteur arrive, toutes
+    les autres sont arrêtées et la victoire est enregistrée.
+    Les processus sont arrêtés par terminate(), ce qu'un pool de
+    concurrent.futures ne permet pas pour une tâche déjà commencée.
+
+    Paramètres:
+    n (int) : le nombre que l'on veut factoriser
+    travailleurs (int) : nombre de processus simultanés (os.cpu_count() par défaut)
+    budgets (dict) : budgets en secondes qui remplacent ceux de STRATEGIES
+    noms (list) : ne faire courir que ces stratégies
+    historique (Historique) : historique des gagnants (HISTORIQUE par défaut)
+
+    Return:
+    (tuple) : (p, q, gagnant) avec p ≤ q
+    None : si n est premier, inférieur à 4, ou si tous les budgets sont épuisés
+    """
+    if n < 4 or primalite.est_premier(n):
+        return None
+    if historique is None:
+        historique = HISTORIQUE
+    if travailleurs is None:
+        travailleurs = os.cpu_count() or 1
+    budgets = budgets or {}
+
+    bits = n.bit_length()
+    strategies = {nom: (fonction, budgets.get(nom, budget))
+                  for nom, fonction, budget, bits_min in STRATEGIES
+                  if bits >= bits_min and (noms is None or nom in noms)}
+    en_attente = deque(historique.ordre(bits, list(strategies)))
+
+    # connexion -> (nom, processus, échéance)
+    actifs = {}
+    try:
+        while en_attente or actifs:
+            while en_attente and len(actifs) < travailleurs:
+                nom = en_attente.popleft()
+                fonction, budget = strategies[nom]
+                lecture, ecriture = multiprocessing.Pipe(duplex=False)
+                processus = multiprocessing.Process(target=_coureur, args=(fonction, n, ecriture), daemon=True)
+                processus.start()
+                ecriture.close()
+                actifs[lecture] = (nom, processus, time.monotonic() + budget)
+
+            echeance = min(e for _, _, e in actifs.values())
+            for connexion in wait(list(actifs), timeout=max(0.0, echeance - time.monotonic())):
+                nom, processus, _ = actifs.pop(connexion)
+                try:
+                    p = connexion.recv()
+                except EOFError:
+                    p = False
+                connexion.close()
+                processus.join()
+                if p and 1 < p < n:
+                    historique.enregistre(bits, nom)
+                    q = n // p
+                    return min(p, q), max(p, q), nom
+
+            maintenant = time.monotonic()
+            for connexion, (nom, processus, e) in list(actifs.items()):
+                if e <= maintenant:
+                    processus.terminate()
+                    processus.join()
+                    connexion.close()
+                    del actifs[connexion]
+    finally:
+        for connexion, (_, processus, _) in actifs.items():
+            processus.terminate()
+            processus.join()
+            connexion.close()
+    return None
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import random
+
+    def premier(bits):
+        return primalite.premier_aleatoire(1 << (bits - 1), 1 << bits)
+
+    def friable(bits):
+        # p - 1 = 2 ⋅ (petits premiers distincts) : cible de Pollard p-1
+        while True:
+            p = 2
+            for r in random.sample(primalite.PETITS_PREMIERS[1:], len(primalite.PETITS_PREMIERS) - 1):
+                if p.bit_length() >= bits:
+                    break
+                p *= r
+            if primalite.est_premier(p + 1):
+                return p + 1
+
+    def proches(bits):
+        p = premier(bits)
+        return p, primalite.premier_aleatoire(p + 2, p + 2 ** (bits // 3))
+
+    cas = [
+        ("équilibré 64 bits", lambda: premier(32) * premier(32)),
+        ("équilibré 80 bits", lambda: premier(40) * premier(40)),
+        ("p et q proches 160 bits", lambda: (lambda p, q: p * q)(*proches(80))),
+        ("p - 1 friable 160 bits", lambda: friable(80) * premier(80)),
+        ("déséquilibré 40 + 200 bits", lambda: premier(40) * premier(200)),
+        ("équilibré 110 bits", lambda: premier(55) * premier(55)),
+    ]
+    for tour in (1, 2):
+        print(f"=== Tour {tour} ===")
+        for description, fabrique in cas:
+            n = fabrique()
+            ordre = HISTORIQUE.ordre(n.bit_length(), [s[0] for s in STRATEGIES])
+            t0 = time.perf_counter()
+            p, q, gagnant = course(n)
+            assert p * q == n
+            print(f"{description:28s} : {gagnant:8s} en {time.perf_counter() - t0:7.2f} s "
+                  f"(ordre {', '.join(ordre[:3])}, ...)")
@@ -0,0 +1,502 @@
+# crible_quadratique.py
+# Crible quadratique auto-initialisant (SIQS) pour les modules de 100 à
+# 200 bits, hors de portée de Pollard rho. Le criblage utilise NumPy
+# s'il est installé (additions par tranches), sinon une boucle Python.
+import math
+import random
+
+import arithmetique_modulaire
+import factorisation
+import primalite
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Paramètres selon la taille de n (bits) :
+# (taille max, nombre de premiers de la base, demi-largeur M du crible)
+PARAMETRES = (
+    (100, 180, 32768),
+    (120, 400, 32768),
+    (140, 800, 65536),
+    (160, 1400, 65536),
+    (180, 2400, 98304),
+    (200, 3600, 131072),
+)
+
+# Les premiers inférieurs à cette borne ne sont pas criblés :
+# ils coûtent cher (beaucoup de positions) et rapportent peu.
+PETIT_PREMIER = 30
+
+
+# ========================================
+# OUTILS
+# ========================================
+
+def racine_modulaire(a, p):
+    """
+    racine_modulaire(a, p)
+    Calcule une racine carrée de a modulo le premier p
+    (algorithme de Tonelli-Shanks).
+
+    Paramètres:
+    a (int) : un résidu quadratique modulo p
+    p (int) : un nombre premier
+
+    Return:
+    (int) : r tel que r² ≡ a (mod p)
+    """
+    a %= p
+    if p == 2 or a == 0:
+        return a
+    if p % 4 == 3:
+        return pow(a, (p + 1) // 4, p)
+
+    # p - 1 = q * 2^s avec q impair
+    q = p - 1
+    s = 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    # Un non-résidu z
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+
+    m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) // 2, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+
+def _parametres(n):
+    """
+    _parametres(n)
+    Choisit la taille de la base de facteurs et du crible.
+
+    Paramètres:
+    n (int) : le nombre à factoriser
+
+    Return:
+    (tuple) : (nombre de premiers, demi-largeur M)
+    """
+    bits = n.bit_length()
+    for limite, taille_base, m in PARAMETRES:
+        if bits <= limite:
+            return taille_base, m
+    return 5000, 196608
+
+
+def base_de_facteurs(n, taille):
+    """
+    base_de_facteurs(n, taille)
+    Construit la base de facteurs : les premiers p pour lesquels n
+    est un résidu quadratique, avec une racine t de n modulo p
+    et l'approximation entière de log2(p) utilisée au criblage.
+
+    Paramètres:
+    n (int) : le nombre à factoriser
+    taille (int) : nombre de premiers voulus
+
+    Return:
+    (list) : des triplets (p, t, log2 p)
+    (int) : un facteur de n s'il divise n (cas dégénéré)
+    """
+    base = [(2, n % 2, 1)]
+    limite = 2048
+    while True:
+        for p in primalite.crible_eratosthene(limite)[1:]:
+            if p <= base[-1][0]:
+                continue
+            reste = n % p
+            if reste == 0:
+                return p
+            # Critère d'Euler : n est un carré modulo p
+            if pow(reste, (p - 1) // 2, p) == 1:
+                base.append((p, racine_modulaire(reste, p), round(math.log2(p))))
+                if len(base) == taille:
+                    return base
+        limite *= 2
+
+
+# ========================================
+# ALGÈBRE LINÉAIRE SUR GF(2)
+# ========================================
+
+def dependances(vecteurs, nb_colonnes):
+    """
+    dependances(vecteurs, nb_colonnes)
+    Élimination de Gauss sur GF(2). Chaque ligne de la matrice est
+    un entier dont le bit j est la parité de l'exposant du j-ième
+    facteur. On garde pour chaque ligne l'ensemble (en bits) des
+    relations qui la composent.
+
+    Paramètres:
+    vecteurs (list) : les lignes, des entiers
+    nb_colonnes (int) : nombre de colonnes
+
+    Return:
+    (list) : chaque dépendance est un entier dont les bits à 1
+    désignent des relations dont le produit est un carré
+    """
+    lignes = list(vecteurs)
+    historique = [1 << i for i in range(len(lignes))]
+    pivot_utilise = [False] * len(lignes)
+
+    for colonne in range(nb_colonnes):
+        bit = 1 << colonne
+        pivot = None
+        for i, ligne in enumerate(lignes):
+            if not pivot_utilise[i] and ligne & bit:
+                pivot = i
+                break
+        if pivot is None:
+            continue
+        pivot_utilise[pivot] = True
+        ligne_pivot = lignes[pivot]
+        histo_pivot = historique[pivot]
+        for i, ligne in enumerate(lignes):
+            if i != pivot and ligne & bit:
+                lignes[i] = ligne ^ ligne_pivot
+                historique[i] ^= histo_pivot
+
+    return [historique[i] for i, ligne in enumerate(lignes) if ligne == 0]
+
+
+# ========================================
+# SIQS
+# ========================================
+
+def _choisit_a(n, base, m, deja_vus):
+    """
+    _choisit_a(n, base, m, deja_vus)
+    Choisit le coefficient A = q1⋅q2⋅...⋅qs du polynôme, produit de
+    premiers de la base proche de √(2n) / M.
+
+    Paramètres:
+    n (int) : le nombre à factoriser
+    base (list) : la base de facteurs
+    m (int) : demi-largeur du crible
+    deja_vus (set) : les A déjà utilisés
+
+    Return:
+    (list) : les indices dans la base des premiers qui composent A
+    """
+    cible = math.isqrt(2 * n) // m
+    # On pioche dans le tiers supérieur de la base, hors des petits premiers
+    debut = max(len(base) // 3, 1)
+    while base[debut][0] < 400 and debut < len(base) - 10:
+        debut += 1
+    candidats = list(range(debut, len(base)))
+    taille_moyenne = math.log(base[(debut + len(base)) // 2][0])
+    s = max(2, round(math.log(cible) / taille_moyenne))
+    s = min(s, len(candidats) - 1)
+
+    for _ in range(1000):
+        indices = random.sample(candidats, s - 1)
+        produit = 1
+        for i in indices:
+            produit *= base[i][0]
+        # Le dernier premier ramène le produit au plus près de la cible
+        voulu = cible // produit
+        meilleur = min((i for i in range(1, len(base)) if i not in indices),
+                       key=lambda i: abs(base[i][0] - voulu))
+        indices.append(meilleur)
+        cle = frozenset(indices)
+        if cle not in deja_vus:
+            deja_vus.add(cle)
+            return sorted(indices)
+    raise RuntimeError("plus de coefficient A disponible")
+
+
+def _crible(m, racines, base, debut):
+    """
+    _crible(m, racines, base, debut)
+    Additionne log2(p) à chaque position x du crible telle que
+    p divise Q(x). La position i représente x = i - m.
+
+    Paramètres:
+    m (int) : demi-largeur du crible
+    racines (list) : pour chaque premier, ses deux positions de départ
+    base (list) : la base de facteurs
+    debut (int) : indice du premier premier criblé
+
+    Return:
+    (list ou numpy.ndarray) : les logarithmes accumulés
+    """
+    taille = 2 * m
+    if np is not None:
+        crible = np.zeros(taille, dtype=np.uint8)
+        for i in range(debut, len(base)):
+            r = racines[i]
+            if r is None:
+                continue
+            p, _, logp = base[i]
+            crible[r[0]::p] += logp
+            if r[1] != r[0]:
+                crible[r[1]::p] += logp
+        return crible
+
+    crible = [0] * taille
+    for i in range(debut, len(base)):
+        r = racines[i]
+        if r is None:
+            continue
+        p, _, logp = base[i]
+        for depart in set(r):
+            for j in range(depart, taille, p):
+                crible[j] += logp
+    return crible
+
+
+def _candidats(crible, seuil):
+    """
+    _candidats(crible, seuil)
+    Positions du crible dont la somme dépasse le seuil.
+
+    Paramètres:
+    crible (list ou numpy.ndarray) : les logarithmes accumulés
+    seuil (int)
+
+    Return:
+    (list) : les positions retenues
+    """
+    if np is not None:
+        return np.nonzero(crible > seuil)[0].tolist()
+    return [i for i, v in enumerate(crible) if v > seuil]
+
+
+def siqs(n):
+    """
+    siqs(n)
+    Crible quadratique auto-initialisant. On cherche des x tels que
+    (A x + b)² - n = A⋅Q(x) se factorise sur la base de facteurs;
+    un produit de telles relations qui donne un carré Y² fournit
+    X² ≡ Y² (mod n), et gcd(X - Y, n) est un facteur avec
+    probabilité 1/2. Les relations partielles (un seul grand premier
+    en dehors de la base) sont gardées et combinées par paires.
+
+    Paramètres:
+    n (int) : un composé impair, sans petit facteur, qui n'est pas un carré
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si ne trouve pas
+    """
+    taille_base, m = _parametres(n)
+    base = base_de_facteurs(n, taille_base)
+    if isinstance(base, int):
+        return base
+
+    nb_colonnes = len(base) + 1          # colonne 0 : le signe
+    p_max = base[-1][0]
+    grand_premier_max = p_max * 64
+    debut = next(i for i, (p, _, _) in enumerate(base) if p >= PETIT_PREMIER)
+
+    # Seuil : log2 de la valeur typique de Q(x), moins la marge
+    # pour les petits premiers non criblés et le grand premier.
+    seuil = int(math.log2(m * math.isqrt(n)) - 2.2 * math.log2(p_max))
+
+    relations = []                       # (u, exposants, facteur_extra)
+    vus = set()                          # u déjà obtenus, au signe près
+    partielles = {}                      # grand premier -> relation
+    deja_vus = set()
+
+    while len(relations) < nb_colonnes + 20:
+        # ----- Nouveau coefficient A et ses B_l -----
+        indices_a = _choisit_a(n, base, m, deja_vus)
+        a = 1
+        for i in indices_a:
+            a *= base[i][0]
+        B = []
+        for i in indices_a:
+            q, t, _ = base[i]
+            a_q = a // q
+            gamma = t * arithmetique_modulaire.inverse_modulaire(a_q, q) % q
+            if gamma > q // 2:
+                gamma = q - gamma
+            B.append(a_q * gamma)
+        b = sum(B)
+        s = len(B)
+
+        # Pour chaque premier : A^-1 mod p, les positions des deux
+        # racines de Q pour b et les décalages 2⋅B_l⋅A^-1 mod p.
+        exclus = set(indices_a)
+        racines = [None] * len(base)
+        decalages = [None] * len(base)
+        for i in range(debut, len(base)):
+            if i in exclus:
+                continue
+            p, t, _ = base[i]
+            ainv = arithmetique_modulaire.inverse_modulaire(a % p, p)
+            racines[i] = [((t - b) * ainv + m) % p, ((-t - b) * ainv + m) % p]
+            decalages[i] = [2 * bl * ainv % p for bl in B]
+
+        # ----- Les 2^(s-1) polynômes de ce A, en code de Gray -----
+        # Le bit l du code de Gray de k donne le signe de B_(l+1) dans b;
+        # B_0 reste positif. Entre deux polynômes, un seul signe change :
+        # b et les racines se mettent à jour par une addition.
+        for k in range(1 << (s - 1)):
+            if k > 0:
+                v = (k & -k).bit_length() - 1
+                sens = -1 if ((k ^ (k >> 1)) >> v) & 1 else 1
+                b += 2 * sens * B[v + 1]
+                for i in range(debut, len(base)):
+                    r = racines[i]
+                    if r is None:
+                        continue
+                    p = base[i][0]
+                    d = decalages[i][v + 1]
+                    if sens > 0:
+                        r[0] = (r[0] - d) % p
+                        r[1] = (r[1] - d) % p
+                    else:
+                        r[0] = (r[0] + d) % p
+                        r[1] = (r[1] + d) % p
+            c = (b * b - n) // a
+
+            crible = _crible(m, racines, base, debut)
+
+            for position in _candidats(crible, seuil):
+                x = position - m
+                q_x = (a * x + 2 * b) * x + c
+                u = a * x + b
+                exposants = [0] * nb_colonnes
+                if q_x < 0:
+                    exposants[0] = 1
+                    q_x = -q_x
+                if q_x == 0:
+                    continue
+                for j, (p, _, _) in enumerate(base):
+                    while q_x % p == 0:
+                        q_x //= p
+                        exposants[j + 1] += 1
+                # Les premiers de A divisent A⋅Q(x)
+                for i in indices_a:
+                    exposants[i + 1] += 1
+
+                # Une relation en double ne donne qu'une dépendance triviale
+                cle = min(u % n, -u % n)
+                if cle in vus:
+                    continue
+                if q_x == 1:
+                    vus.add(cle)
+                    relations.append((u, exposants, 1))
+                elif q_x < grand_premier_max:
+                    # Relation partielle : q_x est premier (q_x < p_max²)
+                    autre = partielles.pop(q_x, None)
+                    if autre is None:
+                        partielles[q_x] = (u, exposants)
+                    else:
+                        u2, exposants2 = autre
+                        vus.add(cle)
+                        somme = [e1 + e2 for e1, e2 in zip(exposants, exposants2)]
+                        relations.append((u * u2 % n, somme, q_x))
+
+            if len(relations) >= nb_colonnes + 20:
+                break
+
+    # ----- Algèbre linéaire et racine carrée -----
+    vecteurs = []
+    for _, exposants, _ in relations:
+        vecteur = 0
+        for j, e in enumerate(exposants):
+            if e & 1:
+                vecteur |= 1 << j
+        vecteurs.append(vecteur)
+
+    for dependance in dependances(vecteurs, nb_colonnes):
+        x = 1
+        y = 1
+        total = [0] * nb_colonnes
+        for i, (u, exposants, extra) in enumerate(relations):
+            if (dependance >> i) & 1:
+                x = x * u % n
+                y = y * extra % n
+                for j, e in enumerate(exposants):
+                    total[j] += e
+        for j in range(1, nb_colonnes):
+            if total[j]:
+                y = y * pow(base[j - 1][0], total[j] // 2, n) % n
+        g = math.gcd(x - y, n)
+        if 1 < g < n:
+            return g
+    return False
+
+
+def siqs_essais(n, essais):
+    """
+    siqs_essais(n, essais)
+    Relance siqs au plus essais fois (un appel peut échouer si toutes
+    les dépendances donnent un facteur trivial).
+
+    Paramètres:
+    n (int) : comme pour siqs
+    essais (int) : nombre maximal d'appels
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si aucun appel n'a abouti
+    """
+    for _ in range(essais):
+        p = siqs(n)
+        if p:
+            return p
+    return False
+
+
+def facteurs(n):
+    """
+    facteurs(n)
+    Même interface que factorisation.facteurs, mais par le crible
+    quadratique pour les n d'au moins 64 bits (les plus petits
+    sont laissés au portefeuille de factorisation.py).
+
+    Paramètres:
+    n (int) : le nombre que l'on veut factoriser
+
+    Return:
+    p (int) : premier facteur (le plus petit)
+    q (int) : deuxième facteur
+    None : si n est premier ou inférieur à 4
+    """
+    if n.bit_length() < 64 or primalite.est_premier(n):
+        return factorisation.facteurs(n)
+
+    # Cas que le crible ne traite pas : petits facteurs et puissances
+    p = factorisation.division_essai(n)
+    if not p:
+        p = factorisation.puissance_parfaite(n)
+    if not p:
+        p = siqs_essais(n, factorisation.ESSAIS_CRIBLE)
+    c = 1
+    while not p:
+        p = factorisation.pollard_rho_brent(n, c)
+        c += 1
+
+    q = n // p
+    return min(p, q), max(p, q)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import time
+
+    for bits in (100, 120, 140):
+        p = primalite.premier_aleatoire(1 << (bits // 2 - 1), 1 << (bits // 2))
+        q = primalite.premier_aleatoire(1 << (bits // 2 - 1), 1 << (bits // 2))
+        t0 = time.perf_counter()
+        resultat = facteurs(p * q)
+        duree = time.perf_counter() - t0
+        assert resultat == (min(p, q), max(p, q))
+        print(f"n de {(p * q).bit_length():3d} bits : {resultat} en {duree:7.2f} s")
@@ -0,0 +1,64 @@
+# cryptographie
+# Les primitives du dépôt, sans les démonstrations : les scripts des
+# exercices gardent leurs démonstrations derrière __main__, et ce
+# paquet expose leurs fonctions. Rien n'est importé à l'ouverture du
+# paquet : un sous-module est chargé au premier accès à l'un de ses
+# noms, ce qui garde « import cryptographie » à quelques millisecondes
+# et ne génère aucune clé.
+#
+#   from cryptographie import KeyStream, des, genere_cle, Attaque
+#   import cryptographie.rsa
+import importlib
+
+# Sous-modules : flux (StreamCipher), chiffrement_des (exo6),
+# rsa (RSA, cle_rsa), diffie_hellman (exo8), substitution, cesar
+SOUS_MODULES = ("flux", "chiffrement_des", "rsa", "diffie_hellman", "substitution", "cesar")
+
+# Nom exporté -> sous-module qui le définit
+_NOMS = {
+    "KeyStream": "flux",
+    "encryptDecrypt": "flux",
+    "decrypt_range": "flux",
+    "brute_force": "flux",
+    "brute_force_batch": "flux",
+    "recover_seed": "flux",
+    "des": "chiffrement_des",
+    "ECB": "chiffrement_des",
+    "CBC": "chiffrement_des",
+    "PAD_NORMAL": "chiffrement_des",
+    "PAD_PKCS5": "chiffrement_des",
+    "est_premier": "rsa",
+    "trouve_premier": "rsa",
+    "lcm": "rsa",
+    "trouve_e": "rsa",
+    "trouve_d": "rsa",
+    "facteurs": "rsa",
+    "modexp": "rsa",
+    "ClePubliqueRSA": "rsa",
+    "ClePriveeRSA": "rsa",
+    "genere_cle": "rsa",
+    "is_generator": "diffie_hellman",
+    "get_generator": "diffie_hellman",
+    "Attaque": "substitution",
+}
+
+__all__ = list(_NOMS) + list(SOUS_MODULES)
+
+
+def __getattr__(nom):
+    """
+    __getattr__(nom)
+    Importe le sous-module au premier accès (PEP 562); le nom est
+    ensuite gardé dans le paquet, les accès suivants sont directs.
+    """
+    if nom in SOUS_MODULES:
+        return importlib.import_module(f"{__name__}.{nom}")
+    if nom in _NOMS:
+        valeur = getattr(importlib.import_module(f"{__name__}.{_NOMS[nom]}"), nom)
+        globals()[nom] = valeur
+        return valeur
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
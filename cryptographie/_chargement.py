@@ -0,0 +1,86 @@
+# _chargement.py
+# Chargement des scripts de la racine du dépôt. Les sous-modules du
+# paquet ne les importent jamais par leur nom nu : ils passent par
+# charge (fichiers dont le nom contient une espace, dossiers exoN qui
+# ne sont pas des paquets) ou par racine (modules de la racine), et le
+# paquet fonctionne sans que la racine soit dans sys.path.
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import sys
+
+# La racine du dépôt, au-dessus du paquet
+RACINE = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def charge(nom, *chemin):
+    """
+    charge(nom, *chemin)
+    Exécute le script une seule fois et le garde dans sys.modules
+    sous le nom donné. Son bloc __main__ ne s'exécute pas.
+
+    Paramètres:
+    nom (str) : nom du module, par exemple "cryptographie._exo8"
+    chemin (str) : chemin du script, relatif à la racine du dépôt
+
+    Return:
+    (module) : le module chargé
+    """
+    module = sys.modules.get(nom)
+    if module is None:
+        _installe_chercheur()
+        specification = importlib.util.spec_from_file_location(nom, os.path.join(RACINE, *chemin))
+        module = importlib.util.module_from_spec(specification)
+        sys.modules[nom] = module
+        try:
+            specification.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[nom]
+            raise
+    return module
+
+
+class _ChercheurRacine(importlib.abc.MetaPathFinder):
+    """
+    Classe _ChercheurRacine
+    Trouve les modules de premier niveau qui sont des fichiers .py de
+    la racine du dépôt (StreamCipher, cle_rsa, primalite, ...). Les
+    scripts de la racine s'importent entre eux par leur nom nu, parfois
+    seulement au premier appel d'une fonction : ces imports doivent
+    aboutir même quand la racine n'est pas dans sys.path.
+    Placé en fin de sys.meta_path, il ne masque aucun autre module.
+    """
+
+    def find_spec(self, nom, chemin=None, cible=None):
+        if chemin is not None or "." in nom:
+            return None
+        fichier = os.path.join(RACINE, nom + ".py")
+        if not os.path.isfile(fichier):
+            return None
+        return importlib.util.spec_from_file_location(nom, fichier)
+
+
+def _installe_chercheur():
+    """
+    _installe_chercheur()
+    Ajoute une seule fois _ChercheurRacine à la fin de sys.meta_path.
+    """
+    if not any(isinstance(chercheur, _ChercheurRacine) for chercheur in sys.meta_path):
+        sys.meta_path.append(_ChercheurRacine())
+
+
+def racine(nom):
+    """
+    racine(nom)
+    Importe un module de la racine du dépôt sous son propre nom :
+    c'est le même objet module que « import nom » depuis la racine.
+
+    Paramètres:
+    nom (str) : nom du module, par exemple "StreamCipher"
+
+    Return:
+    (module) : le module importé
+    """
+    _installe_chercheur()
+    return importlib.import_module(nom)
@@ -0,0 +1,11 @@
+# cesar.py
+# Chiffrement de César (« chiffrement cesar.py »).
+from cryptographie._chargement import charge
+
+_cesar = charge("cryptographie._cesar", "chiffrement cesar.py")
+
+generate_key = _cesar.generate_key
+generate_dkey = _cesar.generate_dkey
+encrypt = _cesar.encrypt
+
+__all__ = ["generate_key", "generate_dkey", "encrypt"]
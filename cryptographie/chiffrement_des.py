@@ -0,0 +1,14 @@
+# chiffrement_des.py
+# DES en Python pur (exo6/pydes_implementation.py, l'implémentation
+# pyDes utilisée par les scripts de l'exercice 6).
+from cryptographie._chargement import charge
+
+_pydes = charge("cryptographie._pydes", "exo6", "pydes_implementation.py")
+
+des = _pydes.des
+ECB = _pydes.ECB
+CBC = _pydes.CBC
+PAD_NORMAL = _pydes.PAD_NORMAL
+PAD_PKCS5 = _pydes.PAD_PKCS5
+
+__all__ = ["des", "ECB", "CBC", "PAD_NORMAL", "PAD_PKCS5"]
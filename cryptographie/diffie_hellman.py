@@ -0,0 +1,14 @@
+# diffie_hellman.py
+# Diffie-Hellman : premiers et générateurs de « exo8 distributionClefs.py ».
+# Attention, trouve_premier(size) y cherche un premier entre size et
+# 2⋅size (et non un premier de size bits comme dans cryptographie.rsa).
+from cryptographie._chargement import charge
+
+_exo8 = charge("cryptographie._exo8", "exo8 distributionClefs.py")
+
+est_premier = _exo8.est_premier
+trouve_premier = _exo8.trouve_premier
+is_generator = _exo8.is_generator
+get_generator = _exo8.get_generator
+
+__all__ = ["est_premier", "trouve_premier", "is_generator", "get_generator"]
@@ -0,0 +1,19 @@
+# flux.py
+# Chiffrement par flux du générateur congruentiel (StreamCipher.py).
+from cryptographie._chargement import racine
+
+_flux = racine("StreamCipher")
+
+KeyStream = _flux.KeyStream
+encryptDecrypt = _flux.encryptDecrypt
+decrypt_range = _flux.decrypt_range
+transmit = _flux.transmit
+modification = _flux.modification
+get_key = _flux.get_key
+crack = _flux.crack
+brute_force = _flux.brute_force
+brute_force_batch = _flux.brute_force_batch
+recover_seed = _flux.recover_seed
+
+__all__ = ["KeyStream", "encryptDecrypt", "decrypt_range", "transmit", "modification", "get_key", "crack",
+           "brute_force", "brute_force_batch", "recover_seed"]
@@ -0,0 +1,22 @@
+# rsa.py
+# RSA : les fonctions de RSA.py (exercice 9) et les objets clés.
+# facteurs() n'importe la course de factorisation qu'à son premier appel.
+from cryptographie._chargement import racine
+
+_cle_rsa = racine("cle_rsa")
+_exponentiation = racine("exponentiation")
+_rsa = racine("RSA")
+
+est_premier = _rsa.est_premier
+trouve_premier = _rsa.trouve_premier
+lcm = _rsa.lcm
+trouve_e = _rsa.trouve_e
+trouve_d = _rsa.trouve_d
+facteurs = _rsa.facteurs
+modexp = _exponentiation.modexp
+ClePubliqueRSA = _cle_rsa.ClePubliqueRSA
+ClePriveeRSA = _cle_rsa.ClePriveeRSA
+genere_cle = _cle_rsa.genere_cle
+
+__all__ = ["est_premier", "trouve_premier", "lcm", "trouve_e", "trouve_d", "facteurs",
+           "modexp", "ClePubliqueRSA", "ClePriveeRSA", "genere_cle"]
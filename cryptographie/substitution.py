@@ -0,0 +1,13 @@
+# substitution.py
+# Chiffrement de substitution et sa cryptanalyse par fréquences.
+from cryptographie._chargement import racine
+
+_substitution = racine("chiffrement_de_substitution")
+
+generate_key = _substitution.generate_key
+encrypt = _substitution.encrypt
+generate_dkey = _substitution.generate_dkey
+decrypt = _substitution.decrypt
+Attaque = _substitution.Attaque
+
+__all__ = ["generate_key", "encrypt", "generate_dkey", "decrypt", "Attaque"]
@@ -0,0 +1,397 @@
+# ecm.py
+# Factorisation par courbes elliptiques de Lenstra (ECM). Le coût dépend
+# de la taille du plus petit facteur de n, pas de celle de n : c'est la
+# bonne méthode pour les modules déséquilibrés et pour retirer les petits
+# facteurs avant le crible quadratique.
+# Courbes de Montgomery By² = x³ + Ax² + x en coordonnées (X : Z),
+# paramétrisation de Suyama, étape 1 jusqu'à B1 et étape 2 jusqu'à B2.
+import functools
+import math
+import random
+
+import arithmetique_modulaire
+import primalite
+
+
+# Bornes selon la taille du facteur cherché (en chiffres décimaux) :
+# (chiffres, B1, nombre de courbes attendu)
+BORNES = (
+    (15, 2000, 25),
+    (20, 11000, 90),
+    (25, 50000, 300),
+    (30, 250000, 700),
+)
+
+# Pas des grands pas de l'étape 2
+PAS_ETAPE2 = 210
+
+
+class FacteurTrouve(Exception):
+    """
+    Classe FacteurTrouve
+    Levée quand une inversion modulo n échoue : le gcd
+    avec n est alors un facteur.
+    """
+
+    def __init__(self, facteur):
+        super().__init__(facteur)
+        self.facteur = facteur
+
+
+# ========================================
+# ARITHMÉTIQUE SUR LA COURBE
+# ========================================
+
+def double(x, z, a24, n):
+    """
+    double(x, z, a24, n)
+    Doublement d'un point (X : Z) sur la courbe de Montgomery.
+
+    Paramètres:
+    x (int), z (int) : le point
+    a24 (int) : (A + 2) / 4 mod n
+    n (int) : le module
+
+    Return:
+    (tuple) : le point 2P (X : Z)
+    """
+    t1 = (x + z) * (x + z) % n
+    t2 = (x - z) * (x - z) % n
+    t3 = t1 - t2
+    return t1 * t2 % n, t3 * (t2 + a24 * t3) % n
+
+
+def addition(xp, zp, xq, zq, xd, zd, n):
+    """
+    addition(xp, zp, xq, zq, xd, zd, n)
+    Addition différentielle : P + Q connaissant P - Q.
+
+    Paramètres:
+    xp, zp (int) : le point P
+    xq, zq (int) : le point Q
+    xd, zd (int) : le point P - Q
+    n (int) : le module
+
+    Return:
+    (tuple) : le point P + Q (X : Z)
+    """
+    u = (xp - zp) * (xq + zq)
+    v = (xp + zp) * (xq - zq)
+    somme = u + v
+    difference = u - v
+    return zd * somme * somme % n, xd * difference * difference % n
+
+
+def multiplie(k, x, z, a24, n):
+    """
+    multiplie(k, x, z, a24, n)
+    Multiplication scalaire [k]P par l'échelle de Montgomery.
+
+    Paramètres:
+    k (int) : le scalaire, k ≥ 1
+    x, z (int) : le point P
+    a24 (int) : (A + 2) / 4 mod n
+    n (int) : le module
+
+    Return:
+    (tuple) : le point [k]P (X : Z)
+    """
+    # Invariant : R1 - R0 = P
+    x0, z0 = x, z
+    x1, z1 = double(x, z, a24, n)
+    for bit in bin(k)[3:]:
+        if bit == "1":
+            x0, z0 = addition(x1, z1, x0, z0, x, z, n)
+            x1, z1 = double(x1, z1, a24, n)
+        else:
+            x1, z1 = addition(x1, z1, x0, z0, x, z, n)
+            x0, z0 = double(x0, z0, a24, n)
+    return x0, z0
+
+
+def courbe_suyama(sigma, n):
+    """
+    courbe_suyama(sigma, n)
+    Paramétrisation de Suyama : u = σ² - 5, v = 4σ, point de départ
+    (u³ : v³) et a24 = (v - u)³(3u + v) / (16 u³ v). L'ordre de la
+    courbe est divisible par 12, ce qui augmente la chance qu'il soit
+    friable.
+
+    Paramètres:
+    sigma (int) : le paramètre de la courbe, σ ≥ 6
+    n (int) : le module
+
+    Return:
+    (tuple) : (x, z, a24)
+
+    Exception:
+    FacteurTrouve : si le dénominateur n'est pas inversible modulo n
+    """
+    u = (sigma * sigma - 5) % n
+    v = 4 * sigma % n
+    x = pow(u, 3, n)
+    z = pow(v, 3, n)
+    denominateur = 16 * x * v % n
+    g = math.gcd(denominateur, n)
+    if g != 1:
+        raise FacteurTrouve(g)
+    a24 = pow(v - u, 3, n) * (3 * u + v) * arithmetique_modulaire.inverse_modulaire(denominateur, n) % n
+    return x, z, a24
+
+
+# ========================================
+# UNE COURBE
+# ========================================
+
+@functools.lru_cache(maxsize=4)
+def tables_premiers(b1, b2):
+    """
+    tables_premiers(b1, b2)
+    Les premiers jusqu'à b2 et leur table d'appartenance, communs à
+    toutes les courbes de mêmes bornes : calculés une fois par
+    (b1, b2) et par processus (le crible seul coûte ~1 s vers B2 = 25M).
+
+    Paramètres:
+    b1 (int) : borne de l'étape 1
+    b2 (int) : borne de l'étape 2
+
+    Return:
+    (tuple) : (premiers, est_premier), la liste des premiers ≤ b2 et
+    des octets où est_premier[r] vaut 1 si r est premier (r ≤ b2 + PAS_ETAPE2)
+    """
+    premiers = primalite.crible_eratosthene(b2 + 1)
+    est_premier = bytearray(b2 + PAS_ETAPE2 + 1)
+    for r in premiers:
+        est_premier[r] = 1
+    return premiers, bytes(est_premier)
+
+
+def courbe(n, b1, b2, sigma, tables=None):
+    """
+    courbe(n, b1, b2, sigma, tables=None)
+    Essaie une courbe. Étape 1 : Q = [M]P où M est le produit des
+    puissances premières r^k ≤ b1. Étape 2 : on cherche un dernier
+    premier r de ]b1, b2] avec [r]Q = O, par pas de bébé [j]Q et grands
+    pas [mD]Q (r = mD ± j); les X des pas de bébé sont normalisés
+    (Z = 1) par une seule inversion par lot.
+
+    Paramètres:
+    n (int) : le nombre composé à factoriser
+    b1 (int) : borne de l'étape 1
+    b2 (int) : borne de l'étape 2
+    sigma (int) : le paramètre de Suyama
+    tables (tuple) : tables_premiers(b1, b2), calculées ici si absentes
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si la courbe échoue
+    """
+    premiers, est_premier = tables or tables_premiers(b1, b2)
+    try:
+        x, z, a24 = courbe_suyama(sigma, n)
+    except FacteurTrouve as trouve:
+        return trouve.facteur if trouve.facteur != n else False
+
+    # ----- Étape 1 -----
+    for r in premiers:
+        if r > b1:
+            break
+        puissance = r
+        while puissance * r <= b1:
+            puissance *= r
+        x, z = multiplie(puissance, x, z, a24, n)
+    g = math.gcd(z, n)
+    if g == n:
+        return False
+    if g > 1:
+        return g
+
+    # ----- Étape 2 -----
+    D = PAS_ETAPE2
+    # Pas de bébé : [j]Q pour j impair < D/2, premier avec D
+    x2, z2 = double(x, z, a24, n)
+    bebes = {1: (x, z)}
+    precedent, courant = (x, z), addition(x2, z2, x, z, x, z, n)   # [1]Q, [3]Q
+    for j in range(3, D // 2, 2):
+        bebes[j] = courant
+        precedent, courant = courant, addition(courant[0], courant[1], x2, z2, precedent[0], precedent[1], n)
+    indices = [j for j in bebes if math.gcd(j, D) == 1]
+    try:
+        inverses = arithmetique_modulaire.inversion_par_lot([bebes[j][1] for j in indices], n)
+    except ValueError:
+        for j in indices:
+            g = math.gcd(bebes[j][1], n)
+            if 1 < g < n:
+                return g
+        return False
+    xj = {j: bebes[j][0] * inv % n for j, inv in zip(indices, inverses)}
+
+    # Grands pas : R_m = [mD]Q, avancé par addition différentielle
+    m = max(2, b1 // D)
+    xd, zd = multiplie(D, x, z, a24, n)
+    xr_prec, zr_prec = multiplie((m - 1) * D, x, z, a24, n)
+    xr, zr = multiplie(m * D, x, z, a24, n)
+    produit = 1
+    while m * D - D // 2 <= b2:
+        centre = m * D
+        for j in indices:
+            if est_premier[centre - j] or est_premier[centre + j]:
+                produit = produit * (xr - zr * xj[j]) % n
+        xr, zr, xr_prec, zr_prec = (*addition(xr, zr, xd, zd, xr_prec, zr_prec, n), xr, zr)
+        m += 1
+    g = math.gcd(produit, n)
+    return g if 1 < g < n else False
+
+
+# ========================================
+# PLUSIEURS COURBES
+# ========================================
+
+def bornes(chiffres):
+    """
+    bornes(chiffres)
+    Bornes conseillées pour trouver un facteur d'environ chiffres
+    chiffres décimaux.
+
+    Paramètres:
+    chiffres (int) : taille du facteur visé
+
+    Return:
+    (tuple) : (B1, B2, nombre de courbes)
+    """
+    for limite, b1, nb_courbes in BORNES:
+        if chiffres <= limite:
+            return b1, 100 * b1, nb_courbes
+    b1, nb_courbes = BORNES[-1][1:]
+    return b1, 100 * b1, nb_courbes
+
+
+def ecm(n, b1=2000, b2=None, courbes=25, executeur=None):
+    """
+    ecm(n, b1=2000, b2=None, courbes=25, executeur=None)
+    Essaie jusqu'à courbes courbes de paramètres σ aléatoires.
+    Avec un executeur (pool de processus), les courbes tournent en
+    parallèle; dès qu'une courbe trouve un facteur, les courbes pas
+    encore commencées sont annulées.
+
+    Paramètres:
+    n (int) : le nombre composé à factoriser
+    b1 (int) : borne de l'étape 1
+    b2 (int) : borne de l'étape 2 (100⋅b1 par défaut)
+    courbes (int) : nombre maximal de courbes
+    executeur (concurrent.futures.Executor) : pool optionnel
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si aucune courbe ne réussit
+    """
+    if b2 is None:
+        b2 = 100 * b1
+    sigmas = [random.randrange(6, 2 ** 32) for _ in range(courbes)]
+
+    if executeur is None:
+        tables = tables_premiers(b1, b2)
+        for sigma in sigmas:
+            g = courbe(n, b1, b2, sigma, tables)
+            if g:
+                return g
+        return False
+
+    from concurrent.futures import as_completed
+
+    # Chaque processus construit ses tables au premier appel et les garde
+    taches = [executeur.submit(courbe, n, b1, b2, sigma) for sigma in sigmas]
+    try:
+        for tache in as_completed(taches):
+            g = tache.result()
+            if g:
+                return g
+    finally:
+        for tache in taches:
+            tache.cancel()
+    return False
+
+
+def facteurs(n, chiffres=20, executeur=None):
+    """
+    facteurs(n, chiffres=20, executeur=None)
+    Même interface que factorisation.facteurs, par ECM : on augmente
+    les bornes jusqu'à chiffres chiffres décimaux pour le plus petit
+    facteur.
+
+    Paramètres:
+    n (int) : le nombre que l'on veut factoriser
+    chiffres (int) : taille maximale du facteur cherché
+    executeur (concurrent.futures.Executor) : pool optionnel
+
+    Return:
+    p (int) : premier facteur (le plus petit)
+    q (int) : deuxième facteur
+    None : si n est premier, inférieur à 4, ou si ECM échoue
+    """
+    if n < 4 or primalite.est_premier(n):
+        return None
+    if n % 2 == 0:
+        return 2, n // 2
+
+    for limite, _, _ in BORNES:
+        b1, b2, nb_courbes = bornes(limite)
+        p = ecm(n, b1, b2, nb_courbes, executeur)
+        if p:
+            q = n // p
+            return min(p, q), max(p, q)
+        if limite >= chiffres:
+            break
+    return None
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_courbes(n, b1, courbes, executeur=None):
+    """
+    benchmark_courbes(n, b1, courbes, executeur=None)
+    Mesure le débit en courbes par seconde (étapes 1 et 2).
+
+    Paramètres:
+    n (int) : un module (sans petit facteur, pour que toutes les courbes tournent)
+    b1 (int) : borne de l'étape 1
+    courbes (int) : nombre de courbes
+    executeur (concurrent.futures.Executor) : pool optionnel
+
+    Return:
+    (float) : courbes par seconde
+    """
+    import time
+
+    sigmas = [random.randrange(6, 2 ** 32) for _ in range(courbes)]
+    t0 = time.perf_counter()
+    if executeur is None:
+        for sigma in sigmas:
+            courbe(n, b1, 100 * b1, sigma)
+    else:
+        list(executeur.map(courbe, [n] * courbes, [b1] * courbes,
+                           [100 * b1] * courbes, sigmas))
+    return courbes / (time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    import os
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Module déséquilibré : un facteur de 50 bits et un de 200 bits
+    p = primalite.premier_aleatoire(1 << 49, 1 << 50)
+    q = primalite.premier_aleatoire(1 << 199, 1 << 200)
+    n = p * q
+
+    with ProcessPoolExecutor(os.cpu_count()) as pool:
+        for b1 in (2000, 11000):
+            print(f"B1 = {b1:6d} : {benchmark_courbes(n, b1, 8):6.2f} courbes/s (1 processus), "
+                  f"{benchmark_courbes(n, b1, 8, pool):6.2f} courbes/s ({os.cpu_count()} processus)")
+
+        t0 = time.perf_counter()
+        resultat = facteurs(n, 20, pool)
+        print(f"n de {n.bit_length()} bits, p de {p.bit_length()} bits : "
+              f"{resultat} en {time.perf_counter() - t0:.2f} s")
@@ -22,31 +22,37 @@ def modify(m):
     return bytes(l)
 
 
-# Notre message, il doit être binaire.
-m = "Nobody inspects the spammish repetition".encode()
+def demo():
+    """Un bit de différence dans le message change tout le hash"""
+    # Notre message, il doit être binaire.
+    m = "Nobody inspects the spammish repetition".encode()
 
-# On utilise l'algorithme sha256.
-sha256 = hashlib.sha256()
+    # On utilise l'algorithme sha256.
+    sha256 = hashlib.sha256()
 
-# On met à jour l'objet
-sha256.update(m)
+    # On met à jour l'objet
+    sha256.update(m)
 
-# On récupère le hash
-d = sha256.digest()
+    # On récupère le hash
+    d = sha256.digest()
 
-# On affiche notre hash
-print("Le hash de sha256 :", d)
+    # On affiche notre hash
+    print("Le hash de sha256 :", d)
 
-# On modifie un bit du message
-m = modify(m)
-print("Notre message modifié :", m)
+    # On modifie un bit du message
+    m = modify(m)
+    print("Notre message modifié :", m)
 
-# Dans votre code, créer un deuxième objet sha256 (sha256bis) et refaire les étapes
-sha256bis = hashlib.sha256()
-sha256bis.update(m)
-d_bis = sha256bis.digest()
+    # Dans votre code, créer un deuxième objet sha256 (sha256bis) et refaire les étapes
+    sha256bis = hashlib.sha256()
+    sha256bis.update(m)
+    d_bis = sha256bis.digest()
 
-print("Le hash de sha256bis :", d_bis)
+    print("Le hash de sha256bis :", d_bis)
 
-# Comparaison des deux valeurs
-print("Les hash sont-ils identiques ?", d == d_bis)
\ No newline at end of file
+    # Comparaison des deux valeurs
+    print("Les hash sont-ils identiques ?", d == d_bis)
+
+
+if __name__ == "__main__":
+    demo()
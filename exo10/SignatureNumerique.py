@@ -1,5 +1,10 @@
 # SignatureNumerique.py
 import hashlib
+import os
+
+# Les modules partagés (cle_rsa, magasin_cles) et le magasin de clés
+# d'Alice sont à la racine du dépôt
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 def modification(m):
@@ -24,63 +29,86 @@ def modification(m):
     return bytes(l)
 
 
-# Les clés RSA d'Alice généré par le
-# script RSA de l'exercice 9
-# **********
-# Clés publiques (e, n) : 5 199841
-# Clé secrète (d) : 4973
-# **********
-
-# On assigne ces clés à des variables
-n = 199841
-e = 5
-d = 4973
-
-# Le message qu'Alice veut signer et envoyer à Bob.
-message = "A martini. Shaken, not stirred.".encode()
-
-# Étape 1 : hachage du message
-# Ajoutez le code manquant pour générer un hash sha256.
-# Vous devez créer un objet sha256.
-sha256 = hashlib.sha256()
-# Faire un « update » de l'objet avec le message.
-sha256.update(message)
-# Générer le hash et l'assigner à une variable h.
-h = sha256.digest()
-
-# La valeur de h est en octets, nous avons
-# besoin d'une valeur numérique (un entier).
-h = int.from_bytes(h, 'big') % n
-print("Hachage du message :", h)
-
-# Étape 2 : "déchiffré" la valeur de hachage.
-# Elle utilise sa clé secrète d.
-signature = h ** d % n
-
-# Étape 3 : envoyer le message et la signature.
-print("Message à Bob et sa signature (message, signature) :", message, signature)
-
-# Eve intercepte le message et le modifie.
-message = modification(message)
-print("Le message modifié d'Eve :", message)
-
-# Bob reçoit le message.
-# Étape 1 : hachage du message
-
-# Ajoutez le code pour trouver la valeur de hachage du message.
-sha256_bob = hashlib.sha256()
-sha256_bob.update(message)
-h_bob = sha256_bob.digest()
-h_bob = int.from_bytes(h_bob, 'big') % n
-
-print("Bob, hachage du message :", h_bob)
-
-# Étape 2-3 : vérifier la signature
-verification = signature ** e % n
-print("Vérification de la signature :", verification)
-
-# Vérification finale
-if h_bob == verification:
-    print("✓ La signature est valide - le message n'a pas été modifié")
-else:
-    print("✗ La signature n'est pas valide - le message a été modifié ou falsifié!")
\ No newline at end of file
+def cles_alice():
+    """
+    Fonction
+    cles_alice()
+    Les clés RSA d'Alice sont dans le magasin écrit par le
+    script RSA de l'exercice 9. S'il n'existe pas encore, on
+    génère une paire et on la range dans le magasin.
+
+    Return
+    (tuple) : la clé publique d'Alice, partagée avec Bob, et sa clé privée
+    """
+    import magasin_cles
+    from cle_rsa import genere_cle
+
+    chemin_magasin = os.path.join(RACINE, "cles_alice.bin")
+    if not os.path.exists(chemin_magasin):
+        magasin_cles.ecrit_magasin(chemin_magasin, [genere_cle(1024)])
+    with magasin_cles.MagasinCles(chemin_magasin) as magasin:
+        return magasin.paire(0)
+
+
+def demo():
+    """Alice signe, Eve modifie le message, Bob vérifie"""
+    cle_alice, cle_privee_alice = cles_alice()
+    n = cle_alice.n
+    print("Clés publiques d'Alice (e, n) :", cle_alice.e, n)
+
+    # Le message qu'Alice veut signer et envoyer à Bob.
+    message = "A martini. Shaken, not stirred.".encode()
+
+    # Étape 1 : hachage du message
+    # Ajoutez le code manquant pour générer un hash sha256.
+    # Vous devez créer un objet sha256.
+    sha256 = hashlib.sha256()
+    # Faire un « update » de l'objet avec le message.
+    sha256.update(message)
+    # Générer le hash et l'assigner à une variable h.
+    h = sha256.digest()
+
+    # La valeur de h est en octets, nous avons
+    # besoin d'une valeur numérique (un entier).
+    h = int.from_bytes(h, 'big') % n
+    print("Hachage du message :", h)
+
+    # Étape 2 : "déchiffré" la valeur de hachage.
+    # Elle utilise sa clé secrète d.
+    signature = cle_privee_alice.signe(h)
+
+    # Étape 3 : envoyer le message et la signature.
+    print("Message à Bob et sa signature (message, signature) :", message, signature)
+
+    # Eve intercepte le message et le modifie.
+    message = modification(message)
+    print("Le message modifié d'Eve :", message)
+
+    # Bob reçoit le message.
+    # Étape 1 : hachage du message
+
+    # Ajoutez le code pour trouver la valeur de hachage du message.
+    sha256_bob = hashlib.sha256()
+    sha256_bob.update(message)
+    h_bob = sha256_bob.digest()
+    h_bob = int.from_bytes(h_bob, 'big') % n
+
+    print("Bob, hachage du message :", h_bob)
+
+    # Étape 2-3 : vérifier la signature
+    verification = cle_alice.verifie(signature)
+    print("Vérification de la signature :", verification)
+
+    # Vérification finale
+    if h_bob == verification:
+        print("✓ La signature est valide - le message n'a pas été modifié")
+    else:
+        print("✗ La signature n'est pas valide - le message a été modifié ou falsifié!")
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Lancé comme script depuis exo10 : la racine n'est pas dans sys.path
+    sys.path.insert(0, RACINE)
+    demo()
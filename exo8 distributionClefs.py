@@ -1,11 +1,14 @@
-import math
 import random
 
+import primalite
+
 
 def est_premier(p):
     """
     est_premier(p)
     Vérifier si p est un nombre premier
+    On utilise le module partagé primalite plutôt
+    que la division par essai jusqu'à la racine.
 
     Paramètres:
     p (int) : le nombre à vérifier
@@ -13,17 +16,7 @@ def est_premier(p):
     Return:
     False ou True.
     """
-    # On ne vérifie pas 1 et 2.
-    # On va jusqu'à la racine carrée
-    # du nombre plus 1: la valeur
-    # de droite de range n'est pas
-    # incluse
-    for i in range(2, math.isqrt(p) + 1):
-        # Si la division n'a pas de reste
-        # donc il n'est pas premier
-        if p % i == 0:
-            return False
-    return True
+    return primalite.est_premier(p)
 
 
 def trouve_premier(size):
@@ -33,6 +26,8 @@ def trouve_premier(size):
     On recherche le nombre du début de size jusqu'au
     double. Nous aurions pu mettre les intervalles
     dans l'appel de fonction.
+    Le module primalite part d'un point aléatoire de
+    l'intervalle et crible les candidats par fenêtre.
 
     Paramètres:
     size (int) : le nombre à vérifier
@@ -40,10 +35,7 @@ def trouve_premier(size):
     Return:
     (int) : un nombre premier aléatoire
     """
-    while True:
-        p = random.randrange(size, 2 * size)
-        if est_premier(p):
-            return p
+    return primalite.premier_aleatoire(size, 2 * size)
 
 
 def is_generator(g, p):
@@ -93,65 +85,79 @@ def get_generator(p):
             return g
 
 
-# Tests de la Partie 1
-print("=== PARTIE 1: Tests des nombres premiers ===")
-# On vérifie avec un nombre non premier et un premier.
-print("46 est non premier : ", est_premier(46))
-print("23 est premier : ", est_premier(23))
-
-# On génère un nombre premier aléatoire.
-print("Nombre premier : ", trouve_premier(1000))
-print()
-
-# Tests de la Partie 2
-print("=== PARTIE 2: Générateur mathématique ===")
-# Créer un nombre premier et trouver son générateur
-p_test = trouve_premier(10000)
-g_test = get_generator(p_test)
-print("Nombre premier : ", p_test, "Générateur : ", g_test)
-print()
-
-# Partie 3: Implémentation de Diffie-Hellman
-print("=== PARTIE 3: Échange de clés Diffie-Hellman ===")
-
-# Informations publiques
-# On génère un nombre premier aléatoire.
-p = trouve_premier(10000)
-
-# On génère un générateur
-g = get_generator(p)
-print("Nombre premier : ", p, "Générateur : ", g)
-
-# Alice 1
-# Elle doit générer un nombre aléatoire.
-# Normalement, on utiliserait un très
-# grand nombre.
-a = random.randrange(0, p)
-
-# Elle calcule le nombre à envoyer à Bob
-j = (g ** a) % p
-
-# Alice envoie son nombre à Bob
-# Elle utilise un canal non sécurisé
-print(" Alice j : ", j)
-
-# Bob 1
-# Il doit générer un nombre aléatoire.
-# Normalement, on utiliserait un très
-# grand nombre.
-b = random.randrange(0, p)
-
-# Il calcule le nombre à envoyer à Alice
-k = (g ** b) % p
-
-# Bob envoie son nombre à Alice
-# Il utilise un canal non sécurisé
-print(" Bob k : ", k)
-
-# Alice 2
-g_ab = (k ** a) % p
-print("Alice g_ab : ", g_ab)
-
-# Bob 2
-g_ab = (j ** b) % p
-print("Bob g_ab : ", g_ab)
\ No newline at end of file
+def partie1():
+    """Tests des nombres premiers"""
+    # Tests de la Partie 1
+    print("=== PARTIE 1: Tests des nombres premiers ===")
+    # On vérifie avec un nombre non premier et un premier.
+    print("46 est non premier : ", est_premier(46))
+    print("23 est premier : ", est_premier(23))
+
+    # On génère un nombre premier aléatoire.
+    print("Nombre premier : ", trouve_premier(1000))
+    print()
+
+
+def partie2():
+    """Générateur d'un groupe multiplicatif modulo p"""
+    # Tests de la Partie 2
+    print("=== PARTIE 2: Générateur mathématique ===")
+    # Créer un nombre premier et trouver son générateur
+    p_test = trouve_premier(10000)
+    g_test = get_generator(p_test)
+    print("Nombre premier : ", p_test, "Générateur : ", g_test)
+    print()
+
+
+def partie3():
+    """Échange de clés Diffie-Hellman entre Alice et Bob"""
+    # Partie 3: Implémentation de Diffie-Hellman
+    print("=== PARTIE 3: Échange de clés Diffie-Hellman ===")
+
+    # Informations publiques
+    # On génère un nombre premier aléatoire.
+    p = trouve_premier(10000)
+
+    # On génère un générateur
+    g = get_generator(p)
+    print("Nombre premier : ", p, "Générateur : ", g)
+
+    # Alice 1
+    # Elle doit générer un nombre aléatoire.
+    # Normalement, on utiliserait un très
+    # grand nombre.
+    a = random.randrange(0, p)
+
+    # Elle calcule le nombre à envoyer à Bob
+    j = (g ** a) % p
+
+    # Alice envoie son nombre à Bob
+    # Elle utilise un canal non sécurisé
+    print(" Alice j : ", j)
+
+    # Bob 1
+    # Il doit générer un nombre aléatoire.
+    # Normalement, on utiliserait un très
+    # grand nombre.
+    b = random.randrange(0, p)
+
+    # Il calcule le nombre à envoyer à Alice
+    k = (g ** b) % p
+
+    # Bob envoie son nombre à Alice
+    # Il utilise un canal non sécurisé
+    print(" Bob k : ", k)
+
+    # Alice 2
+    g_ab = (k ** a) % p
+    print("Alice g_ab : ", g_ab)
+
+    # Bob 2
+    g_ab = (j ** b) % p
+    print("Bob g_ab : ", g_ab)
+
+
+if __name__ == "__main__":
+    partie1()
+    partie2()
+    partie3()
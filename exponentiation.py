@@ -0,0 +1,260 @@
+# exponentiation.py
+# Exponentiation modulaire par fenêtre glissante avec multiplication
+# de Montgomery. Les constantes propres à un module (R² mod n, n′)
+# sont calculées une seule fois et gardées sur l'objet clé.
+# En Python pur, modexp reste plus lent que pow(b, e, n) intégré aux
+# tailles RSA : les clés utilisent pow, modexp est l'alternative
+# mesurée par le banc d'essai ci-dessous.
+import arithmetique_modulaire
+
+
+class ContexteMontgomery:
+    """
+    Classe ContexteMontgomery
+    Constantes de Montgomery pour un module n impair :
+    R = 2^k > n, n′ = -n^-1 mod R et R² mod n.
+    Un nombre a est représenté par a⋅R mod n; le produit de deux
+    représentants se réduit alors par un masque et un décalage,
+    sans division par n.
+    """
+
+    def __init__(self, n):
+        """
+        init (self, n)
+        Calcule les constantes de Montgomery pour n
+
+        Paramètres:
+        self : notre objet contexte
+        n (int) : le module, impair
+
+        Return
+        Notre objet ContexteMontgomery
+        """
+        if n < 3 or n % 2 == 0:
+            raise ValueError("Montgomery exige un module impair > 1")
+        self.n = n
+        self.k = n.bit_length()
+        self.masque = (1 << self.k) - 1
+        # n′ vérifie n⋅n′ ≡ -1 (mod R)
+        self.n_prime = -arithmetique_modulaire.inverse_modulaire(n, 1 << self.k) & self.masque
+        self.r2 = (1 << (2 * self.k)) % n
+        # Représentant de 1 : R mod n
+        self.un = (1 << self.k) % n
+
+    def reduit(self, t):
+        """
+        reduit(self, t)
+        Réduction de Montgomery (REDC) : calcule t⋅R^-1 mod n.
+
+        Paramètres:
+        self : notre objet contexte
+        t (int) : entier dans [0, n⋅R[
+
+        Return:
+        (int) : t⋅R^-1 mod n, dans [0, n[
+        """
+        m = ((t & self.masque) * self.n_prime) & self.masque
+        t = (t + m * self.n) >> self.k
+        if t >= self.n:
+            t -= self.n
+        return t
+
+    def vers(self, a):
+        """
+        vers(self, a)
+        Passe a dans la représentation de Montgomery (a⋅R mod n).
+
+        Paramètres:
+        self : notre objet contexte
+        a (int)
+
+        Return:
+        (int) : le représentant de a
+        """
+        return self.reduit((a % self.n) * self.r2)
+
+    def exp(self, base, exposant):
+        """
+        exp(self, base, exposant)
+        Calcule base^exposant mod n par fenêtre glissante.
+        On précalcule les puissances impaires base^1, base^3, ...,
+        base^(2^w - 1); l'exposant est lu du bit de poids fort au
+        bit de poids faible, en sautant les suites de zéros.
+
+        Paramètres:
+        self : notre objet contexte
+        base (int)
+        exposant (int) : exposant positif ou nul
+
+        Return:
+        (int) : base^exposant mod n
+        """
+        if exposant < 0:
+            raise ValueError("exposant négatif")
+        if exposant == 0:
+            return 1 % self.n
+
+        w = _largeur_fenetre(exposant.bit_length())
+        n, k, masque, n_prime = self.n, self.k, self.masque, self.n_prime
+
+        # Table des puissances impaires en représentation de Montgomery
+        g = self.vers(base)
+        g2 = self.reduit(g * g)
+        table = [g]
+        for _ in range((1 << (w - 1)) - 1):
+            table.append(self.reduit(table[-1] * g2))
+
+        # Les réductions sont écrites en ligne : c'est la boucle chaude.
+        x = self.un
+        i = exposant.bit_length() - 1
+        while i >= 0:
+            if not (exposant >> i) & 1:
+                t = x * x
+                m = ((t & masque) * n_prime) & masque
+                x = (t + m * n) >> k
+                if x >= n:
+                    x -= n
+                i -= 1
+                continue
+            # Plus longue fenêtre [i, j] d'au plus w bits finissant par un 1
+            j = max(i - w + 1, 0)
+            while not (exposant >> j) & 1:
+                j += 1
+            valeur = (exposant >> j) & ((1 << (i - j + 1)) - 1)
+            for _ in range(i - j + 1):
+                t = x * x
+                m = ((t & masque) * n_prime) & masque
+                x = (t + m * n) >> k
+                if x >= n:
+                    x -= n
+            t = x * table[valeur >> 1]
+            m = ((t & masque) * n_prime) & masque
+            x = (t + m * n) >> k
+            if x >= n:
+                x -= n
+            i = j - 1
+
+        return self.reduit(x)
+
+
+def _largeur_fenetre(bits):
+    """
+    _largeur_fenetre(bits)
+    Choisit la largeur de fenêtre qui minimise le nombre de
+    multiplications pour un exposant de la taille donnée.
+
+    Paramètres:
+    bits (int) : taille de l'exposant en bits
+
+    Return:
+    (int) : la largeur de fenêtre w
+    """
+    for w, limite in ((1, 24), (2, 80), (3, 240), (4, 672), (5, 1792)):
+        if bits <= limite:
+            return w
+    return 6
+
+
+def contexte(key):
+    """
+    contexte(key)
+    Retourne le contexte de Montgomery du module de la clé.
+    Il est calculé au premier appel puis gardé sur la clé.
+
+    Paramètres:
+    key : un objet clé avec un attribut n
+
+    Return:
+    (ContexteMontgomery) : le contexte pour key.n
+    """
+    ctx = getattr(key, "_montgomery", None)
+    if ctx is None or ctx.n != key.n:
+        ctx = ContexteMontgomery(key.n)
+        key._montgomery = ctx
+    return ctx
+
+
+def modexp(base, exp, key):
+    """
+    modexp(base, exp, key)
+    Calcule base^exp mod key.n sans jamais former la puissance
+    complète. key peut aussi être directement un module entier
+    (aucun cache n'est alors possible).
+
+    Paramètres:
+    base (int)
+    exp (int) : exposant positif ou nul
+    key : un objet clé (attribut n) ou le module (int)
+
+    Return:
+    (int) : base^exp mod n
+    """
+    if isinstance(key, int):
+        n = key
+        if n % 2 == 0 or n < 3:
+            return pow(base, exp, n)
+        return ContexteMontgomery(n).exp(base, exp)
+    if key.n % 2 == 0 or key.n < 3:
+        return pow(base, exp, key.n)
+    return contexte(key).exp(base, exp)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_modexp(bits, repetitions):
+    """
+    benchmark_modexp(bits, repetitions)
+    Compare modexp (Montgomery, fenêtre glissante) avec pow(b, e, n)
+    intégré à Python et avec l'ancien calcul b ** e % n.
+
+    Paramètres:
+    bits (int) : taille du module en bits
+    repetitions (int) : nombre d'exponentiations par méthode
+
+    Return:
+    Aucun
+    """
+    import random
+    import time
+
+    class _Cle:
+        pass
+
+    cle = _Cle()
+    cle.n = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+    bases = [random.randrange(cle.n) for _ in range(repetitions)]
+    exposant = random.getrandbits(bits)
+
+    t0 = time.perf_counter()
+    resultats = [modexp(b, exposant, cle) for b in bases]
+    duree_mont = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    attendus = [pow(b, exposant, cle.n) for b in bases]
+    duree_pow = time.perf_counter() - t0
+    if resultats != attendus:
+        raise ValueError("modexp ne rend pas le même résultat que pow")
+
+    print(f"{bits:5d} bits : modexp {1000 * duree_mont / repetitions:8.3f} ms, "
+          f"pow {1000 * duree_pow / repetitions:8.3f} ms, "
+          f"ratio {duree_mont / duree_pow:5.2f}")
+
+    # L'ancien calcul b ** e % n forme la puissance complète :
+    # son coût explose avec l'exposant, on se limite à e = 1025.
+    petit = 2 ** 10 + 1
+    t0 = time.perf_counter()
+    for b in bases[:3]:
+        b ** petit % cle.n
+    duree_naif = (time.perf_counter() - t0) / 3
+    t0 = time.perf_counter()
+    for b in bases[:3]:
+        modexp(b, petit, cle)
+    duree_petit = (time.perf_counter() - t0) / 3
+    print(f"             e = 1025 : b ** e % n {1000 * duree_naif:8.3f} ms, "
+          f"modexp {1000 * duree_petit:8.3f} ms")
+
+if __name__ == "__main__":
+    for taille in (512, 1024, 2048, 4096):
+        benchmark_modexp(taille, 20)
@@ -0,0 +1,262 @@
+# fabrique_cles.py
+# Fabrique de clés RSA : pour chaque taille, une file bornée de paires
+# de clés prêtes, remplie en arrière-plan par des processus de travail.
+# Demander une clé ne coûte qu'un retrait de file, au lieu de la
+# recherche de deux premiers à chaque fois.
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+from cle_rsa import genere_cle
+
+
+# Pause (s) avant de relancer une génération du pool qui a échoué
+PAUSE_ERREUR = 0.5
+
+
+class FabriqueCles:
+    """
+    Classe FabriqueCles
+    Garde jusqu'à capacite paires de clés prêtes par taille. Chaque
+    clé retirée relance une génération dans le pool de processus.
+    Compteurs : clés servies depuis la file (succes), clés générées
+    sur place faute de stock (echecs), clés produites par le pool
+    (remplissages), générations du pool qui ont levé une exception
+    (erreurs, par taille).
+    """
+
+    def __init__(self, tailles=(1024, 2048), capacite=8, travailleurs=None, nb_premiers=2, e=65537):
+        """
+        init (self, tailles=(1024, 2048), capacite=8, travailleurs=None, nb_premiers=2, e=65537)
+        Crée le pool et lance le remplissage des files.
+
+        Paramètres:
+        self : notre fabrique
+        tailles (tuple) : tailles de module servies (bits)
+        capacite (int) : nombre maximal de clés prêtes ou en cours par taille
+        travailleurs (int) : processus du pool (os.cpu_count() par défaut)
+        nb_premiers (int) : nombre de facteurs premiers de chaque module
+        e (int) : l'exposant public
+
+        Return
+        Notre objet FabriqueCles
+        """
+        self.capacite = capacite
+        self.nb_premiers = nb_premiers
+        self.e = e
+        self.files = {bits: deque() for bits in tailles}
+        self.en_cours = {bits: 0 for bits in tailles}
+        self.succes = 0
+        self.echecs = 0
+        self.remplissages = 0
+        self.duree_remplissage = 0.0
+        self.erreurs = {bits: 0 for bits in tailles}
+        self.derniere_erreur = None
+        self.debut = time.monotonic()
+        self._verrou = threading.Lock()
+        self._ferme = False
+        self._apres_erreur = False
+        self._pool = ProcessPoolExecutor(travailleurs or os.cpu_count() or 1, initializer=_initialise)
+        # Les soumissions au pool coûtent quelques millisecondes : un fil
+        # d'arrière-plan s'en charge, cle() ne fait que le réveiller.
+        self._a_remplir = threading.Event()
+        self._a_remplir.set()
+        self._remplisseur = threading.Thread(target=self._boucle_remplissage, daemon=True)
+        self._remplisseur.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.ferme()
+
+    def _boucle_remplissage(self):
+        """
+        _boucle_remplissage(self)
+        Fil d'arrière-plan : complète toutes les files à chaque réveil.
+        Après un échec du pool, il attend PAUSE_ERREUR avant de relancer,
+        pour ne pas boucler sur une erreur qui se répète.
+        """
+        while True:
+            self._a_remplir.wait()
+            self._a_remplir.clear()
+            if self._ferme:
+                return
+            with self._verrou:
+                apres_erreur, self._apres_erreur = self._apres_erreur, False
+            if apres_erreur:
+                self._a_remplir.wait(PAUSE_ERREUR)
+                if self._ferme:
+                    return
+            for bits in self.files:
+                self._remplit(bits)
+
+    def _remplit(self, bits):
+        """
+        _remplit(self, bits)
+        Soumet assez de générations pour que la file de bits,
+        avec les générations en cours, atteigne la capacité.
+        """
+        with self._verrou:
+            if self._ferme:
+                return
+            manque = self.capacite - len(self.files[bits]) - self.en_cours[bits]
+            self.en_cours[bits] += max(manque, 0)
+        for _ in range(manque):
+            tache = self._pool.submit(_genere, bits, self.nb_premiers, self.e)
+            tache.add_done_callback(lambda tache, bits=bits: self._recoit(bits, tache))
+
+    def _recoit(self, bits, tache):
+        """
+        _recoit(self, bits, tache)
+        Range une paire de clés produite par le pool. Une génération
+        qui a échoué est comptée, son exception gardée pour statistiques(),
+        et le fil de remplissage est réveillé pour la remplacer (sauf si
+        le pool lui-même est hors service).
+        """
+        with self._verrou:
+            self.en_cours[bits] -= 1
+            if tache.cancelled():
+                return
+            erreur = tache.exception()
+            if erreur is None:
+                paire, duree = tache.result()
+                self.files[bits].append(paire)
+                self.remplissages += 1
+                self.duree_remplissage += duree
+                return
+            self.erreurs[bits] += 1
+            self.derniere_erreur = erreur
+            if isinstance(erreur, BrokenExecutor):
+                return
+            self._apres_erreur = True
+        self._a_remplir.set()
+
+    def cle(self, bits):
+        """
+        cle(self, bits)
+        Rend une paire de clés de bits bits : retirée de la file
+        si elle n'est pas vide, sinon générée sur place.
+
+        Paramètres:
+        self : notre fabrique
+        bits (int) : taille du module
+
+        Return:
+        (tuple) : (ClePubliqueRSA, ClePriveeRSA)
+        """
+        if bits not in self.files:
+            raise ValueError(f"taille non servie par la fabrique : {bits}")
+        with self._verrou:
+            file = self.files[bits]
+            paire = file.popleft() if file else None
+            if paire is None:
+                self.echecs += 1
+            else:
+                self.succes += 1
+        self._a_remplir.set()
+        if paire is None:
+            paire = genere_cle(bits, self.nb_premiers, self.e)
+        return paire
+
+    def statistiques(self):
+        """
+        statistiques(self)
+        Compteurs de la fabrique.
+
+        Paramètres:
+        self : notre fabrique
+
+        Return:
+        (dict) : succes, echecs, taux de succès, remplissages, débit de
+        remplissage (clés/s depuis la création), durée moyenne d'une
+        génération dans le pool (s), clés prêtes par taille, générations
+        en erreur par taille et la dernière exception (repr, ou None)
+        """
+        with self._verrou:
+            servies = self.succes + self.echecs
+            return {
+                "succes": self.succes,
+                "echecs": self.echecs,
+                "taux_succes": self.succes / servies if servies else 0.0,
+                "remplissages": self.remplissages,
+                "debit_remplissage": self.remplissages / (time.monotonic() - self.debut),
+                "duree_generation": self.duree_remplissage / self.remplissages if self.remplissages else 0.0,
+                "pretes": {bits: len(file) for bits, file in self.files.items()},
+                "erreurs": dict(self.erreurs),
+                "derniere_erreur": repr(self.derniere_erreur) if self.derniere_erreur else None,
+            }
+
+    def ferme(self):
+        """
+        ferme(self)
+        Arrête le pool; les générations pas encore commencées sont annulées.
+
+        Paramètres:
+        self : notre fabrique
+
+        Return:
+        Aucun
+        """
+        with self._verrou:
+            self._ferme = True
+        self._a_remplir.set()
+        self._remplisseur.join()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _initialise():
+    """
+    _initialise()
+    Baisse la priorité des processus de travail : le remplissage
+    ne doit pas ralentir les demandes servies au premier plan.
+    """
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+
+def _genere(bits, nb_premiers, e):
+    """
+    _genere(bits, nb_premiers, e)
+    Génération d'une paire dans un processus de travail.
+
+    Return:
+    (tuple) : ((ClePubliqueRSA, ClePriveeRSA), durée en secondes)
+    """
+    t0 = time.perf_counter()
+    paire = genere_cle(bits, nb_premiers, e)
+    return paire, time.perf_counter() - t0
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import statistics
+
+    def latences(fournisseur, nombre, pause):
+        resultats = []
+        for _ in range(nombre):
+            t0 = time.perf_counter()
+            fournisseur()
+            resultats.append(1000 * (time.perf_counter() - t0))
+            time.sleep(pause)
+        resultats.sort()
+        return statistics.median(resultats), resultats[int(0.99 * (len(resultats) - 1))], resultats[-1]
+
+    bits, nombre, pause = 1024, 40, 0.2
+    print(f"Clés de {bits} bits, {nombre} demandes espacées de {pause} s")
+    p50, p99, maxi = latences(lambda: genere_cle(bits), nombre, pause)
+    print(f"  synchrone : p50 {p50:8.2f} ms, p99 {p99:8.2f} ms, max {maxi:8.2f} ms")
+
+    with FabriqueCles((bits,), capacite=8) as fabrique:
+        time.sleep(2)
+        p50, p99, maxi = latences(lambda: fabrique.cle(bits), nombre, pause)
+        print(f"  fabrique  : p50 {p50:8.2f} ms, p99 {p99:8.2f} ms, max {maxi:8.2f} ms")
+        stats = fabrique.statistiques()
+        print(f"  succès {stats['succes']}, échecs {stats['echecs']} ({100 * stats['taux_succes']:.0f} %), "
+              f"{stats['remplissages']} clés produites, {stats['debit_remplissage']:.2f} clés/s, "
+              f"{1000 * stats['duree_generation']:.0f} ms par clé")
@@ -0,0 +1,265 @@
+# factorisation.py
+# Portefeuille de méthodes de factorisation pour l'attaque d'Eve :
+# division par essai, Pollard rho (variante de Brent), Pollard p-1
+# et méthode de Fermat. facteurs(n) choisit la stratégie.
+import math
+
+import arithmetique_modulaire
+import primalite
+
+
+# Taille de n (bits) à partir de laquelle facteurs() passe au crible quadratique
+TAILLE_CRIBLE = 90
+# Nombre d'appels au crible quadratique avant de revenir à Pollard rho
+ESSAIS_CRIBLE = 8
+
+
+def division_essai(n, borne=10 ** 4):
+    """
+    division_essai(n, borne=10 ** 4)
+    Cherche un facteur de n parmi les entiers inférieurs à borne.
+
+    Paramètres:
+    n (int) : le nombre à factoriser
+    borne (int) : on essaie les diviseurs jusqu'à borne (exclue)
+
+    Return:
+    (int) : le plus petit facteur premier trouvé
+    (logical) False : si ne trouve pas
+    """
+    if n % 2 == 0:
+        return 2
+    for p in range(3, min(borne, math.isqrt(n) + 1), 2):
+        if n % p == 0:
+            return p
+    return False
+
+
+def fermat(n, iterations=10 ** 4):
+    """
+    fermat(n, iterations=10 ** 4)
+    Méthode de Fermat : on cherche n = a² - b² = (a - b)(a + b)
+    en partant de a = ⌈√n⌉. Très rapide quand p et q sont proches.
+
+    Paramètres:
+    n (int) : le nombre impair à factoriser
+    iterations (int) : nombre de valeurs de a essayées
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si ne trouve pas
+    """
+    a = math.isqrt(n)
+    if a * a < n:
+        a += 1
+    b2 = a * a - n
+    for _ in range(iterations):
+        b = math.isqrt(b2)
+        if b * b == b2:
+            if a - b > 1:
+                return a - b
+            return False
+        # (a + 1)² - n = a² - n + 2a + 1
+        b2 += 2 * a + 1
+        a += 1
+    return False
+
+
+def pollard_rho_brent(n, c=1, lot=128, limite=None):
+    """
+    pollard_rho_brent(n, c=1, lot=128, limite=None)
+    Pollard rho avec la détection de cycle de Brent sur la suite
+    x → x² + c mod n. Les différences |x - y| sont multipliées par
+    lots de lot valeurs avant un seul calcul de gcd.
+    Coût attendu : environ √p itérations pour le plus petit facteur p.
+
+    Paramètres:
+    n (int) : le nombre composé impair à factoriser
+    c (int) : la constante de la suite pseudo-aléatoire
+    lot (int) : nombre de produits accumulés par gcd
+    limite (int) : nombre maximal d'itérations (None : sans limite)
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si ne trouve pas (cycle complet ou limite atteinte)
+    """
+    y = 2
+    r = 1
+    q = 1
+    g = 1
+    iterations = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(lot, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += lot
+        iterations += 2 * r
+        r *= 2
+        if limite is not None and iterations > limite and g == 1:
+            return False
+
+    if g == n:
+        # Le lot a dépassé le facteur : on reprend pas à pas
+        while True:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+            if g > 1:
+                break
+    return g if g != n else False
+
+
+def pollard_p_moins_1(n, borne1=10 ** 4, borne2=10 ** 6):
+    """
+    pollard_p_moins_1(n, borne1=10 ** 4, borne2=10 ** 6)
+    Méthode p-1 de Pollard. Si p - 1 n'a que des facteurs premiers
+    inférieurs à borne1 (étape 1) sauf au plus un facteur inférieur
+    à borne2 (étape 2), alors gcd(a^M - 1, n) révèle p.
+
+    Étape 1 : M est le produit des plus grandes puissances premières
+    r^k ≤ borne1. Étape 2 : on essaie chaque premier r de ]borne1, borne2]
+    en avançant a^r par les écarts entre premiers consécutifs.
+
+    Paramètres:
+    n (int) : le nombre composé impair à factoriser
+    borne1 (int) : borne de l'étape 1
+    borne2 (int) : borne de l'étape 2
+
+    Return:
+    (int) : un facteur non trivial de n
+    (logical) False : si ne trouve pas
+    """
+    premiers = primalite.crible_eratosthene(borne2 + 1)
+
+    # Étape 1 : puissances premières
+    a = 2
+    for r in premiers:
+        if r > borne1:
+            break
+        puissance = r
+        while puissance * r <= borne1:
+            puissance *= r
+        a = pow(a, puissance, n)
+    g = math.gcd(a - 1, n)
+    if g == n:
+        return False
+    if g > 1:
+        return g
+
+    # Étape 2 : un seul premier supplémentaire dans ]borne1, borne2]
+    # On garde a^écart en cache pour les petits écarts entre premiers.
+    ecarts = {}
+    suivants = [r for r in premiers if r > borne1]
+    if not suivants:
+        return False
+    x = pow(a, suivants[0], n)
+    produit = x - 1
+    precedent = suivants[0]
+    for i, r in enumerate(suivants[1:], 1):
+        ecart = r - precedent
+        if ecart not in ecarts:
+            ecarts[ecart] = pow(a, ecart, n)
+        x = x * ecarts[ecart] % n
+        produit = produit * (x - 1) % n
+        precedent = r
+        # Un gcd par lot de 1024 premiers
+        if i % 1024 == 0:
+            g = math.gcd(produit, n)
+            if g > 1:
+                return g if g != n else False
+    g = math.gcd(produit, n)
+    return g if 1 < g < n else False
+
+
+def puissance_parfaite(n):
+    """
+    puissance_parfaite(n)
+    Cherche si n = r^k avec k ≥ 2. Le crible quadratique ne sépare
+    jamais une puissance d'un premier : il faut l'écarter avant.
+    Il suffit d'essayer les k premiers avec 2^k ≤ n : si n = r^(a⋅b),
+    c'est aussi une puissance b-ième. Chaque racine trouvée remplace n
+    et on continue avec le même k, on rend donc la plus petite racine.
+
+    Paramètres:
+    n (int) : le nombre à tester, n ≥ 2
+
+    Return:
+    (int) : la racine r
+    (logical) False : si n n'est pas une puissance parfaite
+    """
+    racine = False
+    for k in primalite.crible_eratosthene(n.bit_length()):
+        if k >= n.bit_length():
+            break
+        r = arithmetique_modulaire.racine_entiere(n, k)
+        while r > 1 and r ** k == n:
+            n = racine = r
+            r = arithmetique_modulaire.racine_entiere(n, k)
+    return racine
+
+
+def facteurs(n):
+    """
+    facteurs(n)
+    Trouve deux facteurs de n en choisissant la stratégie :
+    petits facteurs par division par essai, puissances parfaites,
+    facteurs proches par Fermat, p - 1 friable par Pollard p-1,
+    puis Pollard rho-Brent qui aboutit toujours sur un composé.
+    À partir de TAILLE_CRIBLE bits, le crible quadratique (SIQS)
+    remplace rho une fois les petits facteurs écartés.
+
+    Paramètres:
+    n (int) : le nombre que l'on veut factoriser
+
+    Return:
+    p (int) : premier facteur (le plus petit)
+    q (int) : deuxième facteur
+    None : si n est premier ou inférieur à 4
+    """
+    if n < 4 or primalite.est_premier(n):
+        return None
+
+    p = division_essai(n)
+    if not p:
+        p = puissance_parfaite(n)
+    if not p:
+        p = fermat(n, 1000)
+    if not p:
+        p = pollard_p_moins_1(n, 10 ** 3, 10 ** 5)
+    if not p and n.bit_length() >= TAILLE_CRIBLE:
+        # Au-delà de ~90 bits, rho ne trouve vite que les petits facteurs :
+        # on lui laisse un court budget, puis le crible quadratique prend le relais.
+        import crible_quadratique
+        p = pollard_rho_brent(n, limite=2 ** 16)
+        if not p:
+            p = crible_quadratique.siqs_essais(n, ESSAIS_CRIBLE)
+    c = 1
+    while not p:
+        p = pollard_rho_brent(n, c)
+        c += 1
+
+    q = n // p
+    return min(p, q), max(p, q)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import time
+
+    for bits in (48, 64, 72, 80, 100, 120):
+        p = primalite.premier_aleatoire(1 << (bits // 2 - 1), 1 << (bits // 2))
+        q = primalite.premier_aleatoire(1 << (bits // 2 - 1), 1 << (bits // 2))
+        t0 = time.perf_counter()
+        resultat = facteurs(p * q)
+        duree = time.perf_counter() - t0
+        assert resultat == (min(p, q), max(p, q))
+        print(f"n de {(p * q).bit_length():3d} bits : {resultat} en {duree:7.3f} s")
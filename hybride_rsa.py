@@ -0,0 +1,225 @@
+# hybride_rsa.py
+# Chiffrement hybride : RSA n'encapsule qu'une clé de session
+# aléatoire (RSA-KEM), une seule opération à clé publique par message,
+# et le contenu passe par un chiffrement symétrique du projet : DES en
+# mode CBC (exo6, par défaut) ou le flux KeyStream de StreamCipher.py.
+# Le résultat est une enveloppe qui décrit elle-même son contenu.
+#
+# Le mode flux ne sert qu'à l'enseignement : la graine de KeyStream n'a
+# que 31 bits, et quelques octets de contenu connus suffisent à la
+# retrouver (StreamCipher.recover_seed, une fraction de seconde).
+# Le secret encapsulé fait toute la taille de n, mais la confidentialité
+# du contenu ne dépasse pas ces 31 bits. L'étiquette HMAC, elle, garde
+# sa clé de 256 bits : une enveloppe modifiée reste détectée.
+#
+# Enveloppe :
+#   "RSAH", version (u8), algorithme (u8), taille de la capsule (u16),
+#   empreinte du module (16 octets, voir magasin_cles), capsule RSA,
+#   contenu chiffré, étiquette HMAC-SHA256 (32 octets)
+import hashlib
+import hmac
+import secrets
+import struct
+
+import blocs_rsa
+import magasin_cles
+from StreamCipher import KeyStream, encryptDecrypt
+
+
+MAGIQUE = b"RSAH"
+VERSION = 1
+EN_TETE = struct.Struct(">4sBBH16s")
+TAILLE_ETIQUETTE = 32
+
+# Identifiants d'algorithme symétrique
+FLUX = 1
+DES_CBC = 2
+ALGORITHMES = {"flux": FLUX, "des": DES_CBC}
+
+
+def _derive(secret, n, usage, taille):
+    """
+    _derive(secret, n, usage, taille)
+    Dérivation de clé : SHA-256 en mode compteur sur le secret
+    encapsulé, avec l'usage pour séparer les clés.
+
+    Paramètres:
+    secret (int) : l'entier aléatoire encapsulé par RSA
+    n (int) : le module (fixe la largeur du secret)
+    usage (bytes) : b"chiffrement" ou b"authentification"
+    taille (int) : nombre d'octets voulus
+
+    Return:
+    (bytes) : la clé dérivée
+    """
+    octets = secret.to_bytes(blocs_rsa.taille_chiffre(n), "big")
+    sortie = b""
+    compteur = 0
+    while len(sortie) < taille:
+        sortie += hashlib.sha256(compteur.to_bytes(4, "big") + usage + octets).digest()
+        compteur += 1
+    return sortie[:taille]
+
+
+def _chiffre_symetrique(algorithme, cle, donnees, dechiffrement=False):
+    """
+    _chiffre_symetrique(algorithme, cle, donnees, dechiffrement=False)
+    Couche symétrique. DES_CBC : clé DES de 8 octets et vecteur
+    d'initialisation de 8 octets, bourrage PKCS#5. FLUX : graine
+    KeyStream de 31 bits tirée de la clé (le générateur du projet n'a
+    pas plus d'état), mode d'enseignement seulement.
+
+    Paramètres:
+    algorithme (int) : FLUX ou DES_CBC
+    cle (bytes) : 16 octets dérivés
+    donnees (bytes) : le contenu
+    dechiffrement (logical) : sens de l'opération
+
+    Return:
+    (bytes) : le contenu transformé
+    """
+    if algorithme == FLUX:
+        graine = int.from_bytes(cle[:4], "big") % 2 ** 31
+        return encryptDecrypt(KeyStream(graine), donnees)
+    if algorithme == DES_CBC:
+        from cryptographie import chiffrement_des as pydes
+        moteur = pydes.des(cle[:8], pydes.CBC, cle[8:16], pad=None, padmode=pydes.PAD_PKCS5)
+        return moteur.decrypt(donnees) if dechiffrement else moteur.encrypt(donnees)
+    raise ValueError(f"algorithme symétrique inconnu : {algorithme}")
+
+
+def scelle(donnees, publique, algorithme="des"):
+    """
+    scelle(donnees, publique, algorithme="des")
+    Chiffre donnees pour le détenteur de la clé privée : un secret
+    aléatoire r < n est chiffré une fois par RSA (la capsule), les
+    clés de chiffrement et d'authentification en sont dérivées, puis
+    le contenu est chiffré et authentifié (HMAC après chiffrement).
+
+    Paramètres:
+    donnees (bytes) : le contenu
+    publique (ClePubliqueRSA) : la clé publique du destinataire
+    algorithme (str) : "des", ou "flux" pour l'enseignement seulement
+    (31 bits de confidentialité, voir l'en-tête du module)
+
+    Return:
+    (bytes) : l'enveloppe
+    """
+    if algorithme not in ALGORITHMES:
+        raise ValueError(f"algorithme symétrique inconnu : {algorithme}")
+    identifiant = ALGORITHMES[algorithme]
+
+    n = publique.n
+    secret = secrets.randbelow(n - 2) + 2
+    capsule = publique.chiffre(secret).to_bytes(blocs_rsa.taille_chiffre(n), "big")
+    cle = _derive(secret, n, b"chiffrement", 16)
+    cle_mac = _derive(secret, n, b"authentification", 32)
+
+    corps = (EN_TETE.pack(MAGIQUE, VERSION, identifiant, len(capsule), magasin_cles.empreinte(n))
+             + capsule + _chiffre_symetrique(identifiant, cle, donnees))
+    return corps + hmac.new(cle_mac, corps, hashlib.sha256).digest()
+
+
+def lit_en_tete(enveloppe):
+    """
+    lit_en_tete(enveloppe)
+    Décrit une enveloppe sans la déchiffrer.
+
+    Paramètres:
+    enveloppe (bytes) : l'enveloppe
+
+    Return:
+    (dict) : algorithme, empreinte du module destinataire,
+    taille de la capsule et du contenu chiffré
+
+    Exception:
+    ValueError : si ce n'est pas une enveloppe valide
+    """
+    if len(enveloppe) < EN_TETE.size + TAILLE_ETIQUETTE:
+        raise ValueError("enveloppe trop courte")
+    magique, version, identifiant, taille_capsule, empreinte = EN_TETE.unpack_from(enveloppe)
+    if magique != MAGIQUE or version != VERSION:
+        raise ValueError("ce n'est pas une enveloppe hybride (version 1)")
+    noms = {valeur: nom for nom, valeur in ALGORITHMES.items()}
+    if identifiant not in noms:
+        raise ValueError(f"algorithme symétrique inconnu : {identifiant}")
+    if EN_TETE.size + taille_capsule + TAILLE_ETIQUETTE > len(enveloppe):
+        raise ValueError("enveloppe trop courte")
+    return {
+        "algorithme": noms[identifiant],
+        "empreinte": empreinte,
+        "capsule": taille_capsule,
+        "contenu": len(enveloppe) - EN_TETE.size - taille_capsule - TAILLE_ETIQUETTE,
+    }
+
+
+def ouvre(enveloppe, privee):
+    """
+    ouvre(enveloppe, privee)
+    Ouvre une enveloppe : déchiffre la capsule (une opération RSA
+    privée), vérifie l'étiquette puis déchiffre le contenu.
+
+    Paramètres:
+    enveloppe (bytes) : l'enveloppe
+    privee (ClePriveeRSA) : la clé privée du destinataire
+
+    Return:
+    (bytes) : le contenu
+
+    Exception:
+    ValueError : enveloppe invalide, autre destinataire ou contenu modifié
+    """
+    description = lit_en_tete(enveloppe)
+    if description["empreinte"] != magasin_cles.empreinte(privee.n):
+        raise ValueError("l'enveloppe est destinée à une autre clé")
+    debut = EN_TETE.size + description["capsule"]
+    capsule = int.from_bytes(enveloppe[EN_TETE.size:debut], "big")
+    corps, etiquette = enveloppe[:-TAILLE_ETIQUETTE], enveloppe[-TAILLE_ETIQUETTE:]
+
+    secret = privee.dechiffre(capsule)
+    cle_mac = _derive(secret, privee.n, b"authentification", 32)
+    if not hmac.compare_digest(hmac.new(cle_mac, corps, hashlib.sha256).digest(), etiquette):
+        raise ValueError("étiquette invalide : l'enveloppe a été modifiée")
+    cle = _derive(secret, privee.n, b"chiffrement", 16)
+    identifiant = ALGORITHMES[description["algorithme"]]
+    return _chiffre_symetrique(identifiant, cle, corps[debut:], dechiffrement=True)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import time
+
+    from cle_rsa import genere_cle
+
+    publique, privee = genere_cle(2048)
+    message = b"Alice est plus forte que Bob. " * 40
+
+    # RSA brut, un chiffrement par caractère comme dans RSA.py
+    t0 = time.perf_counter()
+    chiffres = [publique.chiffre(octet) for octet in message[:200]]
+    assert bytes(privee.dechiffre(c) for c in chiffres) == message[:200]
+    debit_brut = 200 / (time.perf_counter() - t0)
+    print(f"RSA 2048 bits par caractère : {debit_brut:10.0f} octets/s, 1 opération RSA par octet")
+
+    # Le flux est bien plus rapide, mais sa graine de 31 bits se retrouve
+    # à partir de quelques octets connus : mode d'enseignement seulement.
+    for algorithme, taille in (("des", 2 ** 13), ("flux", 2 ** 20)):
+        contenu = (message * (taille // len(message) + 1))[:taille]
+        t0 = time.perf_counter()
+        enveloppe = scelle(contenu, publique, algorithme)
+        assert ouvre(enveloppe, privee) == contenu
+        debit = taille / (time.perf_counter() - t0)
+        print(f"hybride {algorithme:4s}, {taille:8d} octets : {debit:10.0f} octets/s, "
+              f"1 opération RSA par sens, enveloppe {lit_en_tete(enveloppe)['algorithme']} "
+              f"de {len(enveloppe)} octets")
+
+    # Une modification est détectée
+    falsifiee = bytearray(scelle(message, publique))
+    falsifiee[-40] ^= 1
+    try:
+        ouvre(bytes(falsifiee), privee)
+    except ValueError as erreur:
+        print("enveloppe modifiée :", erreur)
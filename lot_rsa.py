@@ -0,0 +1,205 @@
+# lot_rsa.py
+# RSA par lots de Fiat : un même module n, k exposants publics
+# petits et premiers entre eux deux à deux (un par expéditeur).
+# Les k chiffrés ci = mi^ei mod n se déchiffrent avec une seule
+# exponentiation complète (par les restes chinois), plus un travail
+# d'arbre avec des exposants courts :
+#   montée    : v = vG^EG ⋅ vD^ED aux nœuds, donc à la racine
+#               v = (m1⋅m2⋅...⋅mk)^E avec E = e1⋅e2⋅...⋅ek
+#   racine    : r = v^(1/E), l'exponentiation complète
+#   descente  : r se sépare en rG = vG^(1/EG) et rD = vD^(1/ED)
+#               avec X ≡ 0 (mod EG), X ≡ 1 (mod ED) :
+#               r^X = vG^(X/EG) ⋅ vD^((X-1)/ED) ⋅ rD, puis rG = r / rD
+# Les divisions d'un niveau de l'arbre partagent une seule inversion.
+import arithmetique_modulaire
+from cle_rsa import ClePriveeRSA, ClePubliqueRSA
+
+
+def trouve_exposants(lambda_n, k, debut=3):
+    """
+    trouve_exposants(lambda_n, k, debut=3)
+    Comme trouve_e de RSA.py, mais k exposants : les plus petits
+    entiers e ≥ debut premiers avec λ(n) et premiers entre eux deux à deux.
+
+    Paramètres:
+    lambda_n (int) : λ(n)
+    k (int) : nombre d'exposants
+    debut (int) : plus petit exposant essayé
+
+    Return:
+    (list) : les k exposants, croissants
+    """
+    exposants = []
+    produit = 1
+    e = debut
+    while len(exposants) < k:
+        if arithmetique_modulaire.pgcd(e, lambda_n) == 1 and arithmetique_modulaire.pgcd(e, produit) == 1:
+            exposants.append(e)
+            produit *= e
+        e += 1
+    return exposants
+
+
+def _lambda(privee):
+    if not privee.premiers:
+        raise ValueError("le déchiffrement par lots demande les facteurs premiers de n")
+    lambda_n = 1
+    for r in privee.premiers:
+        lambda_n = arithmetique_modulaire.ppcm(lambda_n, r - 1)
+    return lambda_n
+
+
+class LotFiat:
+    """
+    Classe LotFiat
+    Déchiffrement par lots de Fiat pour une clé privée et une liste
+    d'exposants publics. L'arbre des produits d'exposants et ses
+    coefficients ne dépendent que des exposants : ils sont calculés
+    une fois, à la création.
+    """
+
+    def __init__(self, privee, exposants):
+        """
+        init (self, privee, exposants)
+        Prépare l'arbre des exposants.
+
+        Paramètres:
+        self : notre objet lot
+        privee (ClePriveeRSA) : la clé privée, avec ses premiers
+        exposants (list) : les exposants publics, premiers avec λ(n)
+        et premiers entre eux deux à deux (voir trouve_exposants)
+
+        Return
+        Notre objet LotFiat
+        """
+        lambda_n = _lambda(privee)
+        produit = 1
+        for e in exposants:
+            if arithmetique_modulaire.pgcd(e, lambda_n) != 1 or arithmetique_modulaire.pgcd(e, produit) != 1:
+                raise ValueError(f"l'exposant {e} n'est pas premier avec λ(n) ou avec les précédents")
+            produit *= e
+
+        self.n = privee.n
+        self.exposants = list(exposants)
+        self.publiques = [ClePubliqueRSA(e, self.n) for e in exposants]
+
+        # niveaux[j] : exposants des nœuds du niveau j (0 : les feuilles).
+        # noeuds[j] : pour chaque paire du niveau j, (EG, ED, X, X/EG, (X-1)/ED).
+        # Un nœud sans partenaire (nombre impair) monte tel quel.
+        self.niveaux = [self.exposants]
+        self.noeuds = []
+        while len(self.niveaux[-1]) > 1:
+            niveau = self.niveaux[-1]
+            paires = []
+            for gauche, droite in zip(niveau[0::2], niveau[1::2]):
+                x = gauche * arithmetique_modulaire.inverse_modulaire(gauche, droite)
+                paires.append((gauche, droite, x, x // gauche, (x - 1) // droite))
+            self.noeuds.append(paires)
+            self.niveaux.append([g * d for g, d, *_ in paires] + niveau[2 * len(paires):])
+
+        # Racine : d = E^-1 mod λ(n), par les restes chinois
+        self._racine = ClePriveeRSA(arithmetique_modulaire.inverse_modulaire(produit, lambda_n),
+                                    self.n, *privee.premiers)
+        # Clés individuelles (di = ei^-1 mod λ(n)), si le lot échoue
+        self._individuelles = [ClePriveeRSA(arithmetique_modulaire.inverse_modulaire(e, lambda_n),
+                                            self.n, *privee.premiers) for e in exposants]
+
+    def __len__(self):
+        return len(self.exposants)
+
+    def dechiffre(self, chiffres):
+        """
+        dechiffre(self, chiffres)
+        Déchiffre le lot : chiffres[i] est chiffré avec exposants[i].
+
+        Paramètres:
+        self : notre objet lot
+        chiffres (list) : un chiffré par exposant
+
+        Return:
+        (list) : les messages en clair, dans le même ordre
+        """
+        if len(chiffres) != len(self.exposants):
+            raise ValueError(f"il faut {len(self.exposants)} chiffrés, un par exposant")
+        n = self.n
+
+        # Montée : valeurs[j] sont les v des nœuds du niveau j
+        valeurs = [list(chiffres)]
+        for paires in self.noeuds:
+            niveau = valeurs[-1]
+            valeurs.append([pow(vg, droite, n) * pow(vd, gauche, n) % n
+                            for (gauche, droite, *_), vg, vd in zip(paires, niveau[0::2], niveau[1::2])]
+                           + niveau[2 * len(paires):])
+
+        racines = [self._racine.dechiffre(valeurs[-1][0])]
+
+        # Descente : les racines du niveau j + 1 donnent celles du niveau j
+        for paires, niveau in zip(reversed(self.noeuds), reversed(valeurs[:-1])):
+            puissances = []
+            diviseurs = []
+            for (_, _, x, a, b), r, vg, vd in zip(paires, racines, niveau[0::2], niveau[1::2]):
+                puissances.append(pow(r, x, n))
+                diviseurs.append(pow(vg, a, n) * pow(vd, b, n) % n)
+            try:
+                inverses = arithmetique_modulaire.inversion_par_lot(diviseurs + puissances, n)
+            except ValueError:
+                # Un chiffré non inversible modulo n (0, ou multiple d'un
+                # facteur) : on déchiffre un par un
+                return [cle.dechiffre(c) for cle, c in zip(self._individuelles, chiffres)]
+            suivantes = []
+            for i, r in enumerate(racines[:len(paires)]):
+                # rD = r^X / diviseur, rG = r / rD = r ⋅ diviseur / r^X
+                suivantes.append(r * diviseurs[i] % n * inverses[len(paires) + i] % n)
+                suivantes.append(puissances[i] * inverses[i] % n)
+            racines = suivantes + racines[len(paires):]
+        return racines
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_lots(bits, tailles, lots=8):
+    """
+    benchmark_lots(bits, tailles, lots=8)
+    Coût par chiffré du déchiffrement par lots selon la taille du lot,
+    comparé à un déchiffrement CRT par chiffré.
+
+    Paramètres:
+    bits (int) : taille du module
+    tailles (list) : tailles de lot essayées
+    lots (int) : nombre de lots mesurés par taille
+
+    Return:
+    Aucun
+    """
+    import random
+    import time
+
+    from cle_rsa import genere_cle
+
+    _, privee = genere_cle(bits)
+    lambda_n = _lambda(privee)
+    for k in tailles:
+        lot = LotFiat(privee, trouve_exposants(lambda_n, k))
+        messages = [[random.randrange(2, privee.n) for _ in range(k)] for _ in range(lots)]
+        chiffres = [[cle.chiffre(m) for cle, m in zip(lot.publiques, groupe)] for groupe in messages]
+
+        t0 = time.perf_counter()
+        for groupe in chiffres:
+            lot.dechiffre(groupe)
+        fiat = (time.perf_counter() - t0) / (k * lots)
+
+        t0 = time.perf_counter()
+        for groupe in chiffres:
+            [cle.dechiffre(c) for cle, c in zip(lot._individuelles, groupe)]
+        un_par_un = (time.perf_counter() - t0) / (k * lots)
+
+        assert [lot.dechiffre(groupe) for groupe in chiffres] == messages
+        print(f"{bits:5d} bits, lot de {k:3d} (e ≤ {lot.exposants[-1]:3d}) : {1000 * fiat:7.3f} ms par chiffré, "
+              f"un par un {1000 * un_par_un:7.3f} ms, gain {un_par_un / fiat:5.2f}")
+
+
+if __name__ == "__main__":
+    for taille in (1024, 2048):
+        benchmark_lots(taille, (1, 2, 4, 8, 16, 32, 64))
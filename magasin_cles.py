@@ -0,0 +1,321 @@
+# magasin_cles.py
+# Magasin binaire de clés RSA, ouvert par mmap. Rien n'est lu à
+# l'ouverture sauf l'en-tête : une clé est lue à la demande, par son
+# numéro (table d'offsets) ou par l'empreinte de son module (table
+# triée, recherche dichotomique). L'ouverture ne dépend donc pas du
+# nombre de clés.
+#
+# Format (petit-boutiste) :
+#   en-tête    : "CLES", version (u32), nombre de clés (u64),
+#                offset de l'index (u64), offset des empreintes (u64)
+#   clés       : largeur L en mots de 64 bits (u16), nombre de premiers k (u8),
+#                drapeaux (u8, bit 0 : clé privée présente), puis n, e
+#                et, pour une clé privée, d et les k premiers, chacun sur
+#                L mots de 64 bits
+#   index      : offset de chaque clé (u64), dans l'ordre des numéros
+#   empreintes : (empreinte de n sur 16 octets, numéro u64), triées
+import hashlib
+import mmap
+import struct
+
+from cle_rsa import ClePriveeRSA, ClePubliqueRSA
+
+
+MAGIQUE = b"CLES"
+VERSION = 1
+EN_TETE = struct.Struct("<4sIQQQ")
+ENTREE_CLE = struct.Struct("<HBB")
+ENTREE_INDEX = struct.Struct("<Q")
+ENTREE_EMPREINTE = struct.Struct("<16sQ")
+PRIVEE = 1
+
+
+def empreinte(n):
+    """
+    empreinte(n)
+    Empreinte d'un module : les 16 premiers octets du SHA-256
+    de son écriture grand-boutiste.
+
+    Paramètres:
+    n (int) : le module
+
+    Return:
+    (bytes) : l'empreinte
+    """
+    return hashlib.sha256(n.to_bytes((n.bit_length() + 7) // 8, "big")).digest()[:16]
+
+
+class EcrivainMagasin:
+    """
+    Classe EcrivainMagasin
+    Écrit un magasin clé par clé. Seuls les offsets et les
+    empreintes restent en mémoire (24 octets par clé); l'index et la
+    table triée sont écrits à la fermeture.
+    """
+
+    def __init__(self, chemin):
+        """
+        init (self, chemin)
+        Crée le fichier du magasin.
+
+        Paramètres:
+        self : notre écrivain
+        chemin (str) : le fichier
+
+        Return
+        Notre objet EcrivainMagasin
+        """
+        self.fichier = open(chemin, "wb")
+        self.fichier.write(bytes(EN_TETE.size))
+        self.offsets = []
+        self.empreintes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.ferme()
+
+    def ajoute(self, publique, privee=None):
+        """
+        ajoute(self, publique, privee=None)
+        Ajoute une clé publique, avec sa clé privée si on la donne.
+
+        Paramètres:
+        self : notre écrivain
+        publique (ClePubliqueRSA) : la clé publique
+        privee (ClePriveeRSA) : la clé privée de même module (optionnelle)
+
+        Return:
+        (int) : le numéro de la clé dans le magasin
+        """
+        entiers = [publique.n, publique.e]
+        drapeaux = 0
+        if privee is not None:
+            if privee.n != publique.n:
+                raise ValueError("les deux clés n'ont pas le même module")
+            entiers += [privee.d, *privee.premiers]
+            drapeaux |= PRIVEE
+        largeur = (max(x.bit_length() for x in entiers) + 63) // 64
+
+        numero = len(self.offsets)
+        self.offsets.append(self.fichier.tell())
+        self.empreintes.append((empreinte(publique.n), numero))
+        self.fichier.write(ENTREE_CLE.pack(largeur, len(privee.premiers) if privee else 0, drapeaux))
+        for x in entiers:
+            self.fichier.write(x.to_bytes(8 * largeur, "little"))
+        return numero
+
+    def ferme(self):
+        """
+        ferme(self)
+        Écrit l'index, la table des empreintes et l'en-tête.
+
+        Paramètres:
+        self : notre écrivain
+
+        Return:
+        Aucun
+        """
+        if self.fichier.closed:
+            return
+        debut_index = self.fichier.tell()
+        self.fichier.write(b"".join(ENTREE_INDEX.pack(offset) for offset in self.offsets))
+        debut_empreintes = self.fichier.tell()
+        self.empreintes.sort()
+        self.fichier.write(b"".join(ENTREE_EMPREINTE.pack(*entree) for entree in self.empreintes))
+        self.fichier.seek(0)
+        self.fichier.write(EN_TETE.pack(MAGIQUE, VERSION, len(self.offsets), debut_index, debut_empreintes))
+        self.fichier.close()
+
+
+def ecrit_magasin(chemin, cles):
+    """
+    ecrit_magasin(chemin, cles)
+    Écrit un magasin à partir de clés publiques ou de paires
+    (publique, privee).
+
+    Paramètres:
+    chemin (str) : le fichier
+    cles (itérable) : des ClePubliqueRSA ou des tuples (ClePubliqueRSA, ClePriveeRSA)
+
+    Return:
+    (int) : le nombre de clés écrites
+    """
+    with EcrivainMagasin(chemin) as ecrivain:
+        for cle in cles:
+            if isinstance(cle, tuple):
+                ecrivain.ajoute(*cle)
+            else:
+                ecrivain.ajoute(cle)
+        return len(ecrivain.offsets)
+
+
+class MagasinCles:
+    """
+    Classe MagasinCles
+    Lecture d'un magasin par mmap. Seul l'en-tête est lu à
+    l'ouverture; chaque accès lit un offset puis la clé.
+    """
+
+    def __init__(self, chemin):
+        """
+        init (self, chemin)
+        Ouvre le magasin et vérifie l'en-tête.
+
+        Paramètres:
+        self : notre magasin
+        chemin (str) : le fichier
+
+        Return
+        Notre objet MagasinCles
+        """
+        with open(chemin, "rb") as fichier:
+            self._mmap = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, version, self.nombre, self._index, self._empreintes = EN_TETE.unpack_from(self._mmap, 0)
+        if magique != MAGIQUE or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{chemin} n'est pas un magasin de clés (version {VERSION})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.ferme()
+
+    def __len__(self):
+        return self.nombre
+
+    def ferme(self):
+        self._mmap.close()
+
+    def _entiers(self, numero):
+        """
+        _entiers(self, numero)
+        Lit les entiers de la clé numero.
+
+        Return:
+        (tuple) : (n, e, d, premiers), d None pour une clé publique seule
+        """
+        if not 0 <= numero < self.nombre:
+            raise IndexError(f"pas de clé numéro {numero}")
+        offset, = ENTREE_INDEX.unpack_from(self._mmap, self._index + ENTREE_INDEX.size * numero)
+        largeur, nb_premiers, drapeaux = ENTREE_CLE.unpack_from(self._mmap, offset)
+        taille = 8 * largeur
+        nombre = 2 + (1 + nb_premiers if drapeaux & PRIVEE else 0)
+        debut = offset + ENTREE_CLE.size
+        entiers = [int.from_bytes(self._mmap[debut + i * taille:debut + (i + 1) * taille], "little")
+                   for i in range(nombre)]
+        if not drapeaux & PRIVEE:
+            return entiers[0], entiers[1], None, ()
+        return entiers[0], entiers[1], entiers[2], tuple(entiers[3:])
+
+    def publique(self, numero):
+        """
+        publique(self, numero)
+        Clé publique numero.
+
+        Paramètres:
+        self : notre magasin
+        numero (int) : le numéro de la clé
+
+        Return:
+        (ClePubliqueRSA)
+        """
+        n, e, _, _ = self._entiers(numero)
+        return ClePubliqueRSA(e, n)
+
+    def paire(self, numero):
+        """
+        paire(self, numero)
+        Clé publique et clé privée numero.
+
+        Paramètres:
+        self : notre magasin
+        numero (int) : le numéro de la clé
+
+        Return:
+        (tuple) : (ClePubliqueRSA, ClePriveeRSA), la clé privée
+        valant None si le magasin n'a que la clé publique
+        """
+        n, e, d, premiers = self._entiers(numero)
+        return ClePubliqueRSA(e, n), None if d is None else ClePriveeRSA(d, n, *premiers)
+
+    def cherche(self, cle):
+        """
+        cherche(self, cle)
+        Numéro de la clé d'un module donné, par dichotomie dans la
+        table triée des empreintes.
+
+        Paramètres:
+        self : notre magasin
+        cle (int ou bytes) : le module, ou son empreinte
+
+        Return:
+        (int) : le numéro de la clé
+        None : si le module n'est pas dans le magasin
+        """
+        cible = empreinte(cle) if isinstance(cle, int) else bytes(cle)
+        bas, haut = 0, self.nombre
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            valeur, numero = ENTREE_EMPREINTE.unpack_from(self._mmap, self._empreintes + ENTREE_EMPREINTE.size * milieu)
+            if valeur < cible:
+                bas = milieu + 1
+            elif valeur > cible:
+                haut = milieu
+            else:
+                return numero
+        return None
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+    import time
+
+    from cle_rsa import genere_cle
+
+    # Quelques vraies paires, puis des clés publiques aléatoires de
+    # même taille pour grossir le magasin.
+    vraies = [genere_cle(bits, k) for bits, k in ((512, 2), (1024, 2), (1024, 3), (2048, 4))]
+    with tempfile.TemporaryDirectory() as repertoire:
+        for nombre in (10 ** 3, 10 ** 5, 10 ** 6):
+            chemin = os.path.join(repertoire, f"cles_{nombre}.bin")
+            t0 = time.perf_counter()
+            with EcrivainMagasin(chemin) as ecrivain:
+                for publique, privee in vraies:
+                    ecrivain.ajoute(publique, privee)
+                for _ in range(nombre - len(vraies)):
+                    ecrivain.ajoute(ClePubliqueRSA(65537, random.getrandbits(1024) | 1 << 1023))
+            duree_ecriture = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            magasin = MagasinCles(chemin)
+            duree_ouverture = time.perf_counter() - t0
+
+            for numero, (publique, privee) in enumerate(vraies):
+                relue, relue_privee = magasin.paire(numero)
+                assert (relue.e, relue.n) == (publique.e, publique.n)
+                assert (relue_privee.d, relue_privee.premiers) == (privee.d, privee.premiers)
+                assert magasin.cherche(publique.n) == numero
+                assert relue_privee.dechiffre(relue.chiffre(42)) == 42
+
+            numeros = [random.randrange(nombre) for _ in range(10 ** 4)]
+            t0 = time.perf_counter()
+            modules = [magasin.publique(i).n for i in numeros]
+            duree_numero = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            assert [magasin.cherche(n) for n in modules] == numeros
+            duree_empreinte = time.perf_counter() - t0
+            magasin.ferme()
+
+            print(f"{nombre:8d} clés ({os.path.getsize(chemin) / 2 ** 20:7.1f} Mo) : "
+                  f"écriture {duree_ecriture:6.2f} s, ouverture {1e6 * duree_ouverture:6.1f} µs, "
+                  f"par numéro {1e6 * duree_numero / len(numeros):5.1f} µs, "
+                  f"par empreinte {1e6 * duree_empreinte / len(numeros):5.1f} µs")
@@ -0,0 +1,479 @@
+# primalite.py
+# Tests de primalité partagés par RSA.py et la distribution de clés (exo8).
+# On combine un criblage par petits premiers, Miller-Rabin avec des bases
+# déterministes sous 2^64 et le test BPSW au-delà.
+import math
+import random
+
+
+# ========================================
+# TABLE DES PETITS PREMIERS
+# ========================================
+
+def crible_eratosthene(limite):
+    """
+    crible_eratosthene(limite)
+    Calcule tous les nombres premiers strictement inférieurs à limite.
+
+    Paramètres:
+    limite (int) : borne supérieure (exclue)
+
+    Return:
+    (list) : les nombres premiers, en ordre croissant
+    """
+    if limite < 3:
+        return []
+    # Un octet par entier : 1 si l'entier est encore candidat
+    crible = bytearray([1]) * limite
+    crible[0] = crible[1] = 0
+    for i in range(2, math.isqrt(limite - 1) + 1):
+        if crible[i]:
+            # On raye tous les multiples de i à partir de i²
+            crible[i * i::i] = bytes(len(range(i * i, limite, i)))
+    return [i for i in range(limite) if crible[i]]
+
+
+# Les petits premiers servent à éliminer rapidement la grande
+# majorité des candidats avant le test coûteux.
+PETITS_PREMIERS = crible_eratosthene(1000)
+
+# Bases de Miller-Rabin suffisantes pour tout n < 3,317 × 10^24
+# (donc en particulier pour tout n < 2^64).
+BASES_DETERMINISTES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+# ========================================
+# MILLER-RABIN
+# ========================================
+
+def miller_rabin(n, a):
+    """
+    miller_rabin(n, a)
+    Test de Miller-Rabin (pseudo-premier fort) de n en base a.
+
+    Paramètres:
+    n (int) : entier impair > 2 à tester
+    a (int) : la base du test
+
+    Return:
+    (bool) : False si a prouve que n est composé, True sinon
+    """
+    # On écrit n - 1 = d * 2^s avec d impair
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+# ========================================
+# LUCAS FORT (POUR BPSW)
+# ========================================
+
+def _jacobi(a, n):
+    """
+    _jacobi(a, n)
+    Calcule le symbole de Jacobi (a/n) pour n impair positif.
+
+    Paramètres:
+    a (int)
+    n (int) : entier impair positif
+
+    Return:
+    (int) : -1, 0 ou 1
+    """
+    a %= n
+    resultat = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                resultat = -resultat
+        # Loi de réciprocité quadratique
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            resultat = -resultat
+        a %= n
+    return resultat if n == 1 else 0
+
+
+def lucas_fort(n):
+    """
+    lucas_fort(n)
+    Test de Lucas fort avec les paramètres de Selfridge
+    (méthode A) : D est le premier de 5, -7, 9, -11, ...
+    tel que (D/n) = -1, P = 1 et Q = (1 - D) / 4.
+
+    Paramètres:
+    n (int) : entier impair > 2, qui n'est pas un carré parfait
+
+    Return:
+    (bool) : False si n est composé, True s'il est probablement premier
+    """
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P = 1
+    Q = (1 - D) // 4
+
+    # n + 1 = d * 2^s avec d impair
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    # Calcul de U_d, V_d et Q^d par la méthode binaire (bit de poids fort d'abord)
+    U, V, Qk = 1, P, Q % n
+    inverse_2 = (n + 1) // 2
+    for bit in bin(d)[3:]:
+        # Doublement : U_2k = U_k V_k, V_2k = V_k² - 2 Q^k
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            # Incrément : U_k+1 = (P U_k + V_k) / 2, V_k+1 = (D U_k + P V_k) / 2
+            U, V = (P * U + V) * inverse_2 % n, (D * U + P * V) * inverse_2 % n
+            Qk = Qk * Q % n
+
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+# ========================================
+# TEST DE PRIMALITÉ
+# ========================================
+
+def est_premier(n):
+    """
+    est_premier(n)
+    Vérifie si n est un nombre premier.
+    Les petits premiers éliminent la plupart des candidats, puis
+    Miller-Rabin déterministe (n < 2^64) ou BPSW (n ≥ 2^64) conclut.
+    Aucun contre-exemple à BPSW n'est connu.
+
+    Paramètres:
+    n (int) : le nombre à vérifier
+
+    Return:
+    (bool) : True si premier, False sinon
+    """
+    verdict = _division_petits(n)
+    return _test_fort(n) if verdict is None else verdict
+
+
+def _division_petits(n):
+    """
+    _division_petits(n)
+    Partie bon marché de est_premier : division par les petits premiers.
+
+    Paramètres:
+    n (int) : le nombre à vérifier
+
+    Return:
+    (bool) : True si premier, False si composé
+    None : si seul le test fort peut conclure
+    """
+    if n < 2:
+        return False
+    for p in PETITS_PREMIERS:
+        if n % p == 0:
+            return n == p
+    # Aucun facteur sous 1000 : tout n < 10^6 est donc premier
+    if n < PETITS_PREMIERS[-1] ** 2:
+        return True
+    return None
+
+
+def _test_fort(n):
+    """
+    _test_fort(n)
+    Partie coûteuse du test de primalité, sans criblage préalable.
+
+    Paramètres:
+    n (int) : entier impair, n > 2
+
+    Return:
+    (bool) : True si premier, False sinon
+    """
+    if n < 2 ** 64:
+        # Une base multiple de n ne prouve rien (petits n seulement)
+        return all(miller_rabin(n, a) for a in BASES_DETERMINISTES if a % n)
+
+    # BPSW : Miller-Rabin en base 2 puis Lucas fort
+    if not miller_rabin(n, 2):
+        return False
+    # Le test de Lucas exige que n ne soit pas un carré parfait
+    if math.isqrt(n) ** 2 == n:
+        return False
+    return lucas_fort(n)
+
+
+# ========================================
+# RECHERCHE DE PREMIERS PAR CRIBLE SEGMENTÉ
+# ========================================
+
+# Premiers impairs utilisés pour cribler les fenêtres de candidats,
+# regroupés par paquets dont le produit tient sur quelques mots machine :
+# un seul reste sur un grand entier sert ensuite à tout le paquet.
+# La table est calculée au premier appel, puis remplacée (jamais
+# modifiée en place) si une borne plus grande est demandée ensuite :
+# (borne couverte, liste des paquets).
+_TABLE_CRIBLE = (0, [])
+
+# Nombre maximal d'entiers impairs examinés par fenêtre
+TAILLE_FENETRE = 4096
+
+# Plus grand premier utilisé pour cribler
+BORNE_CRIBLE = 2 ** 20
+
+
+def table_crible(borne=BORNE_CRIBLE):
+    """
+    table_crible(borne=BORNE_CRIBLE)
+    Retourne la table (en cache) des premiers impairs utilisés
+    pour cribler les fenêtres de candidats, par paquets.
+
+    Paramètres:
+    borne (int) : la table couvre au moins les premiers inférieurs à borne
+
+    Return:
+    (list) : des paires (produit, premiers) couvrant les
+    premiers impairs inférieurs à borne (ou plus)
+    """
+    global _TABLE_CRIBLE
+    borne = min(borne, BORNE_CRIBLE)
+    if _TABLE_CRIBLE[0] < borne:
+        table = []
+        paquet = []
+        produit = 1
+        for p in crible_eratosthene(borne)[1:]:
+            paquet.append(p)
+            produit *= p
+            if produit.bit_length() > 256:
+                table.append((produit, paquet))
+                paquet = []
+                produit = 1
+        if paquet:
+            table.append((produit, paquet))
+        _TABLE_CRIBLE = (borne, table)
+    return _TABLE_CRIBLE[1]
+
+
+def premiers_fenetre(debut, longueur=TAILLE_FENETRE, borne=BORNE_CRIBLE, compteur=None):
+    """
+    premiers_fenetre(debut, longueur=TAILLE_FENETRE, borne=BORNE_CRIBLE, compteur=None)
+    Générateur des nombres premiers parmi les longueur entiers
+    impairs à partir de debut, en ordre croissant.
+    Toute la fenêtre est criblée en une passe par la table des
+    petits premiers; seuls les survivants passent le test coûteux.
+
+    Paramètres:
+    debut (int) : début de la fenêtre (arrondi à l'impair supérieur)
+    longueur (int) : nombre d'entiers impairs dans la fenêtre
+    borne (int) : on crible seulement par les premiers inférieurs à borne
+    compteur (dict) : optionnel, "candidats" (impairs parcourus jusqu'au
+    dernier premier rendu) et "tests" (tests forts) y sont ajoutés
+
+    Return:
+    (generator) : les premiers de la fenêtre
+    """
+    if debut <= 2 < (debut | 1) + 2 * longueur:
+        yield 2
+    debut |= 1
+
+    # L'octet i représente l'entier debut + 2i
+    candidats = bytearray([1]) * longueur
+    zeros = memoryview(bytes(longueur))
+    fin = debut + 2 * longueur
+    plus_grand = 1
+    for produit, paquet in table_crible(borne):
+        if paquet[0] >= borne or paquet[0] ** 2 >= fin:
+            break
+        reste = debut % produit
+        for p in paquet:
+            if p >= borne or p * p >= fin:
+                break
+            plus_grand = p
+            # Premier multiple impair de p dans la fenêtre, sans
+            # rayer p lui-même s'il fait partie de la fenêtre.
+            multiple = max(p * p, debut + (-reste) % p)
+            if multiple % 2 == 0:
+                multiple += p
+            i = (multiple - debut) // 2
+            if i < longueur:
+                candidats[i::p] = zeros[:(longueur - 1 - i) // p + 1]
+
+    # Un survivant plus petit que le carré du prochain
+    # premier non utilisé est forcément premier.
+    premier_sur = (plus_grand + 2) ** 2
+    vus = 0
+    i = candidats.find(1)
+    while i >= 0:
+        n = debut + 2 * i
+        if n >= 2:
+            if n < premier_sur:
+                premier = True
+            else:
+                premier = _test_fort(n)
+                if compteur is not None:
+                    compteur["tests"] += 1
+            if premier:
+                if compteur is not None:
+                    compteur["candidats"] += i + 1 - vus
+                    vus = i + 1
+                yield n
+        i = candidats.find(1, i + 1)
+    if compteur is not None:
+        compteur["candidats"] += longueur - vus
+
+
+def parametres_recherche(bits):
+    """
+    parametres_recherche(bits)
+    Taille de fenêtre et borne du crible pour des candidats de bits bits.
+    Un premier p du crible coûte un reste et une affectation de tranche
+    (~1 µs) et évite environ 1/p des tests forts restants : il n'est
+    rentable que tant que p reste sous (tests forts par premier) × (coût
+    d'un test) / 1 µs. Le coût d'un test croît comme bits^2,5 environ,
+    d'où une borne en bits³ : ~4000 à 256 bits, 2^18 à 1024 bits
+    (optimums mesurés). La fenêtre couvre environ deux écarts moyens
+    entre premiers (ln(2^bits) / 2 impairs) : rarement épuisée, jamais
+    criblée pour rien très loin.
+
+    Paramètres:
+    bits (int) : taille des candidats
+
+    Return:
+    (tuple) : (longueur de fenêtre en impairs, borne du crible)
+    """
+    longueur = min(TAILLE_FENETRE, 64 + bits * 7 // 10)
+    borne = min(BORNE_CRIBLE, max(1000, bits ** 3 >> 12))
+    return longueur, borne
+
+
+def premier_aleatoire(a, b, compteur=None):
+    """
+    premier_aleatoire(a, b, compteur=None)
+    Trouve un nombre premier dans [a, b[.
+    On tire un point de départ aléatoire puis on parcourt
+    les fenêtres criblées vers le haut jusqu'au premier
+    nombre premier; arrivé à b, on reprend une fois depuis a.
+
+    Paramètres:
+    a (int) : borne inférieure (incluse)
+    b (int) : borne supérieure (exclue)
+    compteur (dict) : optionnel, voir premiers_fenetre
+
+    Return:
+    (int) : un nombre premier
+
+    Exception:
+    ValueError : si [a, b[ ne contient aucun nombre premier
+    """
+    if a >= b:
+        raise ValueError(f"intervalle vide : [{a}, {b}[")
+    taille, borne = parametres_recherche(b.bit_length())
+    depart = random.randrange(a, b)
+    for debut, fin in ((depart, b), (a, depart)):
+        while debut < fin:
+            longueur = min(taille, (fin - debut + 1) // 2)
+            for p in premiers_fenetre(debut, longueur, borne, compteur):
+                if a <= p < fin:
+                    return p
+            debut = (debut | 1) + 2 * longueur
+    raise ValueError(f"aucun nombre premier dans [{a}, {b}[")
+
+
+def trouve_premier(size):
+    """
+    trouve_premier(size)
+    Trouve un nombre premier aléatoire d'au plus size bits.
+
+    Paramètres:
+    size (int) : nombre de bits pour le nombre premier
+
+    Return:
+    (int) : un nombre premier
+    """
+    return premier_aleatoire(2, 2 ** size)
+
+
+# ========================================
+# BANC D'ESSAI
+# ========================================
+
+def benchmark_recherche(size, nombre):
+    """
+    benchmark_recherche(size, nombre)
+    Compare le nombre de candidats testés par premier généré
+    entre l'ancienne boucle (un tirage getrandbits par candidat,
+    chacun passé à est_premier) et la recherche par fenêtre
+    criblée. On compte aussi les tests forts (Miller-Rabin/BPSW)
+    réellement exécutés.
+
+    Paramètres:
+    size (int) : taille des premiers en bits
+    nombre (int) : nombre de premiers à générer par méthode
+
+    Return:
+    Aucun
+    """
+    import time
+
+    # Ancienne boucle : chaque candidat impair passe par est_premier
+    # (division par les premiers < 1000, puis test fort)
+    candidats = tests = 0
+    t0 = time.perf_counter()
+    for _ in range(nombre):
+        while True:
+            candidats += 1
+            n = random.getrandbits(size) | 1
+            verdict = _division_petits(n)
+            if verdict is None:
+                tests += 1
+                verdict = _test_fort(n)
+            if verdict:
+                break
+    duree = time.perf_counter() - t0
+    print(f"Boucle getrandbits : {candidats / nombre:7.1f} candidats/premier, "
+          f"{tests / nombre:6.1f} tests forts/premier, "
+          f"{1000 * duree / nombre:8.2f} ms/premier")
+
+    # Fenêtre criblée : seuls les survivants du crible sont testés
+    compteur = {"candidats": 0, "tests": 0}
+    t0 = time.perf_counter()
+    for _ in range(nombre):
+        premier_aleatoire(2, 2 ** size, compteur)
+    duree = time.perf_counter() - t0
+    print(f"Fenêtre criblée    : {compteur['candidats'] / nombre:7.1f} candidats/premier, "
+          f"{compteur['tests'] / nombre:6.1f} tests forts/premier, "
+          f"{1000 * duree / nombre:8.2f} ms/premier")
+
+
+if __name__ == "__main__":
+    for taille, nombre in ((256, 400), (512, 150), (1024, 40)):
+        borne = parametres_recherche(taille)[1]
+        print(f"=== Premiers de {taille} bits (crible jusqu'à {borne}) ===")
+        benchmark_recherche(taille, nombre)
+        # Les survivants d'un crible jusqu'à B sont en proportion ~ 1 / ln B :
+        # par rapport à la division jusqu'à 1000, le gain sur les tests forts
+        # est borné par ln B / ln 1000, bien loin d'un facteur 5 à 10.
+        print(f"Gain attendu sur les tests forts : {math.log(borne) / math.log(1000):.2f}")
+        print()
@@ -0,0 +1,456 @@
+# service_rsa.py
+# Service réseau des opérations à clé privée (déchiffrement, signature).
+# Serveur asyncio sur TCP local, protocole en trames, calculs dans un
+# pool de processus. Les requêtes pour la même clé sont regroupées en
+# un seul appel au pool, et le serveur cesse de lire les sockets quand
+# trop de requêtes sont en cours (contre-pression par TCP).
+#
+# Trame : longueur (u32 grand-boutiste) puis contenu.
+#   requête : opération (u8), identifiant (u32), numéro de clé (u32), entier
+#   réponse : statut (u8), identifiant (u32), entier ou message d'erreur
+import asyncio
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import magasin_cles
+
+
+DECHIFFRE = 1
+SIGNE = 2
+OPERATIONS = (DECHIFFRE, SIGNE)
+
+SUCCES = 0
+ERREUR = 1
+
+LONGUEUR = struct.Struct(">I")
+REQUETE = struct.Struct(">BII")
+REPONSE = struct.Struct(">BI")
+
+
+async def lit_trame(lecteur):
+    """
+    lit_trame(lecteur)
+    Lit une trame complète.
+
+    Paramètres:
+    lecteur (asyncio.StreamReader)
+
+    Return:
+    (bytes) : le contenu de la trame
+    None : si la connexion est fermée ou coupée
+    """
+    try:
+        entete = await lecteur.readexactly(LONGUEUR.size)
+        return await lecteur.readexactly(LONGUEUR.unpack(entete)[0])
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+
+
+def trame(contenu):
+    return LONGUEUR.pack(len(contenu)) + contenu
+
+
+def _entier(octets):
+    return int.from_bytes(octets, "big")
+
+
+def _octets(x):
+    return x.to_bytes((x.bit_length() + 7) // 8 or 1, "big")
+
+
+# ========================================
+# PROCESSUS DE TRAVAIL
+# ========================================
+
+# Clés privées déjà lues par le processus (numéro -> ClePriveeRSA) : les
+# exposants et coefficients CRT restent en cache d'un lot à l'autre.
+_MAGASIN = None
+_CLES = {}
+
+
+def _initialise(chemin):
+    global _MAGASIN
+    _MAGASIN = magasin_cles.MagasinCles(chemin)
+
+
+def _traite_lot(numero, valeurs):
+    """
+    _traite_lot(numero, valeurs)
+    Applique la clé privée numero à toutes les valeurs du lot.
+    Le déchiffrement et la signature sont le même calcul (x^d mod n).
+
+    Paramètres:
+    numero (int) : numéro de la clé dans le magasin
+    valeurs (list) : les entiers à traiter
+
+    Return:
+    (list) : les résultats, dans le même ordre
+    """
+    cle = _CLES.get(numero)
+    if cle is None:
+        _, cle = _MAGASIN.paire(numero)
+        if cle is None:
+            raise ValueError(f"le magasin n'a pas la clé privée numéro {numero}")
+        _CLES[numero] = cle
+    return [cle.dechiffre(x) for x in valeurs]
+
+
+# ========================================
+# SERVEUR
+# ========================================
+
+class ServiceRSA:
+    """
+    Classe ServiceRSA
+    Serveur des opérations privées sur les clés d'un magasin
+    (voir magasin_cles). Les requêtes attendent dans une liste par
+    clé; dès qu'un processus du pool est libre, la clé qui attend
+    depuis le plus longtemps lui est envoyée avec au plus taille_lot
+    requêtes en un seul appel. Les lots grossissent donc d'eux-mêmes
+    quand le pool est occupé, sans délai ajouté quand il ne l'est pas.
+    Au plus file_max requêtes sont en cours; au-delà le serveur ne lit
+    plus les sockets et TCP ralentit les clients (contre-pression).
+    """
+
+    def __init__(self, chemin_magasin, travailleurs=None, taille_lot=64, file_max=1024):
+        """
+        init (self, chemin_magasin, travailleurs=None, taille_lot=64, file_max=1024)
+        Prépare le service; demarre() ouvre le port.
+
+        Paramètres:
+        self : notre service
+        chemin_magasin (str) : le magasin des clés
+        travailleurs (int) : processus du pool (os.cpu_count() par défaut)
+        taille_lot (int) : taille maximale d'un lot (1 : pas de regroupement)
+        file_max (int) : nombre maximal de requêtes en cours
+
+        Return
+        Notre objet ServiceRSA
+        """
+        self.chemin = chemin_magasin
+        with magasin_cles.MagasinCles(chemin_magasin) as magasin:
+            self.modules = [magasin.publique(i).n for i in range(len(magasin))]
+        self.travailleurs = travailleurs or os.cpu_count() or 1
+        self.taille_lot = taille_lot
+        self.file_max = file_max
+        self.lots = 0
+        self.requetes = 0
+        self.pressions = 0
+        # numéro de clé -> liste de (valeur, futur), dans l'ordre d'arrivée des clés
+        self._attente = {}
+        self._occupes = 0
+        self._connexions = {}
+        self._places = None
+        self._pool = None
+        self._serveur = None
+
+    async def demarre(self, hote="127.0.0.1", port=0):
+        """
+        demarre(self, hote="127.0.0.1", port=0)
+        Lance le pool et le serveur TCP.
+
+        Paramètres:
+        self : notre service
+        hote (str) : adresse d'écoute
+        port (int) : port (0 : choisi par le système)
+
+        Return:
+        (int) : le port d'écoute
+        """
+        self._places = asyncio.Semaphore(self.file_max)
+        self._pool = ProcessPoolExecutor(self.travailleurs, initializer=_initialise, initargs=(self.chemin,))
+        self._serveur = await asyncio.start_server(self._client, hote, port)
+        return self._serveur.sockets[0].getsockname()[1]
+
+    async def ferme(self):
+        """
+        ferme(self)
+        Arrête d'accepter des connexions, ferme celles qui restent
+        (les requêtes en cours reçoivent leur réponse) puis le pool.
+        Chaque connexion cesse de lire le socket; les trames déjà reçues
+        sont traitées, puis la connexion attend ses réponses et se ferme.
+        """
+        self._serveur.close()
+        for lecteur, ecrivain in self._connexions.values():
+            ecrivain.transport.pause_reading()
+            lecteur.feed_eof()
+        # Les listes d'attente se vident lot après lot (_distribue relance _lance)
+        self._lance()
+        await asyncio.gather(*self._connexions, return_exceptions=True)
+        await self._serveur.wait_closed()
+        self._pool.shutdown()
+
+    async def _client(self, lecteur, ecrivain):
+        """
+        _client(self, lecteur, ecrivain)
+        Boucle d'une connexion : les requêtes sont lues à la suite
+        (plusieurs peuvent être en cours), les réponses partent dès
+        qu'elles sont prêtes, avec l'identifiant de la requête.
+        """
+        self._connexions[asyncio.current_task()] = (lecteur, ecrivain)
+        taches = set()
+        try:
+            while True:
+                if self._places.locked():
+                    self.pressions += 1
+                await self._places.acquire()
+                contenu = await lit_trame(lecteur)
+                if contenu is None:
+                    self._places.release()
+                    break
+                tache = asyncio.create_task(self._repond(contenu, ecrivain))
+                taches.add(tache)
+                tache.add_done_callback(taches.discard)
+            if taches:
+                await asyncio.gather(*taches)
+        finally:
+            del self._connexions[asyncio.current_task()]
+            ecrivain.close()
+
+    async def _repond(self, contenu, ecrivain):
+        """
+        _repond(self, contenu, ecrivain)
+        Traite une requête et écrit la réponse.
+        """
+        identifiant = 0
+        try:
+            operation, identifiant, numero = REQUETE.unpack_from(contenu)
+            valeur = _entier(contenu[REQUETE.size:])
+            if operation not in OPERATIONS:
+                raise ValueError(f"opération inconnue : {operation}")
+            if not 0 <= numero < len(self.modules):
+                raise ValueError(f"pas de clé numéro {numero}")
+            if valeur >= self.modules[numero]:
+                raise ValueError("valeur supérieure au module")
+            reponse = REPONSE.pack(SUCCES, identifiant) + _octets(await self._soumet(numero, valeur))
+        except Exception as erreur:
+            reponse = REPONSE.pack(ERREUR, identifiant) + str(erreur).encode()
+        finally:
+            self._places.release()
+        ecrivain.write(trame(reponse))
+        try:
+            await ecrivain.drain()
+        except ConnectionError:
+            # Le client est parti sans attendre sa réponse
+            pass
+
+    def _soumet(self, numero, valeur):
+        """
+        _soumet(self, numero, valeur)
+        Ajoute la valeur à la liste d'attente de la clé.
+
+        Return:
+        (asyncio.Future) : le résultat
+        """
+        futur = asyncio.get_running_loop().create_future()
+        self._attente.setdefault(numero, []).append((valeur, futur))
+        self._lance()
+        return futur
+
+    def _lance(self):
+        """
+        _lance(self)
+        Occupe les processus libres du pool : chacun reçoit les
+        requêtes d'une seule clé, la plus ancienne en attente.
+        """
+        while self._occupes < self.travailleurs and self._attente:
+            numero = next(iter(self._attente))
+            attente = self._attente.pop(numero)
+            lot, reste = attente[:self.taille_lot], attente[self.taille_lot:]
+            if reste:
+                # La clé repasse en fin de file
+                self._attente[numero] = reste
+            self._occupes += 1
+            self.lots += 1
+            self.requetes += len(lot)
+            calcul = asyncio.get_running_loop().run_in_executor(
+                self._pool, _traite_lot, numero, [valeur for valeur, _ in lot])
+            calcul.add_done_callback(lambda calcul, lot=lot: self._distribue(calcul, lot))
+
+    def _distribue(self, calcul, lot):
+        """
+        _distribue(self, calcul, lot)
+        Rend les résultats d'un lot à leurs requêtes et relance le pool.
+        """
+        self._occupes -= 1
+        # Un futur déjà terminé : sa requête a été annulée entre-temps
+        if calcul.cancelled():
+            for _, futur in lot:
+                if not futur.done():
+                    futur.set_exception(RuntimeError("calcul annulé (arrêt du pool)"))
+        elif calcul.exception() is not None:
+            for _, futur in lot:
+                if not futur.done():
+                    futur.set_exception(calcul.exception())
+        else:
+            for (_, futur), resultat in zip(lot, calcul.result()):
+                if not futur.done():
+                    futur.set_result(resultat)
+        self._lance()
+
+
+# ========================================
+# CLIENT
+# ========================================
+
+class ClientRSA:
+    """
+    Classe ClientRSA
+    Client du service : plusieurs requêtes peuvent être en cours sur
+    la même connexion, les réponses sont rendues par identifiant.
+    """
+
+    async def connecte(self, hote, port):
+        """
+        connecte(self, hote, port)
+        Ouvre la connexion et lance la lecture des réponses.
+
+        Return:
+        Notre objet ClientRSA
+        """
+        self._lecteur, self._ecrivain = await asyncio.open_connection(hote, port)
+        self._attente = {}
+        self._suivant = 0
+        self._lecture = asyncio.create_task(self._lit())
+        return self
+
+    async def _lit(self):
+        try:
+            while True:
+                contenu = await lit_trame(self._lecteur)
+                if contenu is None:
+                    return
+                statut, identifiant = REPONSE.unpack_from(contenu)
+                futur = self._attente.pop(identifiant, None)
+                if futur is None or futur.done():
+                    # Identifiant inconnu, réponse en double ou requête annulée
+                    continue
+                if statut == SUCCES:
+                    futur.set_result(_entier(contenu[REPONSE.size:]))
+                else:
+                    futur.set_exception(ValueError(contenu[REPONSE.size:].decode()))
+        finally:
+            # Fin de flux, erreur ou annulation : plus aucune réponse ne viendra
+            for futur in self._attente.values():
+                if not futur.done():
+                    futur.set_exception(ConnectionError("connexion fermée"))
+            self._attente.clear()
+
+    async def requete(self, operation, numero, valeur):
+        """
+        requete(self, operation, numero, valeur)
+        Envoie une requête et attend sa réponse.
+
+        Paramètres:
+        self : notre client
+        operation (int) : DECHIFFRE ou SIGNE
+        numero (int) : numéro de la clé
+        valeur (int) : le chiffré ou le hachage
+
+        Return:
+        (int) : le résultat
+
+        Exception:
+        ValueError : erreur renvoyée par le serveur
+        """
+        if self._lecture.done():
+            raise ConnectionError("connexion fermée")
+        self._suivant += 1
+        identifiant = self._suivant
+        futur = self._attente[identifiant] = asyncio.get_running_loop().create_future()
+        self._ecrivain.write(trame(REQUETE.pack(operation, identifiant, numero) + _octets(valeur)))
+        await self._ecrivain.drain()
+        return await futur
+
+    async def dechiffre(self, numero, c):
+        return await self.requete(DECHIFFRE, numero, c)
+
+    async def signe(self, numero, h):
+        return await self.requete(SIGNE, numero, h)
+
+    async def ferme(self):
+        self._ecrivain.close()
+        await self._ecrivain.wait_closed()
+        self._lecture.cancel()
+
+
+# ========================================
+# GÉNÉRATEUR DE CHARGE
+# ========================================
+
+async def charge(hote, port, publiques, connexions=8, requetes=400, simultanees=16):
+    """
+    charge(hote, port, publiques, connexions=8, requetes=400, simultanees=16)
+    Générateur de charge : connexions clients envoient chacun requetes
+    déchiffrements ou signatures sur des clés au hasard, avec au plus
+    simultanees requêtes en cours par connexion. Chaque résultat est
+    vérifié avec la clé publique.
+
+    Paramètres:
+    hote (str), port (int) : le service
+    publiques (list) : les clés publiques du magasin, par numéro
+    connexions (int) : nombre de clients
+    requetes (int) : requêtes par client
+    simultanees (int) : requêtes en cours par client
+
+    Return:
+    (dict) : p50 et p99 (ms), débit (opérations/s)
+    """
+    import random
+    import time
+
+    latences = []
+
+    async def une_requete(client, limite):
+        async with limite:
+            numero = random.randrange(len(publiques))
+            cle = publiques[numero]
+            m = random.randrange(cle.n)
+            t0 = time.perf_counter()
+            if random.random() < 0.5:
+                assert await client.dechiffre(numero, cle.chiffre(m)) == m
+            else:
+                assert cle.verifie(await client.signe(numero, m)) == m
+            latences.append(time.perf_counter() - t0)
+
+    async def un_client():
+        client = await ClientRSA().connecte(hote, port)
+        limite = asyncio.Semaphore(simultanees)
+        await asyncio.gather(*(une_requete(client, limite) for _ in range(requetes)))
+        await client.ferme()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(un_client() for _ in range(connexions)))
+    duree = time.perf_counter() - t0
+    latences.sort()
+    return {
+        "p50": 1000 * latences[len(latences) // 2],
+        "p99": 1000 * latences[int(0.99 * (len(latences) - 1))],
+        "debit": len(latences) / duree,
+    }
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    from cle_rsa import genere_cle
+
+    async def essai(chemin, publiques, bits, taille_lot):
+        service = ServiceRSA(chemin, taille_lot=taille_lot, file_max=256)
+        port = await service.demarre()
+        # 8 × 64 requêtes en cours pour 256 places : le serveur ralentit les clients
+        resultats = await charge("127.0.0.1", port, publiques, simultanees=64)
+        await service.ferme()
+        print(f"clés de {bits} bits, lots de {taille_lot:2d} au plus : p50 {resultats['p50']:7.2f} ms, "
+              f"p99 {resultats['p99']:7.2f} ms, {resultats['debit']:7.0f} op/s, "
+              f"{service.requetes / service.lots:5.1f} requêtes par appel au pool, "
+              f"contre-pression {service.pressions} fois")
+
+    for bits in (512, 1024):
+        paires = [genere_cle(bits) for _ in range(4)]
+        with tempfile.TemporaryDirectory() as repertoire:
+            chemin = os.path.join(repertoire, "cles.bin")
+            magasin_cles.ecrit_magasin(chemin, paires)
+            for taille_lot in (1, 64):
+                asyncio.run(essai(chemin, [publique for publique, _ in paires], bits, taille_lot))
@@ -0,0 +1,87 @@
+# Tests du noyau d'arithmétique modulaire.
+import math
+import random
+import unittest
+
+import arithmetique_modulaire
+
+
+class TestEuclide(unittest.TestCase):
+
+    def test_bezout(self):
+        for _ in range(200):
+            a, b = random.randrange(-10 ** 30, 10 ** 30), random.randrange(-10 ** 30, 10 ** 30)
+            g, x, y = arithmetique_modulaire.euclide_etendu(a, b)
+            self.assertEqual(g, math.gcd(a, b))
+            self.assertEqual(a * x + b * y, g)
+
+    def test_pgcd_ppcm(self):
+        for _ in range(200):
+            a, b = random.randrange(1, 10 ** 12), random.randrange(1, 10 ** 12)
+            self.assertEqual(arithmetique_modulaire.pgcd(a, b), math.gcd(a, b))
+            self.assertEqual(arithmetique_modulaire.ppcm(a, b), a * b // math.gcd(a, b))
+        self.assertEqual(arithmetique_modulaire.ppcm(0, 5), 0)
+
+
+class TestInverse(unittest.TestCase):
+
+    def test_egale_pow(self):
+        n = 2 ** 127 - 1
+        for _ in range(100):
+            a = random.randrange(1, n)
+            self.assertEqual(arithmetique_modulaire.inverse_modulaire(a, n), pow(a, -1, n))
+        # a négatif ou plus grand que n
+        self.assertEqual(arithmetique_modulaire.inverse_modulaire(-3, 7), pow(-3, -1, 7))
+        self.assertEqual(arithmetique_modulaire.inverse_modulaire(10, 7), pow(10, -1, 7))
+
+    def test_non_inversible(self):
+        with self.assertRaises(ValueError):
+            arithmetique_modulaire.inverse_modulaire(6, 9)
+
+
+class TestRestesChinois(unittest.TestCase):
+
+    def test_solution_unique(self):
+        modules = [3, 5, 7, 11, 13, 2 ** 61 - 1]
+        produit = math.prod(modules)
+        for _ in range(100):
+            x = random.randrange(produit)
+            self.assertEqual(arithmetique_modulaire.restes_chinois([x % m for m in modules], modules), x)
+
+
+class TestInversionParLot(unittest.TestCase):
+
+    def test_egale_inversions_separees(self):
+        n = 2 ** 89 - 1
+        valeurs = [random.randrange(1, n) for _ in range(50)]
+        self.assertEqual(arithmetique_modulaire.inversion_par_lot(valeurs, n),
+                         [pow(v, -1, n) for v in valeurs])
+        self.assertEqual(arithmetique_modulaire.inversion_par_lot([], n), [])
+
+    def test_valeur_non_inversible(self):
+        with self.assertRaises(ValueError):
+            arithmetique_modulaire.inversion_par_lot([2, 3, 5], 15)
+
+
+class TestRacineEntiere(unittest.TestCase):
+
+    def test_encadrement(self):
+        for _ in range(200):
+            x = random.getrandbits(random.randrange(1, 3000))
+            k = random.randrange(1, 40)
+            r = arithmetique_modulaire.racine_entiere(x, k)
+            self.assertTrue(r ** k <= x < (r + 1) ** k, (x, k))
+
+    def test_puissances_exactes(self):
+        for k in (2, 3, 17, 65):
+            m = random.getrandbits(300) | 1
+            self.assertEqual(arithmetique_modulaire.racine_entiere(m ** k, k), m)
+            self.assertEqual(arithmetique_modulaire.racine_entiere(m ** k - 1, k), m - 1)
+
+    def test_negatif(self):
+        with self.assertRaises(ValueError):
+            arithmetique_modulaire.racine_entiere(-8, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
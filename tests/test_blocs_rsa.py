@@ -0,0 +1,67 @@
+# Tests de l'encodage des messages RSA par blocs d'octets.
+import random
+import unittest
+
+import blocs_rsa
+from cle_rsa import genere_cle
+
+
+class TestEncodage(unittest.TestCase):
+
+    def test_aller_retour_sans_rsa(self):
+        n = (1 << 127) - 1
+        k = blocs_rsa.taille_bloc(n)
+        for longueur in (0, 1, k - 1, k, k + 1, 5 * k, 5 * k + 3):
+            message = random.randbytes(longueur)
+            blocs = list(blocs_rsa.encode(message, n))
+            self.assertTrue(all(0 <= b < n for b in blocs))
+            self.assertEqual(len(blocs), longueur // k + 1)
+            self.assertEqual(b"".join(blocs_rsa.decode(blocs, n)), message)
+
+    def test_morceaux(self):
+        # Le découpage en morceaux ne change pas les blocs
+        n = (1 << 255) - 19
+        message = random.randbytes(1000)
+        morceaux = [message[i:i + 37] for i in range(0, len(message), 37)]
+        self.assertEqual(list(blocs_rsa.encode(morceaux, n)), list(blocs_rsa.encode(message, n)))
+
+    def test_zeros_de_fin(self):
+        n = (1 << 127) - 1
+        message = b"abc" + bytes(40)
+        self.assertEqual(b"".join(blocs_rsa.decode(blocs_rsa.encode(message, n), n)), message)
+
+    def test_bourrage_invalide(self):
+        n = (1 << 127) - 1
+        with self.assertRaises(ValueError):
+            list(blocs_rsa.decode([1234], n))
+        with self.assertRaises(ValueError):
+            list(blocs_rsa.decode([], n))
+
+    def test_module_trop_petit(self):
+        with self.assertRaises(ValueError):
+            blocs_rsa.taille_bloc(255)
+
+
+class TestChiffrement(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.publique, cls.privee = genere_cle(512)
+
+    def test_aller_retour(self):
+        for longueur in (0, 1, 63, 64, 1000):
+            message = random.randbytes(longueur)
+            chiffres = blocs_rsa.chiffre(message, self.publique)
+            self.assertEqual(blocs_rsa.dechiffre(chiffres, self.privee), message)
+
+    def test_compare(self):
+        resultats = blocs_rsa.compare(b"Alice est plus forte que Bob. " * 4, self.publique, self.privee)
+        self.assertLess(resultats["blocs"][1], resultats["caractere"][1])
+
+    def test_compare_message_vide(self):
+        with self.assertRaises(ValueError):
+            blocs_rsa.compare(b"", self.publique, self.privee)
+
+
+if __name__ == "__main__":
+    unittest.main()
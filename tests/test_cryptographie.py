@@ -0,0 +1,40 @@
+# Tests du paquet cryptographie : il doit s'importer sans que la racine
+# du dépôt soit dans sys.path (paquet installé ou lié ailleurs).
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROGRAMME = """
+import sys
+sys.path[:] = [p for p in sys.path if p and os.path.realpath(p) != RACINE]
+import cryptographie
+from cryptographie import KeyStream, encryptDecrypt, des, CBC, genere_cle, Attaque, facteurs
+import cryptographie.cesar
+import cryptographie.diffie_hellman
+publique, privee = genere_cle(128)
+assert privee.dechiffre(publique.chiffre(42)) == 42
+assert facteurs(1000003 * 1000033) == (1000003, 1000033)
+assert encryptDecrypt(KeyStream(5), encryptDecrypt(KeyStream(5), b"abc")) == b"abc"
+import StreamCipher
+assert StreamCipher.KeyStream is KeyStream
+"""
+
+
+class TestPaquetHorsRacine(unittest.TestCase):
+
+    def test_import_sans_la_racine(self):
+        with tempfile.TemporaryDirectory() as repertoire:
+            os.symlink(os.path.join(RACINE, "cryptographie"), os.path.join(repertoire, "cryptographie"))
+            environnement = dict(os.environ, PYTHONPATH=repertoire)
+            programme = f"import os\nRACINE = {os.path.realpath(RACINE)!r}\n" + PROGRAMME
+            resultat = subprocess.run([sys.executable, "-c", programme], cwd=repertoire, env=environnement,
+                                      capture_output=True, text=True)
+            self.assertEqual(resultat.returncode, 0, resultat.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
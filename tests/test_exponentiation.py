@@ -0,0 +1,46 @@
+# Tests de l'exponentiation de Montgomery, l'alternative à pow mesurée
+# par le banc d'essai, et des clés RSA qui passent par pow.
+import random
+import unittest
+
+import cle_rsa
+import exponentiation
+
+
+class TestModexp(unittest.TestCase):
+
+    def test_egale_pow(self):
+        for bits in (8, 64, 512, 1024):
+            n = random.getrandbits(bits) | (1 << (bits - 1)) | 1
+            for exposant in (0, 1, 2, 65537, random.getrandbits(bits)):
+                base = random.randrange(n)
+                self.assertEqual(exponentiation.modexp(base, exposant, n), pow(base, exposant, n))
+
+    def test_contexte_garde_sur_la_cle(self):
+        publique, _ = cle_rsa.genere_cle(256)
+        self.assertEqual(exponentiation.modexp(12345, publique.e, publique), publique.chiffre(12345))
+        contexte = publique._montgomery
+        self.assertIsNotNone(contexte)
+        exponentiation.modexp(678, publique.e, publique)
+        self.assertIs(publique._montgomery, contexte)
+
+    def test_module_pair(self):
+        self.assertEqual(exponentiation.modexp(3, 10, 1000), pow(3, 10, 1000))
+
+
+class TestCleRSA(unittest.TestCase):
+
+    def test_aller_retour_crt(self):
+        for k in (2, 3):
+            publique, privee = cle_rsa.genere_cle(512, k)
+            directe = cle_rsa.ClePriveeRSA(privee.d, privee.n)
+            for _ in range(5):
+                m = random.randrange(publique.n)
+                c = publique.chiffre(m)
+                self.assertEqual(privee.dechiffre(c), m)
+                self.assertEqual(directe.dechiffre(c), m)
+                self.assertEqual(publique.verifie(privee.signe(m)), m)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+# Tests de la fabrique de clés RSA.
+import time
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+import fabrique_cles
+
+
+def _attend(condition, delai=20):
+    fin = time.monotonic() + delai
+    while not condition():
+        if time.monotonic() > fin:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _echec(erreur):
+    tache = Future()
+    tache.set_exception(erreur)
+    return tache
+
+
+class TestFabrique(unittest.TestCase):
+
+    BITS = 128
+
+    def setUp(self):
+        self.fabrique = fabrique_cles.FabriqueCles((self.BITS,), capacite=2, travailleurs=1)
+        self.addCleanup(self.fabrique.ferme)
+        self.assertTrue(_attend(lambda: self.fabrique.statistiques()["pretes"][self.BITS] == 2))
+
+    def _simule_echec(self, erreur):
+        # Une génération en cours échoue alors que le stock est entamé
+        with self.fabrique._verrou:
+            self.fabrique.files[self.BITS].popleft()
+            self.fabrique.en_cours[self.BITS] += 1
+        self.fabrique._recoit(self.BITS, _echec(erreur))
+
+    def test_cle(self):
+        publique, privee = self.fabrique.cle(self.BITS)
+        self.assertEqual(privee.dechiffre(publique.chiffre(42)), 42)
+        with self.assertRaises(ValueError):
+            self.fabrique.cle(256)
+
+    def test_echec_relance_le_remplissage(self):
+        with mock.patch.object(fabrique_cles, "PAUSE_ERREUR", 0.01):
+            self._simule_echec(ValueError("génération ratée"))
+            # Aucun appel à cle() : le fil de remplissage doit reprendre seul
+            self.assertTrue(_attend(lambda: self.fabrique.statistiques()["pretes"][self.BITS] == 2))
+        statistiques = self.fabrique.statistiques()
+        self.assertEqual(statistiques["erreurs"][self.BITS], 1)
+        self.assertIn("génération ratée", statistiques["derniere_erreur"])
+
+    def test_pool_hors_service(self):
+        self._simule_echec(BrokenProcessPool("pool arrêté"))
+        self.assertFalse(self.fabrique._a_remplir.is_set())
+        self.assertEqual(self.fabrique.statistiques()["erreurs"][self.BITS], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
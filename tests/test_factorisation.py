@@ -0,0 +1,27 @@
+# Tests du portefeuille de factorisation.
+import unittest
+
+import factorisation
+
+
+class TestPuissanceParfaite(unittest.TestCase):
+
+    def test_plus_petite_racine(self):
+        p = 2 ** 61 - 1
+        for k in (2, 3, 4, 6, 12, 35):
+            self.assertEqual(factorisation.puissance_parfaite(p ** k), p, k)
+        self.assertEqual(factorisation.puissance_parfaite(2 ** 64), 2)
+        self.assertEqual(factorisation.puissance_parfaite(6 ** 10), 6)
+        self.assertEqual(factorisation.puissance_parfaite((3 * 5) ** 7), 15)
+
+    def test_pas_une_puissance(self):
+        for n in (2, 3, 6, 12, 2 ** 61 - 1, (2 ** 61 - 1) ** 2 * 3, 2 ** 64 + 1):
+            self.assertIs(factorisation.puissance_parfaite(n), False, n)
+
+    def test_facteurs_d_une_puissance(self):
+        p = 1000000007
+        self.assertEqual(factorisation.facteurs(p ** 3), (p, p ** 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+# Tests du chiffrement hybride RSA-KEM.
+import unittest
+
+import hybride_rsa
+import StreamCipher
+from cle_rsa import genere_cle
+
+
+class TestEnveloppe(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.publique, cls.privee = genere_cle(512)
+
+    def test_des_par_defaut(self):
+        enveloppe = hybride_rsa.scelle(b"Alice est plus forte que Bob.", self.publique)
+        self.assertEqual(hybride_rsa.lit_en_tete(enveloppe)["algorithme"], "des")
+        self.assertEqual(hybride_rsa.ouvre(enveloppe, self.privee), b"Alice est plus forte que Bob.")
+
+    def test_aller_retour(self):
+        for algorithme in ("des", "flux"):
+            for contenu in (b"", b"x", bytes(range(256)) * 5):
+                enveloppe = hybride_rsa.scelle(contenu, self.publique, algorithme)
+                self.assertEqual(hybride_rsa.ouvre(enveloppe, self.privee), contenu, algorithme)
+
+    def test_modification_detectee(self):
+        falsifiee = bytearray(hybride_rsa.scelle(b"Alice est plus forte que Bob.", self.publique))
+        falsifiee[-40] ^= 1
+        with self.assertRaises(ValueError):
+            hybride_rsa.ouvre(bytes(falsifiee), self.privee)
+
+    def test_flux_retrouve_par_texte_connu(self):
+        # Mode d'enseignement : 31 bits de graine, l'en-tête connu suffit
+        contenu = b"MESSAGE: rendez-vous au port a minuit"
+        enveloppe = hybride_rsa.scelle(contenu, self.publique, "flux")
+        debut = hybride_rsa.EN_TETE.size + hybride_rsa.lit_en_tete(enveloppe)["capsule"]
+        chiffre = enveloppe[debut:-hybride_rsa.TAILLE_ETIQUETTE]
+        graine = StreamCipher.recover_seed(b"MESSAGE: ", chiffre)
+        self.assertEqual(StreamCipher.encryptDecrypt(StreamCipher.KeyStream(graine), chiffre), contenu)
+
+
+if __name__ == "__main__":
+    unittest.main()
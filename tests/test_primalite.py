@@ -0,0 +1,75 @@
+# Tests de primalite : test de primalité et recherche par fenêtres criblées.
+import random
+import unittest
+
+import primalite
+
+
+def _premiers_naifs(limite):
+    return [n for n in range(2, limite) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+
+
+class TestEstPremier(unittest.TestCase):
+
+    def test_petits_entiers(self):
+        self.assertEqual([n for n in range(5000) if primalite.est_premier(n)], _premiers_naifs(5000))
+
+    def test_grands_nombres(self):
+        # Premiers de Mersenne, nombres de Carmichael et un carré de premier
+        self.assertTrue(primalite.est_premier(2 ** 127 - 1))
+        self.assertFalse(primalite.est_premier(2 ** 127 + 1))
+        for carmichael in (561, 41041, 825265, 321197185, 5394826801):
+            self.assertFalse(primalite.est_premier(carmichael))
+        self.assertFalse(primalite.est_premier((2 ** 61 - 1) ** 2))
+
+
+class TestPremiersFenetre(unittest.TestCase):
+
+    def test_egale_le_crible_naif(self):
+        reference = _premiers_naifs(12000)
+        for debut in (0, 1, 2, 3, 100, 1001, 5000):
+            for longueur in (1, 7, 100, 3000):
+                for borne in (3, 1000, primalite.BORNE_CRIBLE):
+                    fin = (debut | 1) + 2 * longueur
+                    attendu = [p for p in reference if p < fin and (p == 2 and debut <= 2 or p >= (debut | 1))]
+                    self.assertEqual(list(primalite.premiers_fenetre(debut, longueur, borne)), attendu,
+                                     (debut, longueur, borne))
+
+    def test_compteur(self):
+        compteur = {"candidats": 0, "tests": 0}
+        debut = random.getrandbits(256) | 1
+        premiers = list(primalite.premiers_fenetre(debut, 500, 5000, compteur))
+        self.assertEqual(compteur["candidats"], 500)
+        self.assertGreaterEqual(compteur["tests"], len(premiers))
+        self.assertLess(compteur["tests"], 500)
+
+
+class TestPremierAleatoire(unittest.TestCase):
+
+    def test_dans_l_intervalle(self):
+        for bits in (16, 64, 256):
+            a, b = 1 << (bits - 1), 1 << bits
+            p = primalite.premier_aleatoire(a, b)
+            self.assertTrue(a <= p < b)
+            self.assertTrue(primalite.est_premier(p))
+
+    def test_un_seul_premier(self):
+        # Le départ aléatoire tombe souvent après 89 : il faut repartir de a
+        self.assertEqual({primalite.premier_aleatoire(89, 97) for _ in range(50)}, {89})
+        self.assertEqual({primalite.premier_aleatoire(2, 3) for _ in range(10)}, {2})
+
+    def test_intervalle_sans_premier(self):
+        for a, b in ((24, 29), (90, 97), (114, 127), (1, 2), (10, 10)):
+            with self.assertRaises(ValueError):
+                primalite.premier_aleatoire(a, b)
+
+    def test_compteur(self):
+        compteur = {"candidats": 0, "tests": 0}
+        p = primalite.premier_aleatoire(1 << 511, 1 << 512, compteur)
+        self.assertTrue(primalite.est_premier(p))
+        self.assertGreaterEqual(compteur["tests"], 1)
+        self.assertGreaterEqual(compteur["candidats"], compteur["tests"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Tests du chiffrement par flux : les chemins vectoriels (NumPy) doivent
+# rendre exactement le flux octet par octet de get_key_byte.
+import random
+import unittest
+from unittest import mock
+
+import StreamCipher
+from StreamCipher import KeyStream, encryptDecrypt
+
+
+def _flux_scalaire(graine, n):
+    key = KeyStream(graine)
+    return bytes([key.get_key_byte() for _ in range(n)])
+
+
+class TestFluxVectoriel(unittest.TestCase):
+
+    def test_bytes_egale_get_key_byte(self):
+        tailles = (0, 1, StreamCipher.SEUIL_VECTORIEL - 1, StreamCipher.SEUIL_VECTORIEL,
+                   1000, StreamCipher.BLOC, StreamCipher.BLOC + 1, 2 * StreamCipher.BLOC + 3)
+        for graine in (0, 1, 23, StreamCipher.MASQUE, random.randrange(StreamCipher.MODULE)):
+            for taille in tailles:
+                self.assertEqual(KeyStream(graine).bytes(taille), _flux_scalaire(graine, taille),
+                                 (graine, taille))
+
+    def test_graines_hors_intervalle(self):
+        # Graines négatives ou d'au moins 2^32 : même flux que le chemin scalaire
+        for graine in (-5, -2 ** 40, StreamCipher.MODULE, 2 ** 32, 2 ** 32 + 7, 2 ** 70):
+            for taille in (40, 2 * StreamCipher.BLOC + 3):
+                self.assertEqual(KeyStream(graine).bytes(taille), _flux_scalaire(graine, taille),
+                                 (graine, taille))
+
+    def test_appels_successifs(self):
+        # bytes() et get_key_byte() peuvent s'enchaîner sur le même flux
+        key = KeyStream(42)
+        morceaux = key.bytes(100) + bytes([key.get_key_byte()]) + key.bytes(5000) + key.bytes(3)
+        self.assertEqual(morceaux, _flux_scalaire(42, len(morceaux)))
+
+    def test_encrypt_decrypt(self):
+        for taille in (0, 13, 40, 100000):
+            message = random.randbytes(taille)
+            secret = encryptDecrypt(KeyStream(-5), message)
+            self.assertEqual(secret, bytes(m ^ k for m, k in zip(message, _flux_scalaire(-5, taille))))
+            self.assertEqual(encryptDecrypt(KeyStream(-5), secret), message)
+
+
+class TestAccesDirect(unittest.TestCase):
+
+    def test_seek_egale_rejeu(self):
+        flux = _flux_scalaire(23, 3000)
+        key = KeyStream(23)
+        for position in (0, 1, 31, 1000, 2999, 7):
+            self.assertEqual(key.seek(position), position)
+            self.assertEqual(key.bytes(1), flux[position:position + 1])
+        key.seek(100)
+        self.assertEqual(key.bytes(500), flux[100:600])
+
+    def test_tell(self):
+        key = KeyStream(-7)
+        self.assertEqual(key.tell(), 0)
+        for _ in range(10):
+            key.get_key_byte()
+        self.assertEqual(key.tell(), 10)
+        key.bytes(100)
+        self.assertEqual(key.tell(), 110)
+        key.rand()
+        self.assertEqual(key.tell(), 111)
+        self.assertEqual(key.seek(5, 1), 116)
+        self.assertEqual(key.tell(), 116)
+        self.assertEqual(key.position, 116)
+
+    def test_seek_invalide(self):
+        key = KeyStream(1)
+        with self.assertRaises(ValueError):
+            key.seek(-1)
+        with self.assertRaises(ValueError):
+            key.seek(0, 2)
+
+    def test_distance(self):
+        for _ in range(100):
+            depart, pas = random.randrange(StreamCipher.MODULE), random.randrange(StreamCipher.MODULE)
+            a, c = StreamCipher.saut(pas)
+            self.assertEqual(StreamCipher.distance(depart, (a * depart + c) & StreamCipher.MASQUE), pas)
+
+    def test_decrypt_range(self):
+        message = random.randbytes(200000)
+        secret = encryptDecrypt(KeyStream(99), message)
+        for debut, longueur in ((0, 10), (5, 0), (1000, 4096), (199990, 10), (199990, 50)):
+            self.assertEqual(StreamCipher.decrypt_range(99, secret, debut, longueur),
+                             message[debut:debut + longueur])
+
+
+class TestRecuperationEtat(unittest.TestCase):
+
+    ENTETE = b"MESSAGE: "
+
+    def test_retrouve_la_graine(self):
+        for _ in range(5):
+            graine = random.randrange(StreamCipher.MODULE)
+            secret = encryptDecrypt(KeyStream(graine), self.ENTETE + b"Un message secret vers Bob")
+            self.assertEqual(StreamCipher.recover_seed(self.ENTETE, secret), graine)
+
+    def test_accord_avec_brute_force(self):
+        # Petite graine : brute_force la trouve vite, et rend la plus petite
+        for graine in (0, 1, 4321):
+            secret = encryptDecrypt(KeyStream(graine), self.ENTETE)
+            self.assertEqual(StreamCipher.recover_seed(self.ENTETE, secret),
+                             StreamCipher.brute_force(self.ENTETE, secret))
+
+    def test_meme_contrat_que_brute_force(self):
+        self.assertEqual(StreamCipher.recover_seed(b"", b"abc"), 0)
+        self.assertEqual(StreamCipher.brute_force(b"", b"abc"), 0)
+        with self.assertRaises(IndexError):
+            StreamCipher.recover_seed(self.ENTETE, b"abc")
+        with self.assertRaises(IndexError):
+            StreamCipher.brute_force(self.ENTETE, b"abc")
+
+    def test_aucune_graine(self):
+        # Flux 0, 255, 0, 255... sur 16 octets : aucun état du LCG ne le produit
+        flux = bytes([0, 255] * 8)
+        self.assertIs(StreamCipher.recover_seed(flux, bytes(len(flux))), False)
+
+
+class TestRechercheParLots(unittest.TestCase):
+
+    ENTETE = b"MESSAGE: "
+
+    def test_accord_avec_brute_force(self):
+        for graine in (0, 1, 4321, 70000):
+            secret = encryptDecrypt(KeyStream(graine), self.ENTETE)
+            attendu = StreamCipher.brute_force(self.ENTETE, secret)
+            # Petits blocs : la graine n'est pas dans le premier
+            self.assertEqual(StreamCipher.brute_force_batch(self.ENTETE, secret, bloc=1 << 12), attendu)
+
+    def test_grande_graine(self):
+        graine = random.randrange(StreamCipher.MODULE)
+        secret = encryptDecrypt(KeyStream(graine), self.ENTETE)
+        statistiques = {}
+        self.assertEqual(StreamCipher.brute_force_batch(self.ENTETE, secret, statistiques=statistiques),
+                         StreamCipher.recover_seed(self.ENTETE, secret))
+        self.assertGreater(statistiques["graines"], graine)
+        self.assertGreater(statistiques["debit"], 0)
+
+    def test_meme_contrat_que_brute_force(self):
+        self.assertEqual(StreamCipher.brute_force_batch(b"", b"abc"), 0)
+        with self.assertRaises(IndexError):
+            StreamCipher.brute_force_batch(self.ENTETE, b"abc")
+
+    def test_statistiques_sans_numpy(self):
+        secret = encryptDecrypt(KeyStream(500), self.ENTETE)
+        statistiques = {}
+        with mock.patch.object(StreamCipher, "_np", False):
+            self.assertEqual(StreamCipher.brute_force_batch(self.ENTETE, secret, statistiques=statistiques), 500)
+        self.assertEqual(statistiques["graines"], 501)
+        self.assertIn("duree", statistiques)
+        self.assertGreater(statistiques["debit"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()